@@ -0,0 +1,134 @@
+"""Minimal Telnet server emulating a shell for testing and benchmarking.
+
+Usage: python telnet_server.py [port]
+
+When used as a test library, `Start Server` keyword starts the server in
+a background thread and returns the used port.
+
+The server listens on localhost. It asks the client to turn on server side
+echo and then asks username and password that must both be 'test'. After
+that it emulates a shell using the same prompt as `telnet_variables.py`.
+Supported commands are:
+
+pwd             Prints '/home/test'.
+output <lines>  Prints given number of boot log style lines.
+exit            Closes the connection.
+
+Other commands print an error. If port is not given, a free port is
+selected. The used port is printed when the server is ready.
+"""
+
+import os
+import socket
+import sys
+import threading
+from telnetlib import IAC, WILL, ECHO
+
+
+USERNAME = PASSWORD = 'test'
+PROMPT = '[%s@%s ~]$ ' % (USERNAME, os.uname()[1])
+LOG_LINE = ('[%10.6f] kernel: initializing device %d, status ok, '
+            'waiting for next device\r\n')
+
+
+class Session(object):
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._input = connection.makefile('rb', 0)
+
+    def run(self):
+        try:
+            self._send(IAC + WILL + ECHO)
+            while not self._login():
+                self._send('Login incorrect\r\n')
+            self._send('Last login: today\r\n' + PROMPT)
+            while self._execute(self._read_line()):
+                self._send(PROMPT)
+        except EOFError:
+            pass
+        self._connection.close()
+
+    def _send(self, data):
+        self._connection.sendall(data)
+
+    def _read_line(self, echo=True):
+        line = []
+        while True:
+            char = self._input.read(1)
+            if not char:
+                raise EOFError
+            if char == IAC:
+                self._input.read(2)
+            elif char in '\r\n':
+                if line:
+                    break
+            elif char != '\0':
+                line.append(char)
+                if echo:
+                    self._send(char)
+        self._send('\r\n')
+        return ''.join(line)
+
+    def _login(self):
+        self._send('login: ')
+        username = self._read_line()
+        self._send('Password: ')
+        password = self._read_line(echo=False)
+        return username == USERNAME and password == PASSWORD
+
+    def _execute(self, command):
+        name, _, argument = command.partition(' ')
+        if name == 'exit':
+            return False
+        if name == 'pwd':
+            self._send('/home/%s\r\n' % USERNAME)
+        elif name == 'output':
+            self._output(int(argument))
+        else:
+            self._send('-bash: %s: command not found\r\n' % name)
+        return True
+
+    def _output(self, lines):
+        chunk = []
+        for index in xrange(lines):
+            chunk.append(LOG_LINE % (index / 1000.0, index))
+            if len(chunk) == 1000:
+                self._send(''.join(chunk))
+                chunk = []
+        self._send(''.join(chunk))
+
+
+def start_server():
+    server = _create_server(0)
+    thread = threading.Thread(target=_serve, args=(server,))
+    thread.setDaemon(True)
+    thread.start()
+    return server.getsockname()[1]
+
+
+def serve(port=0):
+    server = _create_server(port)
+    print server.getsockname()[1]
+    sys.stdout.flush()
+    _serve(server)
+
+
+def _create_server(port):
+    server = socket.socket()
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(('localhost', port))
+    server.listen(5)
+    return server
+
+
+def _serve(server):
+    while True:
+        connection = server.accept()[0]
+        thread = threading.Thread(target=Session(connection).run)
+        thread.setDaemon(True)
+        thread.start()
+
+
+if __name__ == '__main__':
+    serve(*[int(arg) for arg in sys.argv[1:]])
@@ -73,6 +73,9 @@ class ListenAll:
     def debug_file(self, path):
         self._out_file('Debug', path)
 
+    def profile_file(self, path):
+        self._out_file('Profile', path)
+
     def _out_file(self, name, path):
         assert os.path.isabs(path)
         self.outfile.write('%s: %s\n' % (name, os.path.basename(path)))
@@ -10,3 +10,8 @@ class FailUntilSucceeds:
         if self.times_to_fail >= 0:
             raise Exception('Still %d times to fail!' % (self.times_to_fail))
         return message
+
+    def fail_without_retrying(self, message='Cannot be retried'):
+        error = Exception(message)
+        error.ROBOT_DONT_RETRY = True
+        raise error
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+"""Micro-benchmarks for variable and keyword lookups.
+
+Usage:  lookups.py [iterations]
+
+Run from a source checkout. Results are best compared by running the script
+against different versions of the framework.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+SETUP = '''
+from robot.utils import NormalizedDict
+from robot.variables import Variables
+variables = Variables()
+for index in range(%(size)d):
+    variables['${variable_%%d}' %% index] = index
+variables['${name}'] = 'value'
+variables['@{list}'] = ['a', 'b']
+handlers = NormalizedDict(ignore=['_'])
+for index in range(%(size)d):
+    handlers['Keyword Number %%d' %% index] = index
+handlers['Log Many'] = None
+'''
+
+BENCHMARKS = [
+    ('Variable, exact name', "variables['${name}']"),
+    ('Variable, other case', "variables['${NAME}']"),
+    ('Variable, missing', "'${nonex}' in variables"),
+    ('Replace scalar', "variables.replace_scalar('${name}')"),
+    ('Replace string', "variables.replace_string('x ${name} @{list}[1]')"),
+    ('Replace list', "variables.replace_list(['${name}', '@{list}', 'x'])"),
+    ('Keyword, exact name', "handlers['Log Many']"),
+    ('Keyword, other case', "handlers['log many']"),
+    ('Copy variables', "variables.copy()"),
+]
+
+
+def run(iterations, size=1000):
+    setup = SETUP % {'size': size}
+    for name, statement in BENCHMARKS:
+        count = iterations if 'copy' not in statement else iterations // 1000
+        elapsed = min(timeit.repeat(statement, setup, repeat=3, number=count))
+        print '%-24s %8.3f us' % (name, elapsed / count * 1e6)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
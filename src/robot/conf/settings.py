@@ -34,7 +34,10 @@ class _BaseSettings(object):
                  'Log'              : ('log', 'log.html'),
                  'Report'           : ('report', 'report.html'),
                  'XUnitFile'        : ('xunitfile', 'NONE'),
+                 'BinaryOutput'     : ('binaryoutput', 'NONE'),
                  'SplitLog'         : ('splitlog', False),
+                 'CompressionLevel' : ('compressionlevel', 9),
+                 'CompressBlocks'   : ('compressblocks', False),
                  'TimestampOutputs' : ('timestampoutputs', False),
                  'LogTitle'         : ('logtitle', None),
                  'ReportTitle'      : ('reporttitle', None),
@@ -52,7 +55,8 @@ class _BaseSettings(object):
                  'MonitorColors'    : ('monitorcolors', 'AUTO'),
                  'StdOut'           : ('stdout', None),
                  'StdErr'           : ('stderr', None)}
-    _output_opts = ['Output', 'Log', 'Report', 'DebugFile', 'XUnitFile']
+    _output_opts = ['Output', 'Log', 'Report', 'DebugFile', 'XUnitFile',
+                    'BinaryOutput', 'Profile']
 
     def __init__(self, options=None, log=True):
         self._opts = {}
@@ -92,10 +96,13 @@ class _BaseSettings(object):
             return 'NONE'
         if name == 'OutputDir':
             return utils.abspath(value)
-        if name in ['SuiteStatLevel', 'MonitorWidth']:
+        if name in ['SuiteStatLevel', 'MonitorWidth', 'Processes',
+                    'ProfileTop']:
             return self._convert_to_positive_integer_or_default(name, value)
         if name in ['Listeners', 'VariableFiles']:
             return [self._split_args_from_name_or_path(item) for item in value]
+        if name == 'CompressionLevel':
+            return self._process_compression_level(value)
         if name == 'ReportBackground':
             return self._process_report_background(value)
         if name == 'TagStatCombine':
@@ -138,7 +145,8 @@ class _BaseSettings(object):
     def _get_output_file(self, type_):
         """Returns path of the requested output file and creates needed dirs.
 
-        `type_` can be 'Output', 'Log', 'Report', 'DebugFile' or 'XUnitFile'.
+        `type_` can be 'Output', 'Log', 'Report', 'DebugFile', 'XUnitFile',
+        'BinaryOutput' or 'Profile'.
         """
         name = self._opts[type_]
         if self._outputfile_disabled(type_, name):
@@ -162,8 +170,10 @@ class _BaseSettings(object):
             return '.xml'
         if type_ in ['Log', 'Report']:
             return '.html'
-        if type_ == 'DebugFile':
+        if type_ in ['DebugFile', 'Profile']:
             return '.txt'
+        if type_ == 'BinaryOutput':
+            return '.rfb'
         raise FrameworkError("Invalid output file type: %s" % type_)
 
     def _create_output_dir(self, path, type_):
@@ -180,6 +190,15 @@ class _BaseSettings(object):
             return value.split(':', 1)
         return value, ''
 
+    def _process_compression_level(self, value):
+        level = self._convert_to_integer('CompressionLevel', value)
+        if not 0 <= level <= 9:
+            LOGGER.error("Option '--compressionlevel' expected value between "
+                         "0 and 9 but got '%s'. Default value used instead."
+                         % value)
+            return self._get_default_value('CompressionLevel')
+        return level
+
     def _process_report_background(self, colors):
         if colors.count(':') not in [1, 2]:
             LOGGER.error("Invalid report background colors '%s'." % colors)
@@ -256,6 +275,10 @@ class _BaseSettings(object):
     def xunit(self):
         return self._get_file('XUnitFile')
 
+    @property
+    def binary_output(self):
+        return self._get_file('BinaryOutput')
+
     def _get_file(self, name):
         value = self[name]
         return value if value != 'NONE' else None
@@ -264,10 +287,30 @@ class _BaseSettings(object):
     def split_log(self):
         return self['SplitLog']
 
+    @property
+    def compression_config(self):
+        return {'compression_level': self['CompressionLevel'],
+                'compress_blocks': self['CompressBlocks']}
+
+    @property
+    def processes(self):
+        return self['Processes']
+
     @property
     def status_rc(self):
         return not self['NoStatusRC']
 
+    @property
+    def statistics_config(self):
+        return {
+            'suite_stat_level': self['SuiteStatLevel'],
+            'tag_stat_include': self['TagStatInclude'],
+            'tag_stat_exclude': self['TagStatExclude'],
+            'tag_stat_combine': self['TagStatCombine'],
+            'tag_stat_link': self['TagStatLink'],
+            'tag_doc': self['TagDoc'],
+        }
+
 
 class RobotSettings(_BaseSettings):
     _extra_cli_opts = {'Output'        : ('output', 'output.xml'),
@@ -278,13 +321,29 @@ class RobotSettings(_BaseSettings):
                        'Variables'     : ('variable', []),
                        'VariableFiles' : ('variablefile', []),
                        'Listeners'     : ('listener', []),
-                       'DebugFile'     : ('debugfile', 'NONE')}
+                       'DebugFile'     : ('debugfile', 'NONE'),
+                       'AsyncOutput'   : ('asyncoutput', False),
+                       'FsyncOutput'   : ('fsyncoutput', False),
+                       'Profile'       : ('profile', 'NONE'),
+                       'ProfileTop'    : ('profiletop', 10),
+                       'Processes'     : ('processes', 1),
+                       'TestLevelSplit': ('testlevelsplit', False)}
+
+    @property
+    def live_xunit(self):
+        """XUnit output written during execution, if any.
+
+        Results of parallel executions are combined before the xUnit output
+        is written and thus it is not written during execution.
+        """
+        return self.xunit if self.processes == 1 else None
 
     def is_rebot_needed(self):
-        return not ('NONE' == self['Log'] == self['Report'] == self['XUnitFile'])
+        xunit = 'NONE' if self.live_xunit else self['XUnitFile']
+        return not ('NONE' == self['Log'] == self['Report'] == xunit)
 
     def get_rebot_datasource_and_settings(self):
-        datasource = self['Output']
+        datasource = self.output or self.binary_output
         settings = RebotSettings(log=False)
         settings._opts.update(self._opts)
         for name in ['Variables', 'VariableFiles', 'Listeners']:
@@ -294,14 +353,19 @@ class RobotSettings(_BaseSettings):
         for name in ['Name', 'Doc']:
             settings._opts[name] = None
         settings._opts['Output'] = 'NONE'
+        settings._opts['BinaryOutput'] = 'NONE'
         settings._opts['LogLevel'] = 'TRACE'
         settings._opts['ProcessEmptySuite'] = self['RunEmptySuite']
+        if self.live_xunit:
+            settings._opts['XUnitFile'] = 'NONE'
         return datasource, settings
 
     def _outputfile_disabled(self, type_, name):
         if name == 'NONE':
             return True
-        return self._opts['Output'] == 'NONE' and type_ != 'DebugFile'
+        if type_ in ['DebugFile', 'BinaryOutput', 'Profile']:
+            return False
+        return self._opts['Output'] == self._opts['BinaryOutput'] == 'NONE'
 
     def _escape(self, value):
         return utils.escape(value)
@@ -311,8 +375,10 @@ class RebotSettings(_BaseSettings):
     _extra_cli_opts = {'Output'            : ('output', 'NONE'),
                        'LogLevel'          : ('loglevel', 'TRACE'),
                        'ProcessEmptySuite' : ('processemptysuite', False),
+                       'Processes'         : ('jobs', 1),
                        'StartTime'         : ('starttime', None),
-                       'EndTime'           : ('endtime', None)}
+                       'EndTime'           : ('endtime', None),
+                       'Combined'          : ('combined', None)}
 
     def _outputfile_disabled(self, type_, name):
         return name == 'NONE'
@@ -341,15 +407,8 @@ class RebotSettings(_BaseSettings):
         }
 
     @property
-    def statistics_config(self):
-        return {
-            'suite_stat_level': self['SuiteStatLevel'],
-            'tag_stat_include': self['TagStatInclude'],
-            'tag_stat_exclude': self['TagStatExclude'],
-            'tag_stat_combine': self['TagStatCombine'],
-            'tag_stat_link': self['TagStatLink'],
-            'tag_doc': self['TagDoc'],
-        }
+    def combined(self):
+        return utils.abspath(self['Combined']) if self['Combined'] else None
 
     @property
     def log_config(self):
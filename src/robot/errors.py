@@ -78,7 +78,7 @@ class ExecutionFailed(RobotError):
     """Used for communicating failures in test execution."""
 
     def __init__(self, message, timeout=False, syntax=False, exit=False,
-                 cont=False, exit_for_loop=False):
+                 cont=False, exit_for_loop=False, dont_retry=False):
         if '\r\n' in message:
             message = message.replace('\r\n', '\n')
         RobotError.__init__(self, utils.cut_long_message(message))
@@ -87,6 +87,7 @@ class ExecutionFailed(RobotError):
         self.exit = exit
         self.cont = cont
         self.exit_for_loop = exit_for_loop
+        self.dont_retry = dont_retry
 
     @property
     def dont_cont(self):
@@ -120,8 +121,9 @@ class HandlerExecutionFailed(ExecutionFailed):
         exit = bool(getattr(details.error, 'ROBOT_EXIT_ON_FAILURE', False))
         cont = bool(getattr(details.error, 'ROBOT_CONTINUE_ON_FAILURE', False))
         exit_for_loop = bool(getattr(details.error, 'ROBOT_EXIT_FOR_LOOP', False))
+        dont_retry = bool(getattr(details.error, 'ROBOT_DONT_RETRY', False))
         ExecutionFailed.__init__(self, details.message, timeout, syntax,
-                                 exit, cont, exit_for_loop)
+                                 exit, cont, exit_for_loop, dont_retry)
         self.full_message = details.message
         self.traceback = details.traceback
 
@@ -145,7 +147,8 @@ class ExecutionFailures(ExecutionFailed):
                 'syntax': any(err.syntax for err in errors),
                 'exit': any(err.exit for err in errors),
                 'cont': all(err.cont for err in errors),
-                'exit_for_loop': all(err.exit_for_loop for err in errors)}
+                'exit_for_loop': all(err.exit_for_loop for err in errors),
+                'dont_retry': any(err.dont_retry for err in errors)}
 
     def get_errors(self):
         return self._errors
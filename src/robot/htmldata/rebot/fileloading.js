@@ -1,11 +1,22 @@
 window.fileLoading = (function () {
 
     var fileLoadingCallbacks = {};
+    var loadedFiles = {};
 
     var timestamp = new Date().getTime();
 
     function loadKeywordsFile(filename, callback) {
-        fileLoadingCallbacks[filename] = callback;
+        // Same file can contain keywords of several tests when log is
+        // split into chunks.
+        if (loadedFiles[filename]) {
+            callback();
+            return;
+        }
+        if (fileLoadingCallbacks[filename]) {
+            fileLoadingCallbacks[filename].push(callback);
+            return;
+        }
+        fileLoadingCallbacks[filename] = [callback];
         var script = document.createElement('script');
         script.type = 'text/javascript';
         // timestamp as an argument to prevent browsers from caching scripts
@@ -34,7 +45,12 @@ window.fileLoading = (function () {
     }
 
     function notifyFileLoaded(filename) {
-        fileLoadingCallbacks[filename]();
+        var callbacks = fileLoadingCallbacks[filename];
+        loadedFiles[filename] = true;
+        delete fileLoadingCallbacks[filename];
+        for (var i = 0; i < callbacks.length; i++) {
+            callbacks[i]();
+        }
     }
 
     return {
@@ -80,11 +80,23 @@ window.testdata = function () {
             parent.populateKeywords(Populator(keywords, strings, childCreator(parent, createKeyword)));
         } else {
             var index = keywordsOrIndex;
-            parent.childFileName = window.settings['splitLogBase'] + '-' + index + '.js';
+            parent.childFileName = splitLogFileName(index);
             parent.populateKeywords(SplitLogPopulator(keywordsOrIndex, childCreator(parent, createKeyword)));
         }
     }
 
+    function splitLogFileName(index) {
+        // Parts written in chunks are in the last chunk starting before them.
+        var chunks = window.settings['splitLogChunks'];
+        var fileIndex = index;
+        if (chunks) {
+            fileIndex = chunks.length;
+            while (fileIndex > 1 && chunks[fileIndex-1] > index)
+                fileIndex--;
+        }
+        return window.settings['splitLogBase'] + '-' + fileIndex + '.js';
+    }
+
     function tags(taglist, strings) {
         return util.map(taglist, strings.get);
     }
@@ -271,6 +283,7 @@ window.testdata = function () {
     }
 
     function getStringStore(strings) {
+        var blocks = {};
 
         function getText(id) {
             var text = strings[id];
@@ -278,11 +291,19 @@ window.testdata = function () {
                 return '';
             if (text[0] == '*')
                 return text.substring(1);
-            var extracted = extract(text);
+            var extracted = text[0] == '#' ? fromBlock(text) : extract(text);
             strings[id] = "*"+extracted;
             return extracted;
         }
 
+        function fromBlock(reference) {
+            var parts = reference.substring(1).split(':');
+            var block = parseInt(parts[0], 10);
+            if (!blocks[block])
+                blocks[block] = extract(strings[block]).split('\u0000');
+            return blocks[block][parseInt(parts[1], 10)];
+        }
+
         function extract(text) {
             var decoded = JXG.Util.Base64.decodeAsArray(text);
             var extracted = (new JXG.Util.Unzip(decoded)).unzip()[0][0];
@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import os
+import random
 import re
 import time
 
@@ -1203,36 +1204,108 @@ class _RunKeyword:
         keyword again after the previous run has failed.
 
         Both `timeout` and `retry_interval` must be given in Robot Framework's
-        time format (e.g. '1 minute', '2 min 3 s', '4.5').
+        time format (e.g. '1 minute', '2 min 3 s', '4.5'). Alternatively
+        `timeout` can be given as the maximum number of attempts in format
+        'N times' or 'Nx' (e.g. '5 times', '5x').
+
+        The retry interval is fixed by default. If it is followed by word
+        'exponential', it is doubled after every failed attempt, but it never
+        grows over 64 times the given interval. If it is followed by word
+        'jitter', every wait is a random time between half of the interval
+        and the full interval, which spreads retries of concurrently running
+        tests. The words can also be combined (e.g. '1 s exponential jitter').
+        Waiting never continues past the timeout, and the keyword is run one
+        more time when the timeout is reached.
 
         Errors caused by invalid syntax, test or keyword timeouts, or fatal
-        exceptions are not caught by this keyword.
+        exceptions are not caught by this keyword. Neither are errors that
+        library keywords report to be non-retryable by raising an exception
+        with a special `ROBOT_DONT_RETRY` attribute set to a true value.
 
-        Example:
-        | Wait Until Keyword Succeeds | 2 min | 5 sec | My keyword | arg1 | arg2 |
+        If the keyword is run more than once, the number of attempts and the
+        total time they took are logged.
 
-        Running the same keyword multiple times inside this keyword can create
-        lots of output and considerably increase the size of the generated
-        output files. Starting from Robot Framework 2.7, it is possible to
-        remove unnecessary keywords from the outputs using
-        `--RemoveKeywords WUKS` command line option.
-        """
-        timeout = utils.timestr_to_secs(timeout)
-        retry_interval = utils.timestr_to_secs(retry_interval)
-        maxtime = time.time() + timeout
-        error = None
-        while not error:
-            try:
-                return self.run_keyword(name, *args)
-            except ExecutionFailed, err:
-                if err.dont_cont:
-                    raise
-                if time.time() > maxtime:
-                    error = unicode(err)
-                else:
-                    time.sleep(retry_interval)
-        raise AssertionError("Timeout %s exceeded. The last error was: %s"
-                             % (utils.secs_to_timestr(timeout), error))
+        Examples:
+        | Wait Until Keyword Succeeds | 2 min | 5 sec | My keyword | arg1 | arg2 |
+        | Wait Until Keyword Succeeds | 10x | 0.5 s exponential | My keyword |
+
+        Running the same keyword multiple times inside this keyword could
+        create lots of output and considerably increase the size of the
+        generated output files. Starting from Robot Framework 2.7.4, failed
+        attempts other than the last one are not written to the output file
+        during execution, unless they contain warnings. The same removal can
+        be done to older outputs using `--RemoveKeywords WUKS` command line
+        option.
+
+        Maximum number of attempts, backoff options, non-retryable errors
+        and removing failed attempts during execution are new in Robot
+        Framework 2.7.4.
+        """
+        timeout, maxattempts = self._parse_retry_timeout(timeout)
+        interval, exponential, jitter = self._parse_retry_interval(retry_interval)
+        starttime = time.time()
+        attempts = 0
+        try:
+            while True:
+                attempts += 1
+                try:
+                    return self.run_keyword(name, *args)
+                except ExecutionFailed, err:
+                    if err.dont_cont or err.dont_retry:
+                        raise
+                    if maxattempts and attempts >= maxattempts:
+                        raise AssertionError("Keyword '%s' failed after %d "
+                                             "attempts. The last error was: %s"
+                                             % (name, attempts, unicode(err)))
+                    if timeout is not None and \
+                            time.time() > starttime + timeout:
+                        raise AssertionError("Timeout %s exceeded. The last "
+                                             "error was: %s"
+                                             % (utils.secs_to_timestr(timeout),
+                                                unicode(err)))
+                wait = self._get_retry_wait(interval, attempts,
+                                            exponential, jitter)
+                if timeout is not None:
+                    wait = min(wait, starttime + timeout - time.time())
+                if wait > 0:
+                    time.sleep(wait)
+        finally:
+            self._log_attempts(attempts, starttime)
+
+    def _parse_retry_timeout(self, timeout):
+        match = re.match(r'^\s*(\d+)\s*(times|x)\s*$', unicode(timeout), re.I)
+        if not match:
+            return utils.timestr_to_secs(timeout), None
+        attempts = int(match.group(1))
+        if not attempts:
+            raise ValueError("Number of attempts must be positive, got '%s'."
+                             % timeout)
+        return None, attempts
+
+    def _parse_retry_interval(self, interval):
+        options = []
+        if isinstance(interval, basestring):
+            tokens = interval.split()
+            while tokens and tokens[-1].lower() in ('exponential', 'jitter'):
+                options.append(tokens.pop().lower())
+            if options:
+                interval = ' '.join(tokens)
+        return (utils.timestr_to_secs(interval),
+                'exponential' in options, 'jitter' in options)
+
+    def _get_retry_wait(self, interval, failures, exponential, jitter):
+        if exponential:
+            interval *= 2 ** min(failures - 1, 6)
+        if jitter:
+            interval = random.uniform(interval / 2.0, interval)
+        return interval
+
+    def _log_attempts(self, attempts, starttime):
+        # Only a summary is logged to keep the output compact also when the
+        # failed attempts themselves are removed from the outputs.
+        if attempts > 1:
+            self.log('Keyword was run %d times in %s.'
+                     % (attempts, utils.secs_to_timestr(time.time()-starttime)))
 
     def set_variable_if(self, condition, *values):
         """Sets variable based on the given condition.
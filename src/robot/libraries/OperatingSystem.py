@@ -13,9 +13,11 @@
 #  limitations under the License.
 
 import os
+import re
 import sys
 import time
 import glob
+import codecs
 import fnmatch
 import shutil
 import subprocess
@@ -28,6 +30,8 @@ try:
                              secs_to_timestamp, parse_time, unic, decode_output,
                              get_env_var, set_env_var, del_env_var, get_env_vars,
                              decode_from_system)
+    from robot.libraries.commandserver import get_command_server
+    from robot.libraries.filewatcher import get_file_watcher
     __version__ = get_version()
     PROCESSES = ConnectionCache('No active processes')
     del ConnectionCache, get_version
@@ -46,6 +50,13 @@ except ImportError:
     secs_to_timestr = lambda secs: '%d second%s' % (secs, plural_or_not(secs))
     unic = unicode
     decode_output = decode_from_system = lambda string: string
+    get_command_server = lambda: None
+    class _PollingWatcher:
+        def watch(self, patterns):
+            return 0.1
+        def wait(self, timeout):
+            time.sleep(timeout)
+    get_file_watcher = _PollingWatcher
     class _NotImplemented:
         def __getattr__(self, name):
             raise NotImplementedError('This usage requires Robot Framework '
@@ -179,6 +190,27 @@ class OperatingSystem:
         """
         return self._run(command)
 
+    def run_processes_in_parallel(self, *commands):
+        """Runs the given commands in parallel and returns their RCs and outputs.
+
+        All commands are started at once, and this keyword waits until all
+        of them have finished. Returns a list containing the return code (RC)
+        and output of each command in the order the commands were given. RCs
+        and outputs are handled similarly as with `Run And Return RC And
+        Output`, but RCs of commands killed by a signal are 255.
+
+        Examples:
+        | ${results} = | Run Processes In Parallel | /opt/setup.sh | ${CURDIR}${/}prepare.py db |
+        | ${rc} | ${output} = | Set Variable | ${results[1]} |
+        | Should Be Equal As Integers | ${rc} | 0 |
+
+        New in Robot Framework 2.7.4.
+        """
+        processes = [self._start_process(command) for command in commands]
+        for process in processes:
+            self._info("Running command '%s'" % process)
+        return [process.wait() for process in processes]
+
     def _run(self, command):
         process = _Process(command)
         self._info("Running command '%s'" % process)
@@ -213,6 +245,14 @@ class OperatingSystem:
         command. This is done the same way, and for the same reasons,
         as with `Run` keyword.
 
+        When using Python on other operating systems than Windows, processes
+        are started by a small helper process. It makes starting processes
+        fast even if the test run has grown big, and it reads the output of
+        processes continuously so that they never block when writing lots of
+        output. Output exceeding one megabyte is stored in a temporary file
+        until it is read. Starting processes in the same process as the test
+        run is used as a fallback.
+
         Example:
         | Start Process  | /path/longlasting.sh |
         | Do Something   |                      |
@@ -220,10 +260,16 @@ class OperatingSystem:
         | Should Contain | ${output}            | Expected text |
         | [Teardown]     | Stop All Processes   |
         """
-        process = _Process2(command, stdin)
+        process = self._start_process(command, stdin)
         self._info("Running command '%s'" % process)
         return PROCESSES.register(process, alias)
 
+    def _start_process(self, command, stdin=None):
+        server = get_command_server()
+        if server:
+            return _ServerProcess(server, command, stdin)
+        return _Process2(command, stdin)
+
     def switch_process(self, index_or_alias):
         """Switches the active process to the specified process.
 
@@ -322,7 +368,7 @@ class OperatingSystem:
         finally:
             f.close()
 
-    def grep_file(self, path, pattern, encoding='UTF-8'):
+    def grep_file(self, path, pattern, encoding='UTF-8', max_lines=None):
         """Returns the lines of the specified file that match the `pattern`.
 
         This keyword reads a file from the file system using the defined
@@ -332,6 +378,11 @@ class OperatingSystem:
         newlines and the number of matched lines is automatically logged.
         Possible trailing newline is never returned.
 
+        The file is read and decoded in chunks, and only the matching lines
+        are kept in memory. This keyword can thus be used also with very
+        big files, such as application logs, that could not be read into
+        memory with `Get File`.
+
         A line matches if it contains the `pattern` anywhere in it and
         it *does not need to match the pattern fully*. The pattern
         matching syntax is explained in `introduction`, and in this
@@ -341,16 +392,67 @@ class OperatingSystem:
         | ${errors} = | Grep File | /var/log/myapp.log | ERROR |
         | ${ret} = | Grep File | ${CURDIR}/file.txt | [Ww]ildc??d ex*ple |
 
+        The optional `max_lines` limits the number of returned lines. When
+        it is positive, the first matching lines are returned and the file
+        is read only until they have been found. When it is negative, the
+        last matching lines are returned. The `max_lines` argument is new in
+        Robot Framework 2.7.4.
+
+        | ${first} = | Grep File | /var/log/myapp.log | ERROR | max_lines=1 |
+        | ${last 10} = | Grep File | /var/log/myapp.log | ERROR | max_lines=-10 |
+
         If more complex pattern matching is needed, it is possible to use
         `Get File` in combination with String library keywords like `Get
         Lines Matching Regexp`.
         """
-        pattern = '*%s*' % pattern
-        orig = self.get_file(path, encoding).splitlines()
-        lines = [line for line in orig if fnmatch.fnmatchcase(line, pattern)]
-        self._info('%d out of %d lines matched' % (len(lines), len(orig)))
+        limit = int(max_lines or 0)
+        matcher = _LineMatcher(pattern)
+        path = self._absnorm(path)
+        self._link("Getting file '%s'", path)
+        lines = []
+        total = matched = 0
+        for text, chunk in self._read_lines(path, encoding):
+            found = matcher.filter(text, chunk)
+            total += len(chunk)
+            matched += len(found)
+            lines.extend(found)
+            if limit > 0 and matched >= limit:
+                self._info('Returning first %d matching lines' % limit)
+                return '\n'.join(lines[:limit])
+            if limit < 0 and len(lines) > -2 * limit:
+                del lines[:limit]
+        self._info('%d out of %d lines matched' % (matched, total))
+        if limit < 0:
+            lines = lines[limit:]
         return '\n'.join(lines)
 
+    def _read_lines(self, path, encoding, chunk_size=64*1024):
+        # Yields chunks of text and lines in them. Lines are split like with
+        # `get_file(...).splitlines()`. The last line of a chunk may be
+        # incomplete, or end with '\r' possibly followed by '\n', and is thus
+        # processed again as part of the next chunk.
+        decoder = codecs.getincrementaldecoder(encoding)()
+        pending = carriage_return = u''
+        reader = open(path, 'rb')
+        try:
+            while True:
+                data = reader.read(chunk_size)
+                decoded = carriage_return + decoder.decode(data, not data)
+                carriage_return = u''
+                if data and decoded.endswith('\r'):
+                    carriage_return, decoded = u'\r', decoded[:-1]
+                text = pending + decoded.replace('\r\n', '\n')
+                lines = text.splitlines()
+                if not data:
+                    yield text, lines
+                    return
+                with_ends = text.splitlines(True)
+                if with_ends:
+                    pending = with_ends[-1]
+                    yield text[:-len(pending)], lines[:-1]
+        finally:
+            reader.close()
+
     def log_file(self, path, encoding='UTF-8'):
         """Wrapper for `Get File` that also logs the returned file.
 
@@ -484,15 +586,15 @@ class OperatingSystem:
 
         If the timeout is negative, the keyword is never timed-out. The keyword
         returns immediately, if the path does not exist in the first place.
+
+        On Linux, the keyword is notified about changes in the file system
+        using inotify and returns immediately after the path is removed.
+        Elsewhere the path is checked ten times per second.
         """
         path = self._absnorm(path)
-        timeout = timestr_to_secs(timeout)
-        maxtime = time.time() + timeout
-        while glob.glob(path):
-            time.sleep(0.1)
-            if timeout >= 0 and time.time() > maxtime:
-                raise AssertionError("'%s' was not removed in %s"
-                                     % (path, secs_to_timestr(timeout)))
+        self._wait_until(lambda: not glob.glob(path), [path], timeout,
+                         lambda limit: "'%s' was not removed in %s"
+                                       % (path, limit))
         self._link("'%s' was removed", path)
 
     def wait_until_created(self, path, timeout='1 minute'):
@@ -510,16 +612,65 @@ class OperatingSystem:
 
         If the timeout is negative, the keyword is never timed-out. The keyword
         returns immediately, if the path already exists.
+
+        Changes in the file system are noticed similarly as with `Wait Until
+        Removed`.
         """
         path = self._absnorm(path)
+        self._wait_until(lambda: glob.glob(path), [path], timeout,
+                         lambda limit: "'%s' was not created in %s"
+                                       % (path, limit))
+        self._link("'%s' was created", path)
+
+    def wait_until_files_match(self, patterns, timeout='1 minute'):
+        """Waits until all the given patterns match files or directories.
+
+        `patterns` is a list of paths or glob patterns, and a single pattern
+        can also be given as a string. The keyword waits until every pattern
+        matches at least one file or directory, and returns all the matching
+        paths as a sorted list. Changes in the file system are noticed
+        similarly as with `Wait Until Removed`.
+
+        The optional `timeout` works the same way as with `Wait Until
+        Created`. If it expires, the error message lists the patterns that
+        did not match.
+
+        Examples:
+        | @{patterns} = | Create List | ${OUTDIR}/result-*.xml | ${OUTDIR}/done.txt |
+        | @{paths} = | Wait Until Files Match | ${patterns} | 2 minutes |
+
+        New in Robot Framework 2.7.4.
+        """
+        if isinstance(patterns, basestring):
+            patterns = [patterns]
+        patterns = [self._absnorm(p) for p in patterns]
+        matches = {}
+        def all_match():
+            for pattern in patterns:
+                matches[pattern] = glob.glob(pattern)
+            return all(matches.values())
+        def error(limit):
+            unmatched = [p for p in patterns if not matches[p]]
+            return 'Pattern%s %s did not match in %s' % (
+                plural_or_not(unmatched), seq2str(unmatched), limit)
+        self._wait_until(all_match, patterns, timeout, error)
+        paths = sorted(set(path for pattern in patterns
+                           for path in matches[pattern]))
+        self._info('%d path%s matched' % (len(paths), plural_or_not(paths)))
+        return paths
+
+    def _wait_until(self, condition, patterns, timeout, error):
         timeout = timestr_to_secs(timeout)
         maxtime = time.time() + timeout
-        while not glob.glob(path):
-            time.sleep(0.1)
-            if timeout >= 0 and time.time() > maxtime:
-                raise AssertionError("'%s' was not created in %s"
-                                     % (path, secs_to_timestr(timeout)))
-        self._link("'%s' was created", path)
+        watcher = get_file_watcher()
+        while True:
+            interval = watcher.watch(patterns)
+            if condition():
+                return
+            remaining = maxtime - time.time()
+            if timeout >= 0 and remaining <= 0:
+                raise AssertionError(error(secs_to_timestr(timeout)))
+            watcher.wait(interval if timeout < 0 else min(interval, remaining))
 
     # Dir/file empty
 
@@ -1227,6 +1378,27 @@ class OperatingSystem:
             print '*%s* %s' % (level, msg)
 
 
+class _LineMatcher(object):
+
+    def __init__(self, pattern):
+        if any(char in pattern for char in '*?['):
+            self._match = re.compile(fnmatch.translate('*%s*' % pattern)).match
+            self._literal = None
+        else:
+            self._literal = pattern
+
+    def filter(self, text, lines):
+        # Patterns without wildcards are searched from the whole text first,
+        # which avoids matching lines individually in most chunks.
+        literal = self._literal
+        if literal is None:
+            match = self._match
+            return [line for line in lines if match(line)]
+        if literal not in text:
+            return []
+        return [line for line in lines if literal in line]
+
+
 class _Process:
 
     def __init__(self, command):
@@ -1285,6 +1457,7 @@ class _Process2(_Process):
         if input_:
             stdin.write(input_)
         stdin.close()
+        self._popen = p
         self.closed = False
 
     def read(self):
@@ -1292,7 +1465,34 @@ class _Process2(_Process):
             raise RuntimeError('Cannot read from a closed process')
         return self._process_output(self.stdout.read())
 
+    def wait(self):
+        output = self.read()
+        self.close()
+        rc = self._popen.wait()
+        # Negative RC means that the process was killed by a signal.
+        return (rc % 256 if rc >= 0 else 255), output
+
     def close(self):
         if not self.closed:
             self.stdout.close()
             self.closed = True
+
+
+class _ServerProcess(_Process):
+
+    def __init__(self, server, command, input_):
+        self._command = self._process_command(command)
+        self._running = server.start(self._command, input_)
+        self.closed = False
+
+    def read(self):
+        return self.wait()[1]
+
+    def wait(self):
+        if self.closed:
+            raise RuntimeError('Cannot read from a closed process')
+        rc, output = self._running.wait()
+        return rc, self._process_output(output)
+
+    def close(self):
+        self.closed = True
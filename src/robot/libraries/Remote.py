@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import xmlrpclib
+import httplib
 import socket
 import time
 import sys
@@ -28,10 +29,15 @@ from robot.errors import RemoteError
 class Remote:
     ROBOT_LIBRARY_SCOPE = 'TEST SUITE'
 
-    def __init__(self, uri='http://localhost:8270'):
+    def __init__(self, uri='http://localhost:8270', persistent=False):
         if '://' not in uri:
             uri = 'http://' + uri
-        self._client = XmlRpcRemoteClient(uri)
+        self._client = XmlRpcRemoteClient(uri, self._is_true(persistent))
+
+    def _is_true(self, value):
+        if isinstance(value, basestring):
+            return value.upper() not in ('', 'FALSE', 'NO')
+        return bool(value)
 
     def get_keyword_names(self, attempts=5):
         for i in range(attempts):
@@ -55,7 +61,31 @@ class Remote:
 
     def run_keyword(self, name, args):
         args = [self._handle_argument(arg) for arg in args]
-        result = RemoteResult(self._client.run_keyword(name, args))
+        return self._handle_result(self._client.run_keyword(name, args))
+
+    def run_keywords(self, keywords):
+        """Runs given keywords using a single request if possible.
+
+        `keywords` is a list of `(name, args)` pairs. Return values of the
+        keywords are returned as a list. Execution stops to the first failing
+        keyword and its error is raised. If the server does not support
+        running multiple keywords at once, keywords are run one by one.
+        """
+        keywords = [(name, [self._handle_argument(arg) for arg in args])
+                    for name, args in keywords]
+        if self._client.supports_multiple_keywords():
+            results = self._client.run_keywords(keywords)
+        else:
+            results = self._run_keywords_one_by_one(keywords)
+        return [self._handle_result(result) for result in results]
+
+    def _run_keywords_one_by_one(self, keywords):
+        # Lazy so that keywords after a failed one are not run.
+        for name, args in keywords:
+            yield self._client.run_keyword(name, args)
+
+    def _handle_result(self, result):
+        result = RemoteResult(result)
         sys.stdout.write(result.output)
         if result.status != 'PASS':
             raise RemoteError(result.error, result.traceback)
@@ -92,8 +122,12 @@ class RemoteResult:
 
 class XmlRpcRemoteClient:
 
-    def __init__(self, uri):
-        self._server = xmlrpclib.ServerProxy(uri, encoding='UTF-8')
+    def __init__(self, uri, persistent=False):
+        transport = PersistentTransport() \
+            if persistent and uri.startswith('http://') else None
+        self._server = xmlrpclib.ServerProxy(uri, transport=transport,
+                                             encoding='UTF-8')
+        self._supports_multiple_keywords = None
 
     def get_keyword_names(self):
         try:
@@ -115,15 +149,114 @@ class XmlRpcRemoteClient:
         except xmlrpclib.Error:
             raise TypeError
 
+    def supports_multiple_keywords(self):
+        if self._supports_multiple_keywords is None:
+            try:
+                methods = self._server.system.listMethods()
+            except (xmlrpclib.Error, socket.error, httplib.HTTPException,
+                    ExpatError):
+                methods = []
+            self._supports_multiple_keywords = 'run_keywords' in methods
+        return self._supports_multiple_keywords
+
     def run_keyword(self, name, args):
+        return self._run(self._server.run_keyword, name, args)
+
+    def run_keywords(self, keywords):
+        return self._run(self._server.run_keywords, keywords)
+
+    def _run(self, method, *args):
         try:
-            return self._server.run_keyword(name, args)
+            return method(*args)
         except xmlrpclib.Error, err:
             raise RuntimeError(err.faultString)
         except socket.error, (errno, err):
             raise RuntimeError('Connection to remote server broken: %s' % err)
+        except httplib.HTTPException, err:
+            raise RuntimeError('Connection to remote server broken: %s' % err)
         except ExpatError, err:
             raise RuntimeError('Processing XML-RPC return value failed. '
                                'Most often this happens when the return value '
                                'contains characters that are not valid in XML. '
                                'Original error was: ExpatError: %s' % err)
+
+
+class PersistentTransport(xmlrpclib.Transport):
+    """Transport reusing the same HTTP/1.1 connection with all requests.
+
+    Connection is opened again if the server closes it. Servers not
+    supporting persistent connections close it after every response.
+    """
+
+    def __init__(self):
+        xmlrpclib.Transport.__init__(self)
+        self._http = None
+
+    def request(self, host, handler, request_body, verbose=0):
+        if not self._http:
+            return self._request(host, handler, request_body)
+        # Server may have closed the reused connection while it was idle.
+        # The request is sent again only if the server cannot have processed
+        # it, i.e. sending failed or the server closed the connection without
+        # responding anything. Otherwise keywords could be run twice.
+        try:
+            self._send(host, handler, request_body)
+        except (socket.error, httplib.HTTPException):
+            return self._request(host, handler, request_body)
+        try:
+            return self._receive(host, handler)
+        except httplib.BadStatusLine, err:
+            if not self._is_empty_status_line(err.line):
+                raise
+        return self._request(host, handler, request_body)
+
+    def _request(self, host, handler, request_body):
+        self._send(host, handler, request_body)
+        return self._receive(host, handler)
+
+    def _send(self, host, handler, request_body):
+        hostname, extra_headers, x509 = self.get_host_info(host)
+        headers = {'Content-Type': 'text/xml',
+                   'User-Agent': self.user_agent}
+        headers.update(dict(extra_headers or []))
+        if not self._http:
+            self._http = httplib.HTTPConnection(hostname)
+        try:
+            self._http.request('POST', handler, request_body, headers)
+        except (socket.error, httplib.HTTPException):
+            self.close()
+            raise
+
+    def _receive(self, host, handler):
+        try:
+            response = self._get_response()
+            data = response.read()
+        except (socket.error, httplib.HTTPException):
+            self.close()
+            raise
+        if response.status != 200:
+            self.close()
+            raise xmlrpclib.ProtocolError(host + handler, response.status,
+                                          response.reason, response.msg)
+        if response.will_close:
+            self.close()
+        parser, unmarshaller = self.getparser()
+        parser.feed(data)
+        parser.close()
+        return unmarshaller.close()
+
+    def _is_empty_status_line(self, line):
+        # Python versions represent a missing status line differently.
+        return line in ('', "''") or line.startswith('No status line')
+
+    def _get_response(self):
+        # Without buffering, supported by Python 2.7 and newer, response
+        # headers are read from the socket one byte at a time.
+        if sys.version_info >= (2, 7):
+            return self._http.getresponse(buffering=True)
+        return self._http.getresponse()
+
+    def close(self):
+        if self._http:
+            self._http.close()
+            self._http = None
@@ -14,6 +14,7 @@
 
 
 import telnetlib
+import select
 import time
 import re
 import inspect
@@ -189,6 +190,39 @@ class TelnetConnection(telnetlib.Telnet):
         self._default_log_level = 'INFO'
         self.set_option_negotiation_callback(self._negotiate_echo_on)
 
+    def fill_rawq(self):
+        # telnetlib reads only 50 bytes at a time to keep processing the
+        # data byte by byte in `process_rawq` fast.
+        if self.irawq >= len(self.rawq):
+            self.rawq = ''
+            self.irawq = 0
+        data = self.sock.recv(64 * 1024)
+        self.eof = not data
+        self.rawq += data
+
+    def process_rawq(self):
+        # Data between IAC sequences is processed in bulk and only the
+        # sequences themselves by telnetlib one byte at a time.
+        cooked = []
+        while self.rawq:
+            data = self.rawq[self.irawq:]
+            if self.iacseq or self.sb or data[0] == telnetlib.IAC:
+                if cooked:
+                    self.cookedq += ''.join(cooked)
+                    cooked = []
+                self.rawq, self.irawq = data[0], 0
+                telnetlib.Telnet.process_rawq(self)
+                self.rawq = data[1:]
+            else:
+                index = data.find(telnetlib.IAC)
+                if index == -1:
+                    index = len(data)
+                cooked.append(data[:index].replace(telnetlib.theNULL, '')
+                                          .replace('\021', ''))
+                self.rawq, self.irawq = data[index:], 0
+        if cooked:
+            self.cookedq += ''.join(cooked)
+
     def set_timeout(self, timeout):
         """Sets the timeout used in read operations to the given value.
 
@@ -254,8 +288,12 @@ class TelnetConnection(telnetlib.Telnet):
 
         If a prompt has been set to this connection, either with `Open
         Connection` or `Set Prompt`, this keyword reads the output
-        until the prompt is found. Otherwise, the keyword sleeps for a
-        second and reads everything that is available.
+        until the prompt is found. Otherwise, the keyword reads the output
+        until no more output has arrived within the timeout set with `Set
+        Timeout`.
+
+        In both cases, the keyword fails if the output contains text 'Login
+        incorrect'.
         """
         ret = self.read_until(login_prompt, 'TRACE').decode('ASCII', 'ignore')
         self.write_bare(username + self._newline)
@@ -275,17 +313,21 @@ class TelnetConnection(telnetlib.Telnet):
         return ret
 
     def _verify_login(self, ret):
-        # It is necessary to wait for the 'login incorrect' message to appear.
-        time.sleep(1)
-        while True:
-            try:
-                ret += self.read_until('\n', 'TRACE').decode('ASCII', 'ignore')
-            except AssertionError:
+        # The 'Login incorrect' message may appear only after a delay.
+        # Output is thus read until it stops coming.
+        while 'Login incorrect' not in ret:
+            if not self._wait_for_output(self._timeout):
                 return ret
-            else:
-                if 'Login incorrect' in ret:
-                    self._log(ret)
-                    raise AssertionError("Login incorrect")
+            output = self.read_very_eager().decode('ASCII', 'ignore')
+            self._log(output, 'TRACE')
+            ret += output
+        self._log(ret)
+        raise AssertionError("Login incorrect")
+
+    def _wait_for_output(self, timeout):
+        if self.cookedq or self.rawq:
+            return True
+        return bool(select.select([self], [], [], timeout)[0])
 
     def write(self, text, loglevel=None):
         """Writes the given text over the connection and appends a newline.
@@ -349,10 +391,11 @@ class TelnetConnection(telnetlib.Telnet):
         while time.time() - starttime < timeout:
             self.write_bare(text)
             self.read_until(text, loglevel)
-            ret = telnetlib.Telnet.read_until(self, expected,
-                                              retry_interval).decode('ASCII', 'ignore')
+            matched, ret = self._read_until(_TextMatcher(expected),
+                                            retry_interval)
+            ret = ret.decode('ASCII', 'ignore')
             self._log(ret, loglevel)
-            if ret.endswith(expected):
+            if matched:
                 return ret
         raise AssertionError("No match found for '%s' in %s"
                              % (expected, utils.secs_to_timestr(timeout)))
@@ -378,14 +421,40 @@ class TelnetConnection(telnetlib.Telnet):
 
         See `Read` for more information on `loglevel`.
         """
-        ret = telnetlib.Telnet.read_until(self, expected,
-                                          self._timeout).decode('ASCII', 'ignore')
+        matched, ret = self._read_until(_TextMatcher(expected), self._timeout)
+        ret = ret.decode('ASCII', 'ignore')
         self._log(ret, loglevel)
-        if not ret.endswith(expected):
+        if not matched:
             raise AssertionError("No match found for '%s' in %s"
                                  % (expected, utils.secs_to_timestr(self._timeout)))
         return ret
 
+    def _read_until(self, matcher, timeout):
+        # Only new output is given to the matcher, and the output is joined
+        # together only after the match has been found or the timeout has
+        # expired. Output after the match is left for following reads.
+        self.process_rawq()
+        output = [self.cookedq]
+        self.cookedq = ''
+        end = matcher.feed(output[0])
+        maxtime = time.time() + timeout
+        while end < 0 and not self.eof:
+            remaining = maxtime - time.time()
+            if remaining <= 0 or not select.select([self], [], [], remaining)[0]:
+                break
+            self.fill_rawq()
+            self.process_rawq()
+            output.append(self.cookedq)
+            self.cookedq = ''
+            end = matcher.feed(output[-1])
+        output = ''.join(output)
+        if end < 0:
+            if not output and self.eof:
+                raise EOFError('telnet connection closed')
+            return False, output
+        self.cookedq = output[end:]
+        return True, output[:end]
+
     def read_until_regexp(self, *expected):
         """Reads from the current output, until a match to a regexp in expected.
 
@@ -397,6 +466,10 @@ class TelnetConnection(telnetlib.Telnet):
         If the last argument in `*expected` is a valid log level, it
         is used as `loglevel` in the keyword `Read`.
 
+        To keep reading fast also with lots of output, matches are searched
+        only from the last 64kB of the output. Expressions matching longer
+        texts than that are thus not found.
+
         Examples:
         | Read Until Regexp | (#|$) |
         | Read Until Regexp | first_regexp | second_regexp |
@@ -409,12 +482,14 @@ class TelnetConnection(telnetlib.Telnet):
         else:
             loglevel = 'INFO'
         try:
-            index, _, ret = self.expect(expected, self._timeout)
+            matcher = _RegexpMatcher(expected)
         except TypeError:
-            index, ret = -1, ''
+            matched, ret = False, ''
+        else:
+            matched, ret = self._read_until(matcher, self._timeout)
         ret = ret.decode('ASCII', 'ignore')
         self._log(ret, loglevel)
-        if index == -1:
+        if not matched:
             expected = [ exp if isinstance(exp, basestring) else exp.pattern
                          for exp in expected ]
             raise AssertionError("No match found for %s in %s"
@@ -520,3 +595,56 @@ class TelnetConnection(telnetlib.Telnet):
                 self.sock.sendall(telnetlib.IAC + telnetlib.WONT + opt)
             elif cmd in (telnetlib.WILL, telnetlib.WONT):
                 self.sock.sendall(telnetlib.IAC + telnetlib.DONT + opt)
+
+
+class _TextMatcher(object):
+
+    def __init__(self, text):
+        self._text = text
+        self._tail = ''
+        self._offset = 0
+
+    def feed(self, output):
+        """Returns the end index of the match in all output fed or -1."""
+        output = self._tail + output
+        index = output.find(self._text)
+        if index >= 0:
+            return self._offset + index + len(self._text)
+        # Only the end of the output that can be a part of a match is kept.
+        keep = min(len(self._text) - 1, len(output))
+        self._tail = output[len(output)-keep:]
+        self._offset += len(output) - keep
+        return -1
+
+
+class _RegexpMatcher(object):
+    """Matches regular expressions against the last 64kB of the output.
+
+    Patterns are tried in the given order and the first matching one wins.
+    """
+    _window_size = 64 * 1024
+
+    def __init__(self, patterns):
+        self._patterns = [re.compile(p) if isinstance(p, basestring) else p
+                          for p in patterns]
+        self._window = ''
+        self._offset = 0
+        self._start = 0
+
+    def feed(self, output):
+        """Returns the end index of the match in all output fed or -1."""
+        window = self._window + output
+        for pattern in self._patterns:
+            match = pattern.search(window, self._start)
+            if match:
+                return self._offset + match.end()
+        excess = len(window) - self._window_size
+        if excess > 0:
+            # One extra character is kept so that e.g. '^' and '\\b' do not
+            # match at the start of the window. Searching starts after it.
+            self._window = window[excess-1:]
+            self._offset += excess - 1
+            self._start = 1
+        else:
+            self._window = window
+        return -1
@@ -0,0 +1,352 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Helper process for starting commands from a large test run process.
+
+Forking a process takes time relative to its size, and during a long test
+run the Robot Framework process can grow big. Commands are thus started by
+a small helper process, itself started only once, that runs as a separate
+interpreter using only the standard library. Commands started via the
+helper can run concurrently, and their output is streamed back in chunks
+so that they never block on a full output pipe. Up to 1MB of output of each
+command is kept in memory and the rest is written to a temporary file
+until the command has finished.
+
+The helper is used only with CPython on POSIX systems. Elsewhere
+:func:`get_command_server` returns `None` and commands must be started
+directly. The helper exits when the process that started it exits.
+"""
+
+import errno
+import fcntl
+import marshal
+import os
+import signal
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+
+
+# Running this module as a script would put its directory, containing
+# modules like `String`, into `sys.path`. It is thus loaded explicitly.
+_BOOTSTRAP = ('import sys, imp; del sys.path[0]; '
+              'imp.load_source("robot_command_server", sys.argv[1]).serve()')
+_HEADER = struct.Struct('!I')
+_CHUNK_SIZE = 64 * 1024
+_SERVER = None
+
+
+def get_command_server():
+    """Returns a running :class:`CommandServer` or `None` if not supported.
+
+    The server is started when this function is called first time and
+    restarted if it has died or the calling process has been forked.
+    """
+    global _SERVER
+    if os.name != 'posix' or sys.platform.startswith('java'):
+        return None
+    if not (_SERVER and _SERVER.alive and _SERVER.pid == os.getpid()):
+        try:
+            _SERVER = CommandServer()
+        except EnvironmentError:
+            _SERVER = None
+    return _SERVER
+
+
+class CommandServer(object):
+    """Client side of the helper process running commands."""
+
+    def __init__(self):
+        script = os.path.splitext(os.path.abspath(__file__))[0] + '.py'
+        self._server = subprocess.Popen([sys.executable, '-c', _BOOTSTRAP,
+                                         script],
+                                        stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE,
+                                        close_fds=True)
+        # Commands started otherwise must not keep the server alive.
+        _close_on_exec(self._server.stdin.fileno())
+        _close_on_exec(self._server.stdout.fileno())
+        self.pid = os.getpid()
+        self.alive = True
+        self._commands = {}
+        self._counter = 0
+        self._environ = None
+        self._wakeup = _WakeUpPipe()
+        reader = threading.Thread(target=self._read_responses)
+        reader.setDaemon(True)
+        reader.start()
+
+    def start(self, command, stdin=None):
+        """Starts the given command with the shell and returns a
+        :class:`RunningCommand` representing it.
+
+        The command is run in the current working directory with the current
+        environment variables. Its standard error is redirected to the
+        standard output.
+        """
+        if not self.alive:
+            raise EnvironmentError('Command server has stopped.')
+        self._counter += 1
+        running = self._commands[self._counter] = RunningCommand(self)
+        try:
+            _send(self._server.stdin.fileno(),
+                  (self._counter, command, os.getcwd(),
+                   self._changed_environ(), stdin))
+        except:
+            # A partially sent request cannot be recovered from.
+            self.stop()
+            raise
+        return running
+
+    def stop(self):
+        """Stops the server. Already started commands are left running."""
+        if self.alive:
+            self.alive = False
+            self._server.stdin.close()
+
+    def _changed_environ(self):
+        environ = dict(os.environ)
+        if environ == self._environ:
+            return None
+        self._environ = environ
+        return environ
+
+    def wait(self, running):
+        # Waiting happens by reading from a pipe, instead of using e.g.
+        # `threading.Event`, to keep waiting interruptible by signals
+        # used to implement timeouts.
+        while running.rc is None:
+            self._wakeup.wait()
+
+    def _read_responses(self):
+        input = self._server.stdout.fileno()
+        try:
+            while True:
+                response = _receive(input)
+                if response is None:
+                    break
+                self._handle_response(*response)
+        finally:
+            self.alive = False
+            for running in self._commands.values():
+                running.finished(255)
+            self._commands.clear()
+            self._wakeup.notify()
+
+    def _handle_response(self, index, output, rc):
+        if output is not None:
+            self._commands[index].add_output(output)
+        else:
+            self._commands.pop(index).finished(rc)
+            self._wakeup.notify()
+
+
+class RunningCommand(object):
+    """A command started by :class:`CommandServer`.
+
+    Output is kept in memory until its size exceeds `max_memory_output`
+    bytes. After that all output is written into a temporary file that is
+    removed when the output has been read.
+    """
+    max_memory_output = 1024 * 1024
+
+    def __init__(self, server):
+        self._server = server
+        self._output = []
+        self._output_size = 0
+        self._output_file = None
+        self.rc = None
+
+    def add_output(self, output):
+        if self._output_file is None:
+            self._output_size += len(output)
+            self._output.append(output)
+            if self._output_size <= self.max_memory_output:
+                return
+            self._output_file = tempfile.TemporaryFile()
+            output = ''.join(self._output)
+            self._output = []
+        self._output_file.write(output)
+
+    def finished(self, rc):
+        self.rc = rc
+
+    def wait(self):
+        """Waits until the command finishes and returns its RC and output.
+
+        The RC is in the range 0-255. Commands killed by a signal are
+        considered failed and get RC 255.
+        """
+        self._server.wait(self)
+        return self.rc, self._read_output()
+
+    def _read_output(self):
+        if self._output_file is None:
+            return ''.join(self._output)
+        self._output_file.seek(0)
+        self._output.append(self._output_file.read())
+        self._output_file.close()
+        self._output_file = None
+        return ''.join(self._output)
+
+
+class _WakeUpPipe(object):
+
+    def __init__(self):
+        self._read, self._write = os.pipe()
+        _close_on_exec(self._read)
+        _close_on_exec(self._write)
+        flags = fcntl.fcntl(self._write, fcntl.F_GETFL)
+        fcntl.fcntl(self._write, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+
+    def notify(self):
+        try:
+            os.write(self._write, 'x')
+        except OSError, err:
+            # A full pipe means that there are earlier notifications unread.
+            if err.errno != errno.EAGAIN:
+                raise
+
+    def wait(self):
+        try:
+            os.read(self._read, 1024)
+        except OSError, err:
+            if err.errno != errno.EINTR:
+                raise
+
+
+def _close_on_exec(fd):
+    flags = fcntl.fcntl(fd, fcntl.F_GETFD)
+    fcntl.fcntl(fd, fcntl.F_SETFD, flags | fcntl.FD_CLOEXEC)
+
+
+def _send(fd, message):
+    data = marshal.dumps(message)
+    data = _HEADER.pack(len(data)) + data
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _receive(fd):
+    header = _read(fd, _HEADER.size)
+    if not header:
+        return None
+    return marshal.loads(_read(fd, _HEADER.unpack(header)[0]))
+
+
+def _read(fd, size):
+    data = []
+    while size:
+        chunk = os.read(fd, size)
+        if not chunk:
+            break
+        data.append(chunk)
+        size -= len(chunk)
+    return ''.join(data)
+
+
+def serve(input=0, output=1):
+    """Runs commands requested by the client until its pipe is closed.
+
+    Commands are started one by one in the main thread, so that a command
+    cannot inherit pipes being created for another. Their inputs are written
+    and outputs read in separate threads, so that the main thread never
+    blocks on a command.
+    """
+    # Started commands should get the default signal handling. They would
+    # inherit SIG_IGN but not handlers implemented in Python.
+    signal.signal(signal.SIGINT, lambda signum, frame: None)
+    send = _Sender(output).send
+    environ = None
+    while True:
+        try:
+            request = _receive(input)
+        except (EOFError, ValueError, TypeError):
+            request = None
+        if request is None:
+            break
+        index, command, cwd, new_environ, stdin = request
+        if new_environ is not None:
+            environ = new_environ
+        try:
+            process = _start(command, cwd, environ, stdin)
+        except EnvironmentError, err:
+            send((index, '%s\n' % err, None))
+            send((index, None, 255))
+        else:
+            _start_thread(_stream, index, process, send)
+            if stdin:
+                _start_thread(_write_input, process, stdin)
+    # Running commands are left running like when starting them directly.
+    os._exit(0)
+
+
+def _start(command, cwd, environ, stdin):
+    process = subprocess.Popen(command, shell=True, cwd=cwd, env=environ,
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT)
+    # Commands started later must not keep the input of this one open.
+    _close_on_exec(process.stdin.fileno())
+    _close_on_exec(process.stdout.fileno())
+    if not stdin:
+        process.stdin.close()
+    return process
+
+
+def _start_thread(target, *args):
+    thread = threading.Thread(target=target, args=args)
+    thread.setDaemon(True)
+    thread.start()
+
+
+def _write_input(process, stdin):
+    try:
+        process.stdin.write(stdin)
+    except IOError:  # Command exited without reading its input
+        pass
+    process.stdin.close()
+
+
+def _stream(index, process, send):
+    stdout = process.stdout.fileno()
+    while True:
+        try:
+            output = os.read(stdout, _CHUNK_SIZE)
+        except OSError, err:
+            if err.errno == errno.EINTR:
+                continue
+            raise
+        if not output:
+            break
+        send((index, output, None))
+    process.stdout.close()
+    rc = process.wait()
+    send((index, None, rc if rc >= 0 else 255))
+
+
+class _Sender(object):
+
+    def __init__(self, output):
+        self._output = output
+        self._lock = threading.Lock()
+
+    def send(self, message):
+        self._lock.acquire()
+        try:
+            _send(self._output, message)
+        finally:
+            self._lock.release()
+
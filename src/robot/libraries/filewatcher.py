@@ -0,0 +1,192 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Watchers used for waiting until files or directories change.
+
+Watchers are used in a loop that first tells the watcher what paths are
+going to be checked, then checks the paths, and finally waits for changes
+if the check did not succeed::
+
+    watcher = get_file_watcher()
+    while True:
+        interval = watcher.watch(patterns)
+        if check(patterns):
+            break
+        watcher.wait(interval)
+
+On Linux, directories containing the paths are watched using inotify and
+waiting ends immediately when they change. Elsewhere, or if a directory
+cannot be watched, changes are polled.
+"""
+
+import errno
+import glob
+import os
+import select
+import struct
+import sys
+import time
+
+try:
+    import ctypes
+except ImportError:  # Not available on Jython, IronPython and older Pythons
+    ctypes = None
+
+
+POLL_INTERVAL = 0.1
+# Changes in network file systems are not seen by inotify and paths are
+# thus checked every now and then also when watching them.
+WATCH_INTERVAL = 1.0
+_WATCHER = None
+
+
+def get_file_watcher():
+    """Returns a watcher shared by all keywords in the calling process."""
+    global _WATCHER
+    if not (_WATCHER and _WATCHER.pid == os.getpid()):
+        _WATCHER = _create_watcher()
+    return _WATCHER
+
+
+def _create_watcher():
+    if sys.platform.startswith('linux') and ctypes:
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError, TypeError):
+            pass
+    return FileWatcher()
+
+
+class FileWatcher(object):
+    """Watcher that polls changes."""
+
+    def __init__(self):
+        self.pid = os.getpid()
+
+    def watch(self, patterns):
+        """Starts watching paths matching the given glob patterns.
+
+        Stops watching paths given earlier. Returns the interval, in
+        seconds, to use when waiting.
+        """
+        return POLL_INTERVAL
+
+    def wait(self, timeout):
+        """Waits until watched paths change or the timeout expires.
+
+        Waiting may end also without changes, and watched paths must thus
+        always be checked afterwards.
+        """
+        time.sleep(timeout)
+
+
+class InotifyWatcher(FileWatcher):
+    """Watcher using inotify on Linux."""
+    _IN_NONBLOCK = 0x800
+    _IN_CLOEXEC = 0x80000
+    _IN_MASK = (0x4 |     # IN_ATTRIB
+                0x40 |    # IN_MOVED_FROM
+                0x80 |    # IN_MOVED_TO
+                0x100 |   # IN_CREATE
+                0x200 |   # IN_DELETE
+                0x400 |   # IN_DELETE_SELF
+                0x800)    # IN_MOVE_SELF
+    _IN_IGNORED = 0x8000
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self):
+        FileWatcher.__init__(self)
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = self._call('inotify_init1',
+                              self._IN_NONBLOCK | self._IN_CLOEXEC)
+        self._watches = {}
+
+    def _call(self, name, *args):
+        result = getattr(self._libc, name)(*args)
+        if result < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code))
+        return result
+
+    def watch(self, patterns):
+        directories = set()
+        interval = WATCH_INTERVAL
+        for pattern in patterns:
+            directory = self._get_directory(pattern)
+            if directory:
+                directories.add(directory)
+            else:
+                interval = POLL_INTERVAL
+        for directory in set(self._watches) - directories:
+            self._remove_watch(directory)
+        for directory in directories - set(self._watches):
+            try:
+                self._watches[directory] = self._call('inotify_add_watch',
+                                                      self._fd, directory,
+                                                      self._IN_MASK)
+            except OSError:
+                interval = POLL_INTERVAL
+        return interval
+
+    def _get_directory(self, pattern):
+        # Items matching the pattern are created and removed in the parent
+        # directory of the pattern. If that directory does not exist, its
+        # nearest existing parent is watched instead until it is created.
+        directory = os.path.dirname(os.path.abspath(pattern))
+        if glob.has_magic(directory):
+            return None
+        while not os.path.isdir(directory):
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return None
+            directory = parent
+        if isinstance(directory, unicode):
+            directory = directory.encode(sys.getfilesystemencoding() or
+                                         'UTF-8')
+        return directory
+
+    def _remove_watch(self, directory):
+        try:
+            self._call('inotify_rm_watch', self._fd,
+                       self._watches.pop(directory))
+        except OSError:  # Watch has already been removed by the system.
+            pass
+
+    def wait(self, timeout):
+        try:
+            if select.select([self._fd], [], [], timeout)[0]:
+                self._read_events()
+        except select.error, err:
+            if err.args[0] != errno.EINTR:
+                raise
+
+    def _read_events(self):
+        # Events only tell that something has changed. Watches removed by
+        # the system, e.g. because the directory was removed, are forgotten.
+        removed = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except OSError, err:
+                if err.errno == errno.EAGAIN:
+                    break
+                raise
+            while data:
+                wd, mask, _, length = self._EVENT.unpack_from(data)
+                if mask & self._IN_IGNORED:
+                    removed.add(wd)
+                data = data[self._EVENT.size+length:]
+        for directory, wd in self._watches.items():
+            if wd in removed:
+                del self._watches[directory]
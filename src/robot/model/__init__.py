@@ -23,7 +23,7 @@ This package is considered stable.
 from .testsuite import TestSuite
 from .testcase import TestCase
 from .keyword import Keyword
-from .message import Message
+from .message import Message, Messages
 from .tags import Tags, TagPatterns
 from .criticality import Criticality
 from .namepatterns import SuiteNamePatterns, TestNamePatterns
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import normalize_tags, setter, Matcher
+from robot.utils import normalize, normalize_tags, setter, Matcher
 
 
 class Tags(object):
@@ -22,9 +22,11 @@ class Tags(object):
 
     @setter
     def _tags(self, tags):
+        if not tags:
+            return []
         if isinstance(tags, basestring):
             tags = [tags]
-        return normalize_tags(tags or [])
+        return normalize_tags(tags)
 
     def add(self, tags):
         self._tags = list(self) + list(Tags(tags))
@@ -55,11 +57,14 @@ class Tags(object):
 class TagPatterns(object):
 
     def __init__(self, patterns):
-        self._patterns = [TagPattern(p) for p in Tags(patterns)]
+        self._index = _TagIndex()
+        self._patterns = [TagPattern(p, self._index) for p in Tags(patterns)]
 
     def match(self, tags):
-        tags = tags if isinstance(tags, Tags) else Tags(tags)
-        return any(p.match(tags) for p in self._patterns)
+        if not self._patterns:
+            return False
+        bits = self._index.bits(tags)
+        return any(p.match_bits(bits) for p in self._patterns)
 
     def __contains__(self, tag):
         return self.match(tag)
@@ -74,42 +79,102 @@ class TagPatterns(object):
         return self._patterns[index]
 
 
-def TagPattern(pattern):
+def TagPattern(pattern, index=None):
+    index = index or _TagIndex()
     pattern = pattern.replace('&', 'AND')
     if 'NOT' in pattern:
-        return _NotTagPattern(*pattern.split('NOT'))
+        return _NotTagPattern(index, *pattern.split('NOT'))
     if 'AND' in pattern:
-        return _AndTagPattern(pattern.split('AND'))
-    return _SingleTagPattern(pattern)
+        return _AndTagPattern(index, pattern.split('AND'))
+    return _SingleTagPattern(index, pattern)
 
 
-class _SingleTagPattern(object):
+class _TagPattern(object):
 
-    def __init__(self, pattern):
-        self._matcher = Matcher(pattern, ignore=['_'])
+    def __init__(self, index):
+        self._index = index
 
     def match(self, tags):
-        return any(self._matcher.match(tag) for tag in tags)
+        return self.match_bits(self._index.bits(tags))
+
+    def match_bits(self, bits):
+        raise NotImplementedError
+
+
+class _SingleTagPattern(_TagPattern):
+
+    def __init__(self, index, pattern):
+        _TagPattern.__init__(self, index)
+        self._matcher = Matcher(pattern, ignore=['_'])
+        self._bit = index.add(self._matcher)
+
+    def match_bits(self, bits):
+        return bool(bits & self._bit)
 
     def __unicode__(self):
         return self._matcher.pattern
 
 
-class _AndTagPattern(object):
+class _AndTagPattern(_TagPattern):
 
-    def __init__(self, patterns):
-        self._patterns = [TagPattern(p) for p in patterns]
+    def __init__(self, index, patterns):
+        _TagPattern.__init__(self, index)
+        self._patterns = [TagPattern(p, index) for p in patterns]
 
-    def match(self, tags):
-        return all(p.match(tags) for p in self._patterns)
+    def match_bits(self, bits):
+        return all(p.match_bits(bits) for p in self._patterns)
 
 
-class _NotTagPattern(object):
+class _NotTagPattern(_TagPattern):
 
-    def __init__(self, must_match, *must_not_match):
-        self._must = TagPattern(must_match)
-        self._must_not = [TagPattern(m) for m in must_not_match]
+    def __init__(self, index, must_match, *must_not_match):
+        _TagPattern.__init__(self, index)
+        self._must = TagPattern(must_match, index)
+        self._must_not = [TagPattern(m, index) for m in must_not_match]
 
-    def match(self, tags):
-        return self._must.match(tags) \
-            and not any(p.match(tags) for p in self._must_not)
+    def match_bits(self, bits):
+        return self._must.match_bits(bits) \
+            and not any(p.match_bits(bits) for p in self._must_not)
+
+
+class _TagIndex(object):
+    """Maps tags to bitsets of the single tag patterns they match.
+
+    Each single pattern gets its own bit, so a set of tags can be matched
+    against AND and NOT combinations using bitwise operations, and each
+    pattern is matched against a distinct tag only once. Bitsets are only
+    as wide as the number of patterns using the index. Tags that would be
+    removed by :class:`Tags`, such as `NONE`, match no patterns.
+    """
+    _max_cached_tags = 10000
+
+    def __init__(self):
+        self._matchers = []
+        self._cache = {}
+
+    def add(self, matcher):
+        self._matchers.append(matcher)
+        self._cache.clear()
+        return 1 << (len(self._matchers) - 1)
+
+    def bits(self, tags):
+        if isinstance(tags, basestring):
+            return self._bits(tags)
+        bits = 0
+        for tag in tags:
+            bits |= self._bits(tag)
+        return bits
+
+    def _bits(self, tag):
+        try:
+            return self._cache[tag]
+        except KeyError:
+            bits = 0
+            if normalize(tag, ignore=['_']) not in ('', 'none'):
+                for index, matcher in enumerate(self._matchers):
+                    if matcher.match(tag):
+                        bits |= 1 << index
+            if len(self._cache) >= self._max_cached_tags:
+                self._cache.clear()
+            self._cache[tag] = bits
+            return bits
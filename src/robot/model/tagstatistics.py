@@ -42,6 +42,7 @@ class TagStatisticsBuilder(object):
         self._excluded = TagPatterns(excluded)
         self._info = TagStatInfo(criticality, docs, links)
         self.stats = TagStatistics(self._info.get_combined_stats(combined))
+        self._stats_by_tag = {}
 
     def add_test(self, test):
         self._add_tags_to_statistics(test)
@@ -49,10 +50,22 @@ class TagStatisticsBuilder(object):
 
     def _add_tags_to_statistics(self, test):
         for tag in test.tags:
+            stat = self._get_stat(tag)
+            if stat is not None:
+                stat.add_test(test)
+
+    def _get_stat(self, tag):
+        # Avoids matching patterns and normalizing the tag for every test.
+        try:
+            return self._stats_by_tag[tag]
+        except KeyError:
+            stat = None
             if self._is_included(tag):
                 if tag not in self.stats.tags:
                     self.stats.tags[tag] = self._info.get_stat(tag)
-                self.stats.tags[tag].add_test(test)
+                stat = self.stats.tags[tag]
+            self._stats_by_tag[tag] = stat
+            return stat
 
     def _is_included(self, tag):
         if self._included and not self._included.match(tag):
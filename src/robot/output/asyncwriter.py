@@ -0,0 +1,118 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Output file that is written to disk on a background thread.
+
+Writing outputs synchronously stalls test execution if the disk or the
+network file system is slow. :class:`AsyncFileWriter` collects written data
+into large chunks that are handed to a writer thread through a bounded
+queue. The queue being bounded limits memory usage if the execution
+produces data faster than it can be written.
+"""
+
+import atexit
+import os
+import threading
+from Queue import Queue
+
+
+class AsyncFileWriter(object):
+    """File like object writing data on a background thread.
+
+    If writing fails in the writer thread, the error is raised by all
+    subsequent :meth:`write`, :meth:`flush`, and :meth:`close` calls. Pending data is
+    written also if the interpreter exits, for example, due to a forced stop
+    signal or an unexpected error, without the file being closed.
+    """
+    _flush = object()
+    _sync = object()
+    _stop = object()
+
+    def __init__(self, path, chunk_size=256*1024, max_chunks=16):
+        self._file = open(path, 'w')
+        self._chunk_size = chunk_size
+        self._chunks = Queue(max_chunks)
+        self._buffer = []
+        self._buffered = 0
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._write_chunks,
+                                        name='AsyncFileWriter')
+        self._thread.setDaemon(True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def name(self):
+        return self._file.name
+
+    def write(self, data):
+        self._raise_possible_error()
+        self._buffer.append(data)
+        self._buffered += len(data)
+        if self._buffered >= self._chunk_size:
+            self._put_buffer()
+
+    def _put_buffer(self):
+        if self._buffer:
+            buffer, self._buffer, self._buffered = self._buffer, [], 0
+            self._chunks.put(''.join(buffer))
+
+    def sync(self):
+        """Writes and syncs data written so far to disk without waiting."""
+        self._put_buffer()
+        self._chunks.put(self._sync)
+
+    def flush(self):
+        """Writes data written so far and waits until it is written."""
+        self._put_buffer()
+        self._chunks.put(self._flush)
+        self._chunks.join()
+        self._raise_possible_error()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._put_buffer()
+        self._chunks.put(self._stop)
+        self._thread.join()
+        self._file.close()
+        self._raise_possible_error()
+
+    def _raise_possible_error(self):
+        if self._error:
+            raise self._error
+
+    def _write_chunks(self):
+        while True:
+            chunk = self._chunks.get()
+            try:
+                if chunk is self._stop:
+                    return
+                if not self._error:
+                    self._write(chunk)
+            except EnvironmentError, err:
+                self._error = err
+            finally:
+                self._chunks.task_done()
+
+    def _write(self, chunk):
+        if chunk is self._flush:
+            self._file.flush()
+        elif chunk is self._sync:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        else:
+            self._file.write(chunk)
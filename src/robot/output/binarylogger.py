@@ -0,0 +1,210 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Writes binary output files.
+
+The format is described in :mod:`robot.result.binaryformat`, which also
+contains the code for reading these files.
+"""
+
+import re
+import sys
+import time
+import zlib
+import struct
+from array import array
+from calendar import timegm
+
+from .xmllogger import XmlLogger
+
+
+MAGIC = 'RFBO'
+VERSION = 2
+
+ROBOT, SUITE, TEST, KEYWORD, END, DOC, METADATA, TAGS, ARGS, STATUS, \
+    MESSAGE, ERRORS, INPUT = range(1, 14)
+
+HEADER = MAGIC + chr(VERSION)
+FOOTER = struct.Struct('>Q')
+UINT32 = [code for code in 'IL' if array(code).itemsize == 4][0]
+BIG_INTEGER = 0xFFFFFFFF
+_TIMESTAMP = re.compile(r'^\d{8} \d\d:\d\d:\d\d\.\d\d\d$')
+
+
+def encode_integers(values):
+    if max(values) >= BIG_INTEGER:
+        big = values
+        values = []
+        for value in big:
+            if value >= BIG_INTEGER:
+                values.extend((BIG_INTEGER, value & BIG_INTEGER, value >> 32))
+            else:
+                values.append(value)
+    values = array(UINT32, values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tostring()
+
+
+def decode_integers(data):
+    values = array(UINT32)
+    values.fromstring(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    values = values.tolist()
+    index = -1
+    try:
+        while True:
+            # Searching big values in C is a lot faster than looping.
+            index = values.index(BIG_INTEGER, index + 1)
+            values[index:index+3] = [values[index+1] | values[index+2] << 32]
+    except ValueError:
+        pass
+    return values
+
+
+class BinaryWriter(object):
+    """Writes binary output files using markup writer interface."""
+
+    def __init__(self, path):
+        self._output = open(path, 'wb')
+        self._output.write(HEADER)
+        self._offset = len(HEADER)
+        self._compressor = zlib.compressobj()
+        self._strings = {}
+        self._previous_time = 0
+        self._seconds = {}
+        self._stack = []
+        self._items = []
+        self._skipped = 0
+
+    def start(self, name, attrs=None, newline=True):
+        if self._skipped or name == 'statistics':
+            self._skipped += 1
+            return
+        attrs = attrs or {}
+        string = self._string
+        if name == 'kw':
+            self._record(KEYWORD, string(attrs.get('name')),
+                         string(attrs.get('type')),
+                         string(attrs.get('timeout')))
+        elif name == 'test':
+            self._record(TEST, string(attrs.get('name')),
+                         string(attrs.get('timeout')))
+        elif name == 'suite':
+            self._record(SUITE, string(attrs.get('name')),
+                         string(attrs.get('source')))
+        elif name == 'errors':
+            self._record(ERRORS)
+        elif name == 'robot':
+            self._record(ROBOT, string(attrs.get('generator')),
+                         string(attrs.get('generated')))
+        self._stack.append(name)
+
+    def content(self, content=None, escape=True):
+        pass
+
+    def end(self, name, newline=True):
+        if self._skipped:
+            self._skipped -= 1
+            return
+        self._stack.pop()
+        if name in ('kw', 'test', 'suite', 'errors'):
+            self._record(END)
+        elif name == 'arguments':
+            self._record(ARGS, *self._items)
+            self._items = []
+        elif name == 'tags':
+            self._record(TAGS, *self._items)
+            self._items = []
+
+    def element(self, name, content=None, attrs=None, escape=True,
+                newline=True):
+        if self._skipped:
+            return
+        attrs = attrs or {}
+        string = self._string
+        if name == 'msg':
+            self._record(MESSAGE, string(content), string(attrs.get('level')),
+                         int(attrs.get('html') == 'yes'),
+                         self._time(attrs.get('timestamp')))
+        elif name in ('arg', 'tag'):
+            self._items.append(string(content))
+        elif name == 'status':
+            status = attrs.get('status') if self._stack[-1] != 'suite' else None
+            self._record(STATUS, string(status), string(content),
+                         self._time(attrs.get('starttime')),
+                         self._time(attrs.get('endtime')))
+        elif name == 'doc':
+            self._record(DOC, string(content))
+        elif name == 'item':
+            self._record(METADATA, string(attrs.get('name')), string(content))
+        elif name == 'input':
+            self._record(INPUT, string(attrs.get('path')),
+                         string(attrs.get('signature')))
+
+    def close(self):
+        self._write(self._compressor.flush())
+        strings = sorted(self._strings, key=self._strings.get)
+        table = zlib.compress(u'\x00'.join(strings).encode('UTF-8'))
+        self._output.write(table)
+        self._output.write(FOOTER.pack(self._offset))
+        self._output.close()
+
+    def _record(self, type, *fields):
+        self._write(self._compressor.compress(
+            encode_integers((type, len(fields)) + fields)))
+
+    def _write(self, data):
+        if data:
+            self._output.write(data)
+            self._offset += len(data)
+
+    def _string(self, string):
+        if string is None:
+            return 0
+        if '\x00' in string:
+            string = string.replace('\x00', '')
+        try:
+            return self._strings[string]
+        except KeyError:
+            index = self._strings[string] = len(self._strings) + 1
+            return index
+
+    def _time(self, timestamp):
+        if not timestamp or timestamp == 'N/A':
+            return 0
+        if not _TIMESTAMP.match(timestamp):
+            return self._string(timestamp) << 1 | 1
+        millis = self._seconds_since_epoch(timestamp[:17]) * 1000 \
+                    + int(timestamp[18:])
+        delta = millis - self._previous_time
+        self._previous_time = millis
+        zigzag = delta << 1 if delta >= 0 else (-delta << 1) - 1
+        return (zigzag + 1) << 1
+
+    def _seconds_since_epoch(self, timestamp):
+        try:
+            return self._seconds[timestamp]
+        except KeyError:
+            seconds = timegm(time.strptime(timestamp, '%Y%m%d %H:%M:%S'))
+            self._seconds[timestamp] = seconds
+            return seconds
+
+
+class BinaryLogger(XmlLogger):
+    """Writes binary output file during execution."""
+
+    def _create_writer(self, path):
+        return BinaryWriter(path)
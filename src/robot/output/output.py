@@ -12,26 +12,70 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import partial
+
 from robot.common.statistics import Statistics
 
+from .binarylogger import BinaryLogger
 from .listeners import Listeners
 from .logger import LOGGER
 from .loggerhelper import AbstractLogger
 from .debugfile import DebugFile
+from .profiler import Profiler
 from .xmllogger import XmlLogger
+from .xunitlogger import XUnitLogger
 
 
 class Output(AbstractLogger):
 
-    def __init__(self, settings):
+    def __init__(self, settings, keyword_remover=None):
         AbstractLogger.__init__(self)
-        self._xmllogger = XmlLogger(settings['Output'], settings['LogLevel'])
-        self._register_loggers(settings['Listeners'], settings['DebugFile'])
+        remover = self._get_keyword_remover(keyword_remover,
+                                            settings['RemoveKeywords'])
+        self._xmllogger = XmlLogger(settings['Output'], settings['LogLevel'],
+                                    asynchronous=settings['AsyncOutput'],
+                                    fsync=settings['FsyncOutput'],
+                                    keyword_remover=remover)
+        self._binarylogger = self._get_binary_logger(settings['BinaryOutput'],
+                                                     settings['LogLevel'],
+                                                     remover)
+        self._xunitlogger = self._get_xunit_logger(settings.live_xunit,
+                                                   settings['LogLevel'])
+        self._register_loggers(settings['Listeners'], settings['DebugFile'],
+                               Profiler(settings['Profile'],
+                                        settings['ProfileTop'],
+                                        settings['StdOut']))
         self._settings = settings
 
-    def _register_loggers(self, listeners, debugfile):
+    def _get_keyword_remover(self, remover_class, how):
+        # Remover class is given by the caller because it is implemented in
+        # robot.result that cannot be imported when this module is imported.
+        if not remover_class:
+            return None
+        return partial(remover_class, how)
+
+    def _get_binary_logger(self, path, log_level, keyword_remover):
+        if path == 'NONE':
+            return None
+        return BinaryLogger(path, log_level, keyword_remover=keyword_remover)
+
+    def _get_xunit_logger(self, path, log_level):
+        if not path:
+            return None
+        try:
+            return XUnitLogger(path, log_level)
+        except EnvironmentError, err:
+            LOGGER.error("Opening XUnit result file '%s' failed: %s"
+                         % (path, err.strerror))
+            return None
+
+    def _register_loggers(self, listeners, debugfile, profiler):
         LOGGER.register_context_changing_logger(self._xmllogger)
-        for logger in Listeners(listeners), DebugFile(debugfile):
+        if self._binarylogger:
+            LOGGER.register_context_changing_logger(self._binarylogger)
+        if self._xunitlogger:
+            LOGGER.register_logger(self._xunitlogger)
+        for logger in Listeners(listeners), DebugFile(debugfile), profiler:
             if logger: LOGGER.register_logger(logger)
         LOGGER.disable_message_cache()
 
@@ -46,6 +90,22 @@ class Output(AbstractLogger):
         self._xmllogger.close()
         LOGGER.unregister_logger(self._xmllogger)
         LOGGER.output_file('Output', self._settings['Output'])
+        if self._binarylogger:
+            self._binarylogger.close()
+            LOGGER.unregister_logger(self._binarylogger)
+            LOGGER.output_file('Binary', self._settings['BinaryOutput'])
+        if self._xunitlogger:
+            self._close_xunit_logger(self._settings['XUnitFile'])
+
+    def _close_xunit_logger(self, path):
+        LOGGER.unregister_logger(self._xunitlogger)
+        try:
+            self._xunitlogger.close()
+        except EnvironmentError, err:
+            LOGGER.error("Writing XUnit result file '%s' failed: %s"
+                         % (path, err.strerror))
+        else:
+            LOGGER.output_file('XUnit', path)
 
     def start_suite(self, suite):
         LOGGER.start_suite(suite)
@@ -72,5 +132,9 @@ class Output(AbstractLogger):
         # TODO: Module structure should be cleaned up to prevent cyclic imports
         from .pyloggingconf import set_level
         set_level(level)
+        if self._binarylogger:
+            self._binarylogger.set_log_level(level)
+        if self._xunitlogger:
+            self._xunitlogger.set_log_level(level)
         return self._xmllogger.set_log_level(level)
 
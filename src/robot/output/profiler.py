@@ -0,0 +1,115 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import sys
+import time
+
+from robot import utils
+
+from .logger import LOGGER
+
+
+def Profiler(path, top=10, stdout=None):
+    if path == 'NONE':
+        return None
+    try:
+        outfile = open(path, 'w')
+    except EnvironmentError, err:
+        LOGGER.error("Opening profile file '%s' failed: %s"
+                     % (path, err.strerror))
+        return None
+    else:
+        LOGGER.info('Profile file: %s' % path)
+        return _KeywordProfiler(outfile, top, stdout)
+
+
+class _KeywordProfiler(object):
+    """Collects execution times of keywords aggregated by their call paths.
+
+    Times are written into the profile file in the collapsed stack format
+    understood by flame graph tools. Each line contains keyword names in
+    the call path separated with semicolons and the time spent in the last
+    keyword itself in microseconds. Keywords spending most time themselves
+    are also listed on the console.
+    """
+    _ignored_types = ('for', 'foritem')
+
+    def __init__(self, outfile, top=10, stdout=None):
+        self._outfile = outfile
+        self._top = top
+        self._stdout = stdout or sys.__stdout__
+        self._suite_level = 0
+        self._stack = []
+        self._running = {}
+        self._paths = {}
+        self._keywords = {}
+
+    def start_suite(self, suite):
+        self._suite_level += 1
+
+    def end_suite(self, suite):
+        self._suite_level -= 1
+        if not self._suite_level:
+            self.close()
+
+    def start_keyword(self, kw):
+        if kw.type in self._ignored_types:
+            return
+        name = self._get_name(kw)
+        path = '%s;%s' % (self._stack[-1][0], name) if self._stack else name
+        self._stack.append([path, name, time.time(), 0.0])
+        self._running[name] = self._running.get(name, 0) + 1
+
+    def _get_name(self, kw):
+        name = kw.name
+        if getattr(kw, 'assign', None):
+            name = name.split('} = ', 1)[-1]  # Remove assigned variables
+        return name.replace(';', ',')
+
+    def end_keyword(self, kw):
+        if kw.type in self._ignored_types:
+            return
+        path, name, start, children = self._stack.pop()
+        elapsed = time.time() - start
+        if self._stack:
+            self._stack[-1][3] += elapsed
+        self._paths[path] = self._paths.get(path, 0) + elapsed - children
+        stats = self._keywords.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[2] += elapsed - children
+        self._running[name] -= 1
+        if not self._running[name]:
+            stats[1] += elapsed  # Recursive calls are included only once
+
+    def close(self):
+        if self._outfile.closed:
+            return
+        for path in sorted(self._paths):
+            micros = int(round(self._paths[path] * 1e6))
+            self._outfile.write('%s %d\n' % (path.encode('UTF-8'), micros))
+        self._outfile.close()
+        self._write_summary()
+        LOGGER.output_file('Profile', self._outfile.name)
+
+    def _write_summary(self):
+        if not (self._top and self._keywords):
+            return
+        stats = sorted(self._keywords.items(), key=lambda item: -item[1][2])
+        lines = ['Top %d keywords by self time:' % min(self._top, len(stats)),
+                 '%10s %10s %8s  %s' % ('Self (s)', 'Total (s)', 'Calls',
+                                        'Keyword')]
+        for name, (calls, total, own) in stats[:self._top]:
+            lines.append('%10.3f %10.3f %8d  %s' % (own, total, calls, name))
+        self._stdout.write(utils.encode_output('\n'.join(lines) + '\n'))
+        self._stdout.flush()
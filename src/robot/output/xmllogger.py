@@ -12,26 +12,34 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+
 from robot.errors import DataError
 from robot.utils import XmlWriter, NullMarkupWriter, get_timestamp, unic
 from robot.version import get_full_version
 
+from .asyncwriter import AsyncFileWriter
 from .loggerhelper import IsLogged
 
 
 class XmlLogger(object):
 
-    def __init__(self, path, log_level='TRACE', generator='Robot'):
+    def __init__(self, path, log_level='TRACE', generator='Robot',
+                 asynchronous=False, fsync=False, keyword_remover=None):
         self._log_message_is_logged = IsLogged(log_level)
         self._error_message_is_logged = IsLogged('WARN')
+        self._asynchronous = asynchronous
+        self._fsync = fsync and path != 'NONE'
         self._writer = self._get_writer(path, generator)
         self._errors = []
+        self._remover = keyword_remover(self) \
+            if keyword_remover and path != 'NONE' else None
 
     def _get_writer(self, path, generator):
         if path == 'NONE':
             return NullMarkupWriter()
         try:
-            writer = XmlWriter(path, encoding='UTF-8')
+            writer = self._create_writer(path)
         except EnvironmentError, err:
             raise DataError("Opening output file '%s' failed: %s" %
                             (path, err.strerror))
@@ -39,6 +47,19 @@ class XmlLogger(object):
                                'generated': get_timestamp()})
         return writer
 
+    def _create_writer(self, path):
+        if self._asynchronous:
+            path = AsyncFileWriter(path)
+        return XmlWriter(path, encoding='UTF-8')
+
+    def _sync_output(self):
+        output = self._writer.output
+        if isinstance(output, AsyncFileWriter):
+            output.sync()
+        else:
+            output.flush()
+            os.fsync(output.fileno())
+
     def close(self):
         self.start_errors()
         for msg in self._errors:
@@ -56,7 +77,8 @@ class XmlLogger(object):
 
     def log_message(self, msg):
         if self._log_message_is_logged(msg.level):
-            self._write_message(msg)
+            if not (self._remover and self._remover.log_message(msg)):
+                self._write_message(msg)
 
     def _write_message(self, msg):
         attrs = {'timestamp': msg.timestamp or 'N/A', 'level': msg.level}
@@ -65,20 +87,41 @@ class XmlLogger(object):
         self._writer.element('msg', msg.message, attrs)
 
     def start_keyword(self, kw):
+        if not (self._remover and self._remover.start_keyword(kw)):
+            self._start_keyword(kw)
+
+    def _start_keyword(self, kw):
         self._writer.start('kw', {'name': kw.name, 'type': kw.type,
                                   'timeout': str(kw.timeout)})
         self._writer.element('doc', kw.doc)
         self._write_list('arguments', 'arg', (unic(a) for a in kw.args))
 
     def end_keyword(self, kw):
+        if not (self._remover and self._remover.end_keyword(kw)):
+            self._end_keyword(kw)
+
+    def _end_keyword(self, kw):
         self._write_status(kw)
         self._writer.end('kw')
 
+    def write_keyword(self, kw):
+        """Writes a result model keyword with its keywords and messages."""
+        self._start_keyword(kw)
+        for child in kw.keywords:
+            self.write_keyword(child)
+        for msg in kw.messages:
+            self._write_message(msg)
+        self._end_keyword(kw)
+
     def start_test(self, test):
         self._writer.start('test', {'id': test.id, 'name': test.name,
                                     'timeout': str(test.timeout)})
+        if self._remover:
+            self._remover.start_test(test)
 
     def end_test(self, test):
+        if self._remover:
+            self._remover.end_test(test)
         self._writer.element('doc', test.doc)
         self._write_list('tags', 'tag', test.tags)
         self._write_status(test, test.message,
@@ -99,6 +142,8 @@ class XmlLogger(object):
         self._writer.element('doc', suite.doc)
         self._write_status(suite, suite.message)
         self._writer.end('suite')
+        if self._fsync:
+            self._sync_output()
 
     def start_statistics(self, stats):
         self._writer.start('statistics')
@@ -0,0 +1,195 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Writes xUnit outputs during execution and from other streamed sources.
+
+Tests are given to :class:`StreamingXUnitWriter` one by one and stored into
+a temporary file until the totals needed by the root element are known.
+The memory usage thus does not depend on the number of tests or keywords.
+"""
+
+from bisect import bisect_right
+import cPickle as pickle
+import os
+import tempfile
+
+from robot.utils import XmlWriter
+
+from .loggerhelper import IsLogged
+
+
+class StreamingXUnitWriter(object):
+    """Writes an xUnit output from suites and tests given in execution order.
+
+    The result is the same as written by
+    :class:`~robot.reporting.xunitwriter.XUnitWriter`, including tests
+    failed afterwards because the teardown of their parent suite failed.
+    The output file is opened immediately but written only by :meth:`close`.
+    """
+    _teardown_failed = 'Teardown of the parent suite failed.'
+    _also_teardown_failed = '\n\nAlso teardown of the parent suite failed.'
+
+    def __init__(self, output):
+        self._writer = XmlWriter(output, encoding='UTF-8')
+        self._records = tempfile.TemporaryFile()
+        self._suites = []
+        self._teardown_starts = []
+        self._teardown_ends = []
+        self.name = None
+        self.test_count = 0
+        self.failed = 0
+        self.critical_failed = 0
+
+    def start_suite(self, name):
+        if not self._suites:
+            self.name = name
+            longname = None
+        elif self._suites[-1].longname is None:
+            longname = name
+        else:
+            longname = '%s.%s' % (self._suites[-1].longname, name)
+        self._suites.append(_SuiteRange(longname, self.test_count))
+
+    def end_suite(self, teardown_failed=False):
+        suite = self._suites.pop()
+        if teardown_failed and suite.first < self.test_count:
+            self._teardown_starts.append(suite.first)
+            self._teardown_ends.append(self.test_count)
+            self.failed += suite.passed
+            self.critical_failed += suite.critical_passed
+            suite.passed = suite.critical_passed = 0
+        if self._suites:
+            self._suites[-1].passed += suite.passed
+            self._suites[-1].critical_passed += suite.critical_passed
+
+    def test(self, name, elapsedtime, passed, message='', details='',
+             critical=True):
+        """Adds a test into the currently open suite.
+
+        :param elapsedtime: Elapsed time in milliseconds.
+        :param details: Content of the possible `<failure>` element.
+        """
+        suite = self._suites[-1]
+        if passed:
+            suite.passed += 1
+            suite.critical_passed += int(critical)
+        else:
+            self.failed += 1
+            self.critical_failed += int(critical)
+        self.test_count += 1
+        pickle.dump((suite.longname, name, elapsedtime, passed, message,
+                     details), self._records, pickle.HIGHEST_PROTOCOL)
+
+    def close(self):
+        writer = self._writer
+        writer.start('testsuite', {'name': self.name or '',
+                                   'tests': str(self.test_count),
+                                   'errors': '0',
+                                   'failures': str(self.failed),
+                                   'skip': '0'})
+        for record in self._read_records():
+            self._write_test(writer, *record)
+        writer.end('testsuite')
+        writer.close()
+        self._records.close()
+
+    def _read_records(self):
+        self._teardown_starts.sort()
+        self._teardown_ends.sort()
+        self._records.seek(0)
+        for index in xrange(self.test_count):
+            record = pickle.load(self._records)
+            yield record + (self._teardown_failures(index),)
+
+    def _teardown_failures(self, index):
+        return (bisect_right(self._teardown_starts, index) -
+                bisect_right(self._teardown_ends, index))
+
+    def _write_test(self, writer, longname, name, elapsedtime, passed,
+                    message, details, teardown_failures):
+        for _ in xrange(teardown_failures):
+            passed = False
+            message += self._also_teardown_failed if message \
+                    else self._teardown_failed
+        classname = self.name if longname is None \
+                else '%s.%s' % (self.name, longname)
+        writer.start('testcase', {'classname': classname,
+                                  'name': name,
+                                  'time': self._time_as_seconds(elapsedtime)})
+        if not passed:
+            writer.start('failure', {'message': message,
+                                     'type': 'AssertionError'}, newline=False)
+            writer.content(details)
+            writer.end('failure')
+        writer.end('testcase')
+
+    def _time_as_seconds(self, millis):
+        return str(int(round(millis, -3) / 1000))
+
+
+class _SuiteRange(object):
+    __slots__ = ['longname', 'first', 'passed', 'critical_passed']
+
+    def __init__(self, longname, first):
+        self.longname = longname
+        self.first = first
+        self.passed = 0
+        self.critical_passed = 0
+
+
+class XUnitLogger(object):
+    """Writes an xUnit output during execution based on logger events."""
+
+    def __init__(self, path, log_level='TRACE'):
+        self._writer = StreamingXUnitWriter(path)
+        self._path = path
+        self._is_logged = IsLogged(log_level)
+        self._teardown_failed = []
+        self._details = None
+        self._kw_level = 0
+
+    def set_log_level(self, level):
+        return self._is_logged.set_level(level)
+
+    def start_suite(self, suite):
+        self._writer.start_suite(suite.name)
+        self._teardown_failed.append(False)
+
+    def end_suite(self, suite):
+        self._writer.end_suite(self._teardown_failed.pop())
+
+    def start_test(self, test):
+        self._details = []
+
+    def end_test(self, test):
+        self._writer.test(test.name, test.elapsedtime, test.status == 'PASS',
+                          test.message, ''.join(self._details))
+        self._details = None
+
+    def start_keyword(self, kw):
+        self._kw_level += 1
+
+    def end_keyword(self, kw):
+        self._kw_level -= 1
+        if self._details is None and not self._kw_level \
+                and kw.type == 'teardown':
+            self._teardown_failed[-1] = kw.status != 'PASS'
+
+    def log_message(self, msg):
+        if self._details is not None and msg.level == 'DEBUG' \
+                and self._is_logged(msg.level):
+            self._details.append(msg.message + os.linesep)
+
+    def close(self):
+        self._writer.close()
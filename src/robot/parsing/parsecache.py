@@ -0,0 +1,142 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Persistent cache for rows read from test data files.
+
+The cache stores the tables and rows a reader produced from a file and
+allows replaying them to a populator without reading the file again. Cached
+rows are independent of where the file is located, because `${CURDIR}` is
+replaced only when the rows are populated, and they are invalidated when the
+modification time or the size of the file or the Robot Framework version
+changes.
+
+The cache is used when the `ROBOT_PARSE_CACHE` environment variable
+contains the directory where to store it.
+"""
+
+from __future__ import with_statement
+import os
+import tempfile
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+from hashlib import md5
+
+from robot import utils
+from robot.output import LOGGER
+from robot.version import get_full_version
+
+
+class ParseCache(object):
+
+    def __init__(self, directory=None):
+        self.directory = utils.abspath(directory) if directory else None
+        self._version = get_full_version()
+
+    def __nonzero__(self):
+        return self.directory is not None
+
+    def populate(self, path, read, populator):
+        """Populates `populator` either from cache or by calling `read`.
+
+        `read` is called with `path` and a populator that records the data
+        so that it can be cached.
+        """
+        if not self:
+            return read(path, populator)
+        rows = self.get(path)
+        if rows is not None:
+            return RowReplayer(rows).replay(populator)
+        recorder = RowRecorder(populator)
+        read(path, recorder)
+        self.set(path, recorder.rows)
+
+    def get(self, path):
+        cache = self._get_cache_path(path)
+        if not (os.path.isfile(path) and os.path.isfile(cache)):
+            return None
+        try:
+            with open(cache, 'rb') as cachefile:
+                key, rows = pickle.load(cachefile)
+        except Exception:
+            LOGGER.info("Ignoring invalid parse cache file '%s'." % cache)
+            return None
+        return rows if key == self._get_key(path) else None
+
+    def set(self, path, rows):
+        cache = self._get_cache_path(path)
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            fd, temp = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'wb') as cachefile:
+                pickle.dump((self._get_key(path), rows), cachefile,
+                            pickle.HIGHEST_PROTOCOL)
+            self._replace(temp, cache)
+        except (IOError, OSError), err:
+            LOGGER.info("Writing parse cache file '%s' failed: %s"
+                        % (cache, err))
+
+    def _replace(self, source, target):
+        # os.rename does not overwrite existing files on Windows.
+        if os.name == 'nt' and os.path.exists(target):
+            os.remove(target)
+        os.rename(source, target)
+
+    def _get_cache_path(self, path):
+        name = md5(utils.abspath(path).encode('UTF-8')).hexdigest()
+        return os.path.join(self.directory, name + '.cache')
+
+    def _get_key(self, path):
+        stat = os.stat(path)
+        return (utils.abspath(path), stat.st_mtime, stat.st_size,
+                self._version)
+
+
+class RowRecorder(object):
+
+    def __init__(self, populator):
+        self._populator = populator
+        self.rows = []
+
+    def start_table(self, header):
+        process = self._populator.start_table(header)
+        self.rows.append((True, header))
+        return process
+
+    def add(self, row):
+        self._populator.add(row)
+        self.rows.append((False, row))
+
+    def eof(self):
+        self._populator.eof()
+
+
+class RowReplayer(object):
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def replay(self, populator):
+        process = False
+        for is_header, row in self._rows:
+            if is_header:
+                process = populator.start_table(row)
+            elif process:
+                populator.add(row)
+        populator.eof()
+
+
+PARSE_CACHE = ParseCache(utils.get_env_var('ROBOT_PARSE_CACHE'))
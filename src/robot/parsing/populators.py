@@ -27,6 +27,7 @@ from .htmlreader import HtmlReader
 from .tsvreader import TsvReader
 from .txtreader import TxtReader
 from .restreader import RestReader
+from .parsecache import PARSE_CACHE
 
 
 READERS = {'html': HtmlReader, 'htm': HtmlReader, 'xhtml': HtmlReader,
@@ -53,9 +54,17 @@ class FromFilePopulator(object):
 
     def populate(self, path):
         LOGGER.info("Parsing file '%s'." % path)
+        try:
+            PARSE_CACHE.populate(path, self._read, self)
+        except DataError:
+            raise
+        except:
+            raise DataError(utils.get_error_message())
+
+    def _read(self, path, populator):
         source = self._open(path)
         try:
-            self._get_reader(path).read(source, self)
+            self._get_reader(path).read(source, populator)
         except:
             raise DataError(utils.get_error_message())
         finally:
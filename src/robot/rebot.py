@@ -104,6 +104,17 @@ Options
                           similarly as --log. Default is `report.html`.
  -x --xunitfile file      xUnit compatible result file. Not created unless this
                           option is specified.
+    --binaryoutput file   Compact binary output file. Binary outputs can be
+                          used as inputs to Rebot similarly as XML outputs.
+                          Not created unless this option is specified.
+    --combined file       Combined result that is updated incrementally. Given
+                          outputs not already combined into this binary file
+                          are added to it, and outputs are created based on
+                          the updated combined result. Earlier combined
+                          outputs are thus not parsed again. The file is
+                          created if it does not exist and the path is not
+                          relative to --outputdir.
+                          Example: rebot --combined all.rfb shards/*.xml
  -T --timestampoutputs    When this option is used, timestamp in a format
                           `YYYYMMDD-hhmmss` is added to all generated output
                           files between their basename and extension. For
@@ -112,6 +123,13 @@ Options
                           `report-20070503-154410.html`.
     --splitlog            Split log file into smaller pieces that open in
                           browser transparently.
+    --compressionlevel level  Compression level from 0 to 9 used with long
+                          texts in log and report. Lower levels make creating
+                          them faster but files bigger. 0 disables
+                          compression. Default is 9.
+    --compressblocks      Compress long texts in log in blocks instead of one
+                          by one. Makes creating log faster and the log file
+                          smaller, but opening messages in it a bit slower.
     --logtitle title      Title for the generated test log. The default title
                           is `<Name Of The Suite> Test Log`. Underscores in
                           the title are converted into spaces in all titles.
@@ -190,6 +208,11 @@ Options
                           of combined test suites together.
     --nostatusrc          Sets the return code to zero regardless of failures
                           in test cases. Error codes are returned normally.
+ -J --jobs count         Read outputs and write result files in parallel
+                          using the given number of processes. Log and report
+                          are created after all outputs have been read.
+                          Default is 1 meaning everything is done
+                          sequentially.
  -C --monitorcolors auto|on|off  Use colors on console output or not.
                           auto: use colors when output not redirected (default)
                           on:   always use colors
@@ -267,7 +290,8 @@ from robot.conf import RebotSettings
 from robot.errors import DataError
 from robot.reporting import ResultWriter
 from robot.output import LOGGER
-from robot.utils import Application
+from robot.result.incremental import IncrementalResult
+from robot.utils import Application, plural_or_not
 
 
 class Rebot(Application):
@@ -281,11 +305,23 @@ class Rebot(Application):
                                        stdout=settings['StdOut'],
                                        stderr=settings['StdErr'])
         LOGGER.disable_message_cache()
+        if settings.combined:
+            datasources = [self._update_combined(settings.combined,
+                                                 datasources)]
         rc = ResultWriter(*datasources).write_results(settings)
         if rc < 0:
             raise DataError('No outputs created.')
         return rc
 
+    def _update_combined(self, path, datasources):
+        result = IncrementalResult(path)
+        added = result.add_outputs(*datasources)
+        if added:
+            result.save_combined()
+        LOGGER.info("Combined %d new output%s into '%s'."
+                    % (added, plural_or_not(added), path))
+        return result
+
 
 def rebot_cli(arguments):
     """Command line execution entry point for running rebot.
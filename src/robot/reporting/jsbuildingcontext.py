@@ -18,23 +18,34 @@ import os.path
 from robot.output.loggerhelper import LEVELS
 from robot.utils import timestamp_to_secs, get_link_path, html_format
 
+from .jswriter import SplitLogChunkWriter
 from .stringcache import StringCache
 
 
 class JsBuildingContext(object):
 
-    def __init__(self, log_path=None, split_log=False, prune_input=False):
+    def __init__(self, log_path=None, split_log=False, prune_input=False,
+                 compression_level=9, compress_blocks=False):
         # log_path can be a custom object in unit tests
         self._log_dir = os.path.dirname(log_path) \
                 if isinstance(log_path, basestring) else None
         self._split_log = split_log
+        self._split_log_writer = self._get_split_log_writer(log_path, split_log)
         self._prune_input = prune_input
-        self._strings = self._orig_strings = StringCache()
+        self._compression = (compression_level, compress_blocks)
+        self.compression_level = compression_level
+        self._strings = self._orig_strings = StringCache(*self._compression)
         self.basemillis = None
         self.split_results = []
         self.min_level = 'NONE'
         self._msg_links = {}
 
+    def _get_split_log_writer(self, log_path, split_log):
+        # Parts are kept in memory if there is no real log file.
+        if split_log and isinstance(log_path, basestring):
+            return SplitLogChunkWriter(os.path.splitext(log_path)[0])
+        return None
+
     def string(self, string):
         return self._strings.add(string)
 
@@ -74,14 +85,24 @@ class JsBuildingContext(object):
 
     def start_splitting_if_needed(self, split=False):
         if self._split_log and split:
-            self._strings = StringCache()
+            self._strings = StringCache(*self._compression)
             return True
         return False
 
     def end_splitting(self, model):
-        self.split_results.append((model, self.strings))
+        if self._split_log_writer:
+            index = self._split_log_writer.write(model, self.strings)
+        else:
+            self.split_results.append((model, self.strings))
+            index = len(self.split_results)
         self._strings = self._orig_strings
-        return len(self.split_results)
+        return index
+
+    def end_split_log(self):
+        """Closes split log chunk files and returns their writer, if any."""
+        if self._split_log_writer:
+            self._split_log_writer.close()
+        return self._split_log_writer
 
     @contextmanager
     def prune_input(self, *items):
@@ -16,18 +16,21 @@ import time
 
 from robot import utils
 
-from .stringcache import StringIndex
+from .stringcache import BlockDecoder, StringIndex
 
 
 class JsExecutionResult(object):
 
     def __init__(self, suite, statistics, errors, strings, basemillis=None,
-                 split_results=None, min_level=None):
+                 split_results=None, split_log=None, min_level=None,
+                 compression_level=9):
         self.suite = suite
         self.strings = strings
         self.min_level = min_level
+        self.compression_level = compression_level
         self.data = self._get_data(statistics, errors, basemillis or 0)
         self.split_results = split_results or []
+        self.split_log = split_log
 
     def _get_data(self, statistics, errors, basemillis):
         gentime = time.localtime()
@@ -41,7 +44,7 @@ class JsExecutionResult(object):
 
     def remove_data_not_needed_in_report(self):
         self.data.pop('errors')
-        remover = _KeywordRemover()
+        remover = _KeywordRemover(self.compression_level)
         self.suite = remover.remove_keywords(self.suite)
         self.suite, self.strings \
                 = remover.remove_unused_strings(self.suite, self.strings)
@@ -49,6 +52,9 @@ class JsExecutionResult(object):
 
 class _KeywordRemover(object):
 
+    def __init__(self, compression_level=9):
+        self._compression_level = compression_level
+
     def remove_keywords(self, suite):
         return self._remove_keywords_from_suite(suite)
 
@@ -82,11 +88,14 @@ class _KeywordRemover(object):
                     yield i
 
     def _get_used_strings(self, strings, used_indices, remap):
+        # Strings in compressed blocks are compressed separately to avoid
+        # retaining whole blocks.
+        decoder = BlockDecoder(strings, self._compression_level)
         offset = 0
         for index, string in enumerate(strings):
             if index in used_indices:
                 remap[index] = index - offset
-                yield string
+                yield decoder.decode(string)
             else:
                 offset += 1
 
@@ -23,9 +23,11 @@ from .jsexecutionresult import JsExecutionResult
 class JsModelBuilder(object):
 
     def __init__(self, log_path=None, split_log=False,
-                 prune_input_to_save_memory=False):
+                 prune_input_to_save_memory=False, compression_level=9,
+                 compress_blocks=False):
         self._context = JsBuildingContext(log_path, split_log,
-                                          prune_input_to_save_memory)
+                                          prune_input_to_save_memory,
+                                          compression_level, compress_blocks)
 
     def build_from(self, result_from_xml):
         # Statistics must be build first because building suite may prune input.
@@ -36,7 +38,9 @@ class JsModelBuilder(object):
             strings=self._context.strings,
             basemillis=self._context.basemillis,
             split_results=self._context.split_results,
-            min_level=self._context.min_level
+            split_log=self._context.end_split_log(),
+            min_level=self._context.min_level,
+            compression_level=self._context.compression_level
         )
 
 
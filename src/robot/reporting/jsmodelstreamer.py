@@ -0,0 +1,274 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Builds the JS model directly from XML events without full result model.
+
+Keywords and messages are converted to the JS model as soon as their XML
+elements end and are then discarded. Only a skeleton of suites and tests,
+containing suite setups and teardowns without their content, is kept in
+memory because suite teardown failures, statistics and configuring results
+need it.
+"""
+
+from robot.errors import DataError
+from robot.output.loggerhelper import IsLogged
+from robot.result.executionresult import Result, CombinedResult
+from robot.result.keyword import Keyword
+from robot.result.resultbuilder import ExecutionResultBuilder
+from robot.result.xmlelementhandlers import (RootHandler, RobotHandler,
+    SuiteHandler, RootSuiteHandler, TestCaseHandler, KeywordHandler,
+    MessageHandler, DocHandler, MetadataHandler, TagsHandler,
+    ArgumentsHandler, SuiteStatusHandler, TestStatusHandler,
+    KeywordStatusHandler, StatisticsHandler, ErrorsHandler)
+from robot.utils import ETSource
+
+from .jsbuildingcontext import JsBuildingContext
+from .jsexecutionresult import JsExecutionResult
+from .jsmodelbuilders import (SuiteBuilder, TestBuilder, KeywordBuilder,
+                              StatisticsBuilder, ErrorsBuilder)
+
+
+class StreamingJsModelBuilder(object):
+
+    def __init__(self, log_path=None, split_log=False, log_level='TRACE',
+                 compression_level=9, compress_blocks=False):
+        self._context = JsBuildingContext(log_path, split_log,
+                                          compression_level=compression_level,
+                                          compress_blocks=compress_blocks)
+        self._streamer = KeywordStreamer(self._context, log_level)
+
+    def parse(self, *sources):
+        """Reads given output files to a result without keyword content.
+
+        Returned result can be configured normally before it is given
+        to :meth:`build_from`.
+        """
+        if not sources:
+            raise DataError('One or more data source needed.')
+        if len(sources) == 1:
+            return self._parse(sources[0], Result(sources[0]))
+        result = CombinedResult()
+        for source in sources:
+            suite = result.suite.suites.create()
+            result.errors.add(self._parse(source, Result(source, suite)).errors)
+        return result
+
+    def _parse(self, source, result):
+        source = ETSource(source)
+        builder = ExecutionResultBuilder(source, _RootHandler(self._streamer))
+        try:
+            return builder.build(result)
+        except DataError, err:
+            raise DataError("Reading XML source '%s' failed: %s"
+                            % (unicode(source), unicode(err)))
+
+    def build_from(self, result):
+        context = self._context
+        keywords = self._streamer.keywords
+        return JsExecutionResult(
+            statistics=StatisticsBuilder().build(result.statistics),
+            suite=StreamedSuiteBuilder(context, keywords).build(result.suite),
+            errors=ErrorsBuilder(context).build(result.errors),
+            strings=context.strings,
+            basemillis=context.basemillis,
+            split_results=context.split_results,
+            split_log=context.end_split_log(),
+            min_level=context.min_level,
+            compression_level=context.compression_level
+        )
+
+
+class KeywordStreamer(object):
+
+    def __init__(self, context, log_level='TRACE'):
+        self._context = context
+        self._build_keyword = StreamedKeywordBuilder(context).build
+        self.is_logged = IsLogged(log_level or 'TRACE')
+        self.keywords = {}
+        self._open = []
+
+    def start_test(self, test):
+        splitting = self._context.start_splitting_if_needed(split=True)
+        self._open.append(_OpenItem(test.id, splitting))
+
+    def end_test(self, test):
+        self.keywords[test] = self._end(self._open.pop())
+
+    def start_keyword(self, kw, parent):
+        if self._open:
+            kw.id = '%s-k%d' % (self._open[-1].id,
+                                len(self._open[-1].keywords) + 1)
+            splitting = False
+        else:
+            parent.keywords.append(kw)
+            kw.id = '%s-k%d' % (parent.id, len(parent.keywords))
+            splitting = self._context.start_splitting_if_needed(split=True)
+        self._open.append(_OpenItem(kw.id, splitting))
+        return kw
+
+    def end_keyword(self, kw):
+        model = self._build_keyword(kw, self._end(self._open.pop()))
+        kw.messages = []
+        if self._open:
+            self._open[-1].keywords.append(model)
+        else:
+            self.keywords[kw] = model
+
+    def _end(self, item):
+        model = tuple(item.keywords)
+        return model if not item.splitting \
+            else self._context.end_splitting(model)
+
+
+class _OpenItem(object):
+
+    def __init__(self, id, splitting=False):
+        self.id = id
+        self.splitting = splitting
+        self.keywords = []
+
+
+class StreamedKeyword(Keyword):
+    __slots__ = ['id']
+
+
+class StreamedKeywordBuilder(KeywordBuilder):
+
+    def build(self, kw, keywords):
+        return (self._types[kw.type],
+                self._string(kw.name),
+                self._string(kw.timeout),
+                self._html(kw.doc),
+                self._string(', '.join(kw.args)),
+                self._get_status(kw),
+                keywords,
+                tuple(self._build_message(m) for m in kw.messages))
+
+
+class StreamedSuiteBuilder(SuiteBuilder):
+
+    def __init__(self, context, keywords):
+        SuiteBuilder.__init__(self, context)
+        self._build_test = StreamedTestBuilder(context, keywords).build
+        self._build_keyword = self._get_keyword
+        self._keywords = keywords
+
+    def _get_keyword(self, kw, split=False):
+        return self._keywords.pop(kw)
+
+
+class StreamedTestBuilder(TestBuilder):
+
+    def __init__(self, context, keywords):
+        TestBuilder.__init__(self, context)
+        self._keywords = keywords
+
+    def build(self, test):
+        return (self._string(test.name),
+                self._string(test.timeout),
+                int(test.critical),
+                self._html(test.doc),
+                tuple(self._string(t) for t in test.tags),
+                self._get_status(test),
+                self._keywords.pop(test))
+
+
+class _RootHandler(RootHandler):
+
+    def __init__(self, streamer):
+        self._streamer = streamer
+        RootHandler.__init__(self)
+
+    def _children(self):
+        return [_RobotHandler(self._streamer)]
+
+
+class _RobotHandler(RobotHandler):
+
+    def __init__(self, streamer):
+        self._streamer = streamer
+        RobotHandler.__init__(self)
+
+    def _children(self):
+        return [_RootSuiteHandler(self._streamer), StatisticsHandler(),
+                ErrorsHandler()]
+
+
+class _SuiteHandler(SuiteHandler):
+
+    def __init__(self, streamer):
+        self._streamer = streamer
+        SuiteHandler.__init__(self)
+
+    def _children(self):
+        return [DocHandler(), MetadataHandler(), SuiteStatusHandler(),
+                _KeywordHandler(self._streamer),
+                _TestCaseHandler(self._streamer), self]
+
+
+class _RootSuiteHandler(_SuiteHandler, RootSuiteHandler):
+
+    def _children(self):
+        return _SuiteHandler._children(self)[:-1] \
+                + [_SuiteHandler(self._streamer)]
+
+
+class _TestCaseHandler(TestCaseHandler):
+
+    def __init__(self, streamer):
+        self._streamer = streamer
+        TestCaseHandler.__init__(self)
+
+    def start(self, elem, result):
+        test = TestCaseHandler.start(self, elem, result)
+        self._streamer.start_test(test)
+        return test
+
+    def end(self, elem, test):
+        self._streamer.end_test(test)
+
+    def _children(self):
+        return [DocHandler(), TagsHandler(), TestStatusHandler(),
+                _KeywordHandler(self._streamer)]
+
+
+class _KeywordHandler(KeywordHandler):
+
+    def __init__(self, streamer):
+        self._streamer = streamer
+        KeywordHandler.__init__(self)
+
+    def start(self, elem, result):
+        kw = StreamedKeyword(name=elem.get('name'),
+                             timeout=elem.get('timeout'),
+                             type=elem.get('type'))
+        return self._streamer.start_keyword(kw, result)
+
+    def end(self, elem, kw):
+        self._streamer.end_keyword(kw)
+
+    def _children(self):
+        return [DocHandler(), ArgumentsHandler(), KeywordStatusHandler(),
+                _MessageHandler(self._streamer.is_logged), self]
+
+
+class _MessageHandler(MessageHandler):
+
+    def __init__(self, is_logged):
+        self._is_logged = is_logged
+        MessageHandler.__init__(self)
+
+    def end(self, elem, result):
+        if self._is_logged(elem.get('level')):
+            MessageHandler.end(self, elem, result)
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import codecs
 import os
 
 from robot.htmldata import JsonWriter
@@ -107,3 +108,68 @@ class SplitLogWriter(object):
         self._writer.write_json('window.keywords%d = ' % index, keywords)
         self._writer.write_json('window.strings%d = ' % index, strings)
         self._writer.write('window.fileLoading.notify("%s")' % notify)
+
+
+class SplitLogChunkWriter(object):
+    """Writes split log parts to chunk files as soon as they are built.
+
+    Consecutive parts are written into the same chunk file until its size
+    exceeds `chunk_size` bytes. `chunks` contains the index of the first
+    part in each chunk file and is needed by the log file to know which
+    file to load. Possible error when writing is stored to `error` and
+    later parts are ignored.
+    """
+
+    def __init__(self, base, chunk_size=1024*1024):
+        self._base = base
+        self._chunk_size = chunk_size
+        self._output = None
+        self._writer = None
+        self._path = None
+        self._parts = 0
+        self.chunks = []
+        self.error = None
+
+    def write(self, keywords, strings):
+        self._parts += 1
+        if not self.error:
+            try:
+                self._write(keywords, strings, self._parts)
+            except EnvironmentError, err:
+                self._close_output()
+                self.error = err
+        return self._parts
+
+    def _write(self, keywords, strings, index):
+        if not self._output:
+            self._open_chunk(index)
+        self._writer.write_json('window.keywords%d = ' % index, keywords)
+        self._writer.write_json('window.strings%d = ' % index, strings)
+        if self._output.tell() >= self._chunk_size:
+            self._close_chunk()
+
+    def _open_chunk(self, index):
+        self.chunks.append(index)
+        self._path = '%s-%d.js' % (self._base, len(self.chunks))
+        self._output = codecs.open(self._path, 'wb', encoding='UTF-8')
+        self._writer = JsonWriter(self._output)
+
+    def _close_chunk(self):
+        notify = os.path.basename(self._path)
+        self._writer.write('window.fileLoading.notify("%s")' % notify)
+        self._close_output()
+
+    def _close_output(self):
+        if self._output:
+            self._output.close()
+            self._output = None
+
+    def close(self):
+        if self.error:
+            return
+        try:
+            if self._output:
+                self._close_chunk()
+        except EnvironmentError, err:
+            self._close_output()
+            self.error = err
@@ -49,7 +49,12 @@ class RobotModelWriter(ModelWriter):
 class LogWriter(_LogReportWriter):
 
     def write(self, path, config):
+        split_log = self._js_model.split_log
+        if split_log:
+            config = dict(config, splitLogChunks=split_log.chunks)
         self._write_file(path, config, LOG)
+        if split_log and split_log.error:
+            raise split_log.error
         if self._js_model.split_results:
             self._write_split_logs(splitext(path)[0])
 
@@ -0,0 +1,93 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+
+try:
+    from multiprocessing import Pipe, Process
+except ImportError:  # Not available on Jython and IronPython
+    Process = None
+
+from robot.errors import DataError
+
+
+class ParallelWriter(object):
+    """Runs functions writing result files in separate processes.
+
+    Processes are started using `fork`, which gives them a copy of the data
+    to write without serializing it. This also means that the caller is
+    free to modify the data after a function using it has been started.
+
+    Functions must return a picklable outcome that is passed to the
+    `notify` callback in the main process. Outcomes are notified in the
+    order functions were given regardless the order they finish in.
+    Possible exceptions are re-raised in the main process. If processes
+    cannot be forked or there is only one process, functions are simply
+    run one after another.
+    """
+
+    def __init__(self, notify, processes=1):
+        self._notify = notify
+        self._processes = processes if self._can_fork() else 1
+        self._running = []
+
+    def _can_fork(self):
+        return Process is not None and hasattr(os, 'fork')
+
+    def write(self, function, *args):
+        if self._processes < 2:
+            self._notify(function(*args))
+            return
+        if len(self._running) == self._processes:
+            self._wait_oldest()
+        receiver, sender = Pipe(duplex=False)
+        process = Process(target=_write, args=(sender, function, args))
+        process.start()
+        sender.close()
+        self._running.append((process, receiver))
+
+    def close(self):
+        """Waits until all functions have finished."""
+        while self._running:
+            self._wait_oldest()
+
+    def _wait_oldest(self):
+        failed, outcome = self._wait(*self._running.pop(0))
+        if failed:
+            while self._running:
+                self._wait(*self._running.pop(0))
+            raise outcome
+        self._notify(outcome)
+
+    def _wait(self, process, receiver):
+        try:
+            return receiver.recv()
+        except EOFError:
+            return True, DataError('Writing results in a separate process '
+                                   'failed unexpectedly.')
+        finally:
+            receiver.close()
+            process.join()
+
+
+def _write(sender, function, args):
+    try:
+        result = False, function(*args)
+    except Exception, err:
+        result = True, err
+    try:
+        sender.send(result)
+    except Exception, err:  # Exception may not be picklable
+        sender.send((True, DataError(unicode(result[1]))))
+    sender.close()
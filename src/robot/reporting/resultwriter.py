@@ -15,9 +15,15 @@
 from robot.errors import DataError
 from robot.output import LOGGER
 from robot.result import ExecutionResult
+from robot.result.executionresult import Result
+from robot.result.binaryformat import BinaryOutputWriter, is_binary_result
+from robot.result.parallelbuilder import ParallelResultBuilder
 
 from .jsmodelbuilders import JsModelBuilder
+from .jsmodelstreamer import StreamingJsModelBuilder
 from .logreportwriters import LogWriter, ReportWriter
+from .parallelwriter import ParallelWriter
+from .xunitstreamer import XUnitStreamer
 from .xunitwriter import XUnitWriter
 
 
@@ -28,34 +34,65 @@ class ResultWriter(object):
 
     def write_results(self, settings, results=None):
         results = results or Results(self._data_sources, settings)
+        writer = ParallelWriter(self._notify, settings.processes)
         if settings.output:
-            self._write_output(results.result, settings.output)
-        if settings.xunit:
-            self._write_xunit(results.result, settings.xunit)
+            writer.write(self._write_output, results.result, settings.output)
+        if settings.binary_output:
+            writer.write(self._write_binary_output, results.result,
+                         settings.binary_output)
+        if settings.xunit and results.xunit_can_be_streamed:
+            self._notify(self._stream_xunit(results, settings.xunit))
+        elif settings.xunit:
+            writer.write(self._write_xunit, results.result, settings.xunit)
         if settings.log:
             config = dict(settings.log_config, minLevel=results.js_result.min_level)
-            self._write_log(results.js_result, settings.log, config)
+            writer.write(self._write_log, results.js_result, settings.log, config)
         if settings.report:
-            results.js_result.remove_data_not_needed_in_report()
-            self._write_report(results.js_result, settings.report, settings.report_config)
+            writer.write(self._write_report, results.js_result, settings.report,
+                         settings.report_config)
+        writer.close()
         return results.return_code
 
+    def _notify(self, outcome):
+        # Outcome is either an error message or name and path of a written
+        # file. Files may be written in separate processes, and only the
+        # outcome is returned to the main process to be logged.
+        if isinstance(outcome, basestring):
+            LOGGER.error(outcome)
+        else:
+            LOGGER.output_file(*outcome)
+
     def _write_output(self, result, path):
         try:
             result.save(path)
         except DataError, err:
-            LOGGER.error(unicode(err))
-        else:
-            LOGGER.output_file('Output', path)
+            return unicode(err)
+        return 'Output', path
+
+    def _write_binary_output(self, result, path):
+        try:
+            result.visit(BinaryOutputWriter(path))
+        except DataError, err:
+            return unicode(err)
+        return 'Binary', path
 
     def _write_xunit(self, result, path):
         try:
             result.visit(XUnitWriter(path))
         except EnvironmentError, err:
-            LOGGER.error("Opening XUnit result file '%s' failed: %s"
-                         % (path, err.strerror))
-        else:
-            LOGGER.output_file('XUnit', path)
+            return self._xunit_error(path, err)
+        return 'XUnit', path
+
+    def _stream_xunit(self, results, path):
+        try:
+            results.stream_xunit(path)
+        except EnvironmentError, err:
+            return self._xunit_error(path, err)
+        return 'XUnit', path
+
+    def _xunit_error(self, path, err):
+        return ("Opening XUnit result file '%s' failed: %s"
+                % (path, err.strerror))
 
     def _write_log(self, js_result, path, config):
         try:
@@ -63,17 +100,16 @@ class ResultWriter(object):
         except EnvironmentError, err:
             # Cannot use err.filename due to http://bugs.jython.org/issue1825
             # and thus error has wrong file name if writing split log fails.
-            LOGGER.error("Writing log file '%s' failed: %s" % (path, err.strerror))
-        else:
-            LOGGER.output_file('Log', path)
+            return "Writing log file '%s' failed: %s" % (path, err.strerror)
+        return 'Log', path
 
     def _write_report(self, js_result, path, config):
+        js_result.remove_data_not_needed_in_report()
         try:
             ReportWriter(js_result).write(path, config)
         except EnvironmentError, err:
-            LOGGER.error("Writing report file '%s' failed: %s" % (path, err.strerror))
-        else:
-            LOGGER.output_file('Report', path)
+            return "Writing report file '%s' failed: %s" % (path, err.strerror)
+        return 'Report', path
 
 
 class Results(object):
@@ -89,19 +125,80 @@ class Results(object):
     @property
     def result(self):
         if self._result is None:
-            self._result = ExecutionResult(*self._data_sources)
-            self._result.configure(self._settings.status_rc,
-                                   self._settings.suite_config,
-                                   self._settings.statistics_config)
-            self.return_code = self._result.return_code
+            self._result = self._configure(self._build_result())
         return self._result
 
+    def _build_result(self):
+        # Data source can also be an already built result, such as
+        # an incrementally combined result.
+        if self._prebuilt_result:
+            return self._data_sources[0]
+        if self._parallel:
+            builder = ParallelResultBuilder(self._settings.processes)
+            return builder.build(*self._data_sources)
+        return ExecutionResult(*self._data_sources)
+
+    @property
+    def _prebuilt_result(self):
+        return isinstance(self._data_sources[0], Result)
+
+    @property
+    def _parallel(self):
+        return self._settings.processes > 1 and len(self._data_sources) > 1
+
+    def _configure(self, result):
+        result.configure(self._settings.status_rc,
+                         self._settings.suite_config,
+                         self._settings.statistics_config)
+        self.return_code = result.return_code
+        return result
+
     @property
     def js_result(self):
         if self._js_result is None:
-            builder = JsModelBuilder(log_path=self._settings.log,
-                                     split_log=self._settings.split_log,
-                                     prune_input_to_save_memory=True)
-            self._js_result = builder.build_from(self.result)
+            if self._result is None and self._can_stream():
+                self._js_result = self._build_js_result_by_streaming()
+            else:
+                builder = JsModelBuilder(log_path=self._settings.log,
+                                         split_log=self._settings.split_log,
+                                         prune_input_to_save_memory=True,
+                                         **self._settings.compression_config)
+                self._js_result = builder.build_from(self.result)
             self._result = None
         return self._js_result
+
+    def _can_stream(self):
+        # Filtering and removing keywords need the full result model.
+        # Binary outputs and outputs read in parallel are read directly
+        # into the model.
+        config = self._settings.suite_config
+        if self._prebuilt_result or self._parallel:
+            return False
+        if any(is_binary_result(source) for source in self._data_sources):
+            return False
+        return not any(config.get(name) for name in
+                       ('include_tags', 'exclude_tags', 'include_suites',
+                        'include_tests', 'remove_keywords'))
+
+    @property
+    def xunit_can_be_streamed(self):
+        # Streaming is used only when no other output needs the result.
+        settings = self._settings
+        if self._result is not None or settings.output or \
+                settings.binary_output or settings.log or settings.report:
+            return False
+        return self._can_stream()
+
+    def stream_xunit(self, path):
+        streamer = XUnitStreamer(path, **self._settings.suite_config)
+        failed = streamer.stream(*self._data_sources)
+        self.return_code = min(failed, 250) if self._settings.status_rc else 0
+
+    def _build_js_result_by_streaming(self):
+        builder = StreamingJsModelBuilder(
+            log_path=self._settings.log,
+            split_log=self._settings.split_log,
+            log_level=self._settings.suite_config.get('log_level'),
+            **self._settings.compression_config)
+        result = self._configure(builder.parse(*self._data_sources))
+        return builder.build_from(result)
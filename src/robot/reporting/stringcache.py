@@ -12,9 +12,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from operator import itemgetter
+from hashlib import md5
 
-from robot.utils import compress_text
+from robot.utils import compress_text, decompress_text
 
 
 class StringIndex(long):
@@ -28,26 +28,89 @@ class StringIndex(long):
 
 
 class StringCache(object):
+    """Collects strings used by log and report and assigns them indices.
+
+    Long strings are compressed if that makes them shorter. Duplicates are
+    detected before compressing based on a hash of the string, so every
+    unique string is compressed only once.
+
+    :param compression_level: zlib compression level from 0 to 9. Level 0
+        disables compression altogether.
+    :param compress_blocks: When true, long strings are compressed together
+        in blocks of about `block_size` characters. Compressing blocks is
+        considerably faster than compressing strings one by one, and similar
+        strings compress better together. Blocks are stored in the string
+        table and strings in them are replaced with references in format
+        `#<block index>:<position in block>`.
+    """
     _compress_threshold = 80
     _use_compressed_threshold = 1.1
     _zero_index = StringIndex(0)
 
-    def __init__(self):
+    def __init__(self, compression_level=9, compress_blocks=False,
+                 block_size=64*1024):
         self._cache = {'*': self._zero_index}
+        self._compressed = {}
+        self._strings = ['*']
+        self._level = compression_level
+        self._block = [] if compress_blocks else None
+        self._block_size = block_size
+        self._block_length = 0
 
     def add(self, text):
         if not text:
             return self._zero_index
-        text = self._encode(text)
-        if text not in self._cache:
-            self._cache[text] = StringIndex(len(self._cache))
-        return self._cache[text]
+        raw = self._raw(text)
+        if raw in self._cache:
+            return self._cache[raw]
+        if len(raw) < self._compress_threshold or not self._level:
+            return self._add_raw(raw)
+        key = md5(text.encode('UTF-8')).digest()
+        if key not in self._compressed:
+            self._compressed[key] = self._add_compressed(text)
+        return self._compressed[key]
+
+    def _add_raw(self, raw):
+        index = self._cache[raw] = self._add_string(raw)
+        return index
+
+    def _add_string(self, string):
+        self._strings.append(string)
+        return StringIndex(len(self._strings) - 1)
+
+    def _add_compressed(self, text):
+        if self._block is None or '\x00' in text:
+            return self._add_string(self._encode(text))
+        index = self._add_string(None)
+        self._block.append((index, text))
+        self._block_length += len(text)
+        if self._block_length >= self._block_size:
+            self._compress_block()
+        return index
+
+    def _compress_block(self):
+        block, self._block, self._block_length = self._block, [], 0
+        if len(block) == 1:
+            index, text = block[0]
+            self._strings[index] = self._encode(text)
+            return
+        raw = [self._raw(text) for _, text in block]
+        compressed = compress_text(u'\x00'.join(text for _, text in block),
+                                   self._level)
+        if len(compressed) * self._use_compressed_threshold \
+                >= sum(len(r) for r in raw):
+            for (index, _), string in zip(block, raw):
+                self._strings[index] = string
+            return
+        block_index = self._add_string(compressed)
+        for position, (index, _) in enumerate(block):
+            self._strings[index] = '#%d:%d' % (block_index, position)
 
     def _encode(self, text):
         raw = self._raw(text)
-        if raw in self._cache or len(raw) < self._compress_threshold:
+        if len(raw) < self._compress_threshold or not self._level:
             return raw
-        compressed = compress_text(text)
+        compressed = compress_text(text, self._level)
         if len(compressed) * self._use_compressed_threshold < len(raw):
             return compressed
         return raw
@@ -56,5 +119,31 @@ class StringCache(object):
         return '*'+text
 
     def dump(self):
-        return tuple(item[0] for item in sorted(self._cache.iteritems(),
-                                                key=itemgetter(1)))
+        if self._block:
+            self._compress_block()
+        return tuple(self._strings)
+
+
+class BlockDecoder(object):
+    """Replaces references to compressed blocks with the actual strings.
+
+    Needed when only some of the strings are used, because otherwise whole
+    blocks would need to be retained.
+    """
+
+    def __init__(self, strings, compression_level=9):
+        self._strings = strings
+        self._encode = StringCache(compression_level)._encode
+        self._blocks = {}
+
+    def decode(self, string):
+        if not string.startswith('#'):
+            return string
+        block, position = string[1:].split(':')
+        return self._encode(self._get_block(int(block))[int(position)])
+
+    def _get_block(self, index):
+        if index not in self._blocks:
+            block = decompress_text(self._strings[index])
+            self._blocks[index] = block.split(u'\x00')
+        return self._blocks[index]
@@ -0,0 +1,173 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Writes xUnit outputs from output XML files without building the model.
+
+Tests are given to :class:`~robot.output.xunitlogger.StreamingXUnitWriter`
+one by one so that the memory usage does not depend on the number of tests
+or keywords. The same writer is used by
+:class:`~robot.output.xunitlogger.XUnitLogger` during test execution.
+"""
+
+from __future__ import with_statement
+import os
+
+from robot import utils
+from robot.errors import DataError
+from robot.model import Criticality, Tags
+from robot.output.loggerhelper import IsLogged
+from robot.output.xunitlogger import StreamingXUnitWriter
+from robot.utils import ET, ETSource
+
+
+class XUnitStreamer(object):
+    """Writes an xUnit output by streaming events from output XML files.
+
+    Accepts the same configuration as
+    :class:`~robot.result.configurer.SuiteConfigurer` except for options
+    that select tests or remove keywords, which need the full model.
+    """
+
+    def __init__(self, output, name=None, set_tags=None, log_level=None,
+                 critical=None, noncritical=None, process_empty_suite=False,
+                 **ignored):
+        self._output = output
+        self._name = name
+        set_tags = set_tags or []
+        self._add_tags = [t for t in set_tags if not t.startswith('-')]
+        self._remove_tags = [t[1:] for t in set_tags if t.startswith('-')]
+        self._criticality = Criticality(critical, noncritical)
+        self._debug_is_logged = IsLogged(log_level or 'TRACE')('DEBUG')
+        self._process_empty_suite = process_empty_suite
+
+    def stream(self, *sources):
+        """Writes the output and returns the number of failed critical tests.
+
+        Raises a `DataError` if a source cannot be read or if there are no
+        tests and empty suites are not processed. An `EnvironmentError` is
+        raised if the output cannot be written.
+        """
+        if not sources:
+            raise DataError('One or more data source needed.')
+        writer = StreamingXUnitWriter(self._output)
+        if len(sources) == 1:
+            self._parse(sources[0], writer, self._name)
+        else:
+            writer.start_suite(self._name)
+            names = [self._parse(source, writer) for source in sources]
+            writer.end_suite()
+            writer.name = self._name or ' & '.join(names)
+        if not (writer.test_count or self._process_empty_suite):
+            raise DataError("Suite '%s' contains no tests." % writer.name)
+        writer.close()
+        return writer.critical_failed
+
+    def _parse(self, source, writer, name=None):
+        handler = _XUnitHandler(writer, name, self._is_critical,
+                                self._debug_is_logged)
+        source = ETSource(source)
+        try:
+            with source as src:
+                for event, elem in ET.iterparse(src, events=('start', 'end')):
+                    handler.start(elem) if event == 'start' else handler.end(elem)
+        except DataError, err:
+            raise DataError("Reading XML source '%s' failed: %s"
+                            % (unicode(source), unicode(err)))
+        return handler.name
+
+    def _is_critical(self, elem):
+        tags = Tags([tag.text or '' for tag in elem.findall('tags/tag')])
+        if self._add_tags:
+            tags.add(self._add_tags)
+        if self._remove_tags:
+            tags.remove(self._remove_tags)
+        return self._criticality.test_is_critical(_Test(tags))
+
+
+class _Test(object):
+
+    def __init__(self, tags):
+        self.tags = tags
+
+
+class _XUnitHandler(object):
+    """Handles XML events and discards elements as soon as they end."""
+    _discarded = ('msg', 'kw', 'test', 'suite', 'statistics', 'errors')
+
+    def __init__(self, writer, name, is_critical, debug_is_logged):
+        self._writer = writer
+        self._root_name = name
+        self._is_critical = is_critical
+        self._debug_is_logged = debug_is_logged
+        self._elements = []
+        self._teardown_failed = []
+        self._details = None
+        self._handle_teardowns = True
+        self.name = None
+
+    def start(self, elem):
+        tag = elem.tag
+        if tag == 'robot':
+            generator = elem.get('generator', 'unknown').split()[0].upper()
+            self._handle_teardowns = generator == 'ROBOT'
+        elif tag == 'suite' and self._elements[-1].tag != 'statistics':
+            name = elem.get('name', '')
+            if not self._teardown_failed:
+                name = self.name = self._root_name or name
+            self._writer.start_suite(name)
+            self._teardown_failed.append(False)
+        elif tag == 'test':
+            self._details = []
+        self._elements.append(elem)
+
+    def end(self, elem):
+        self._elements.pop()
+        tag = elem.tag
+        if tag == 'msg':
+            if self._details is not None and self._debug_is_logged \
+                    and elem.get('level') == 'DEBUG':
+                self._details.append((elem.text or '') + os.linesep)
+        elif tag == 'kw':
+            if self._details is None and elem.get('type') == 'teardown' \
+                    and self._elements[-1].tag == 'suite':
+                self._teardown_failed[-1] = self._failed(elem)
+        elif tag == 'test':
+            self._end_test(elem)
+        elif tag == 'suite' and self._elements[-1].tag != 'statistics':
+            failed = self._teardown_failed.pop()
+            self._writer.end_suite(failed and self._handle_teardowns)
+        if tag in self._discarded and self._elements:
+            self._elements[-1].remove(elem)
+            elem.clear()
+
+    def _failed(self, elem):
+        status = elem.find('status')
+        return status is None or status.get('status', 'FAIL') != 'PASS'
+
+    def _end_test(self, elem):
+        status = elem.find('status')
+        if status is None:
+            status = ET.Element('status')
+        self._writer.test(elem.get('name'),
+                          utils.get_elapsed_time(self._time(status, 'starttime'),
+                                                 self._time(status, 'endtime')),
+                          status.get('status', 'FAIL') == 'PASS',
+                          status.text or '',
+                          ''.join(self._details),
+                          self._is_critical(elem))
+        self._details = None
+
+    def _time(self, elem, name):
+        timestamp = elem.get(name, 'N/A')
+        return timestamp if timestamp != 'N/A' else None
@@ -0,0 +1,232 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Compact binary alternative for output.xml.
+
+A binary output file starts with a magic string and a format version. It is
+followed by zlib compressed records that each consist of a record type,
+number of fields, and the fields themselves. All these are unsigned 32-bit
+little-endian integers so that they can be read using :mod:`array` without
+decoding them one by one. Bigger values are written as `0xFFFFFFFF` followed
+by their low and high 32 bits. Strings are stored as indices to a string
+table that is written, zlib compressed, after the records. The last eight
+bytes contain the offset of the string table. Index 0 means `None`.
+
+Timestamps are stored as difference to the previously written timestamp
+in milliseconds. Timestamps not in the normal format are stored in the
+string table. Statistics are not written because they are always
+recalculated from the results.
+
+Combined results created with :mod:`~robot.result.incremental` also
+contain input records that identify the outputs they were created from.
+Readers not interested in them can ignore these records.
+
+Binary outputs are written using
+:class:`~robot.output.binarylogger.BinaryWriter`, which implements the same
+interface as :class:`~robot.utils.markupwriters.XmlWriter` and can thus be
+used by :class:`~robot.output.xmllogger.XmlLogger` based classes. Reading
+them is done with :class:`BinaryResultBuilder`.
+"""
+
+from __future__ import with_statement
+import time
+import zlib
+import struct
+
+from robot.errors import DataError
+from robot.output.binarylogger import (MAGIC, HEADER, FOOTER, ROBOT, SUITE,
+                                       TEST, KEYWORD, END, DOC, METADATA, TAGS,
+                                       ARGS, STATUS, MESSAGE, ERRORS, INPUT,
+                                       BinaryWriter, decode_integers)
+from robot.reporting.outputwriter import OutputWriter
+
+from .message import Messages
+from .suiteteardownfailed import SuiteTeardownFailureHandler
+
+
+def is_binary_result(source):
+    """Returns `True` if `source` is a path to a binary output file."""
+    if not isinstance(source, basestring):
+        return False
+    try:
+        with open(source, 'rb') as binary:
+            return binary.read(len(MAGIC)) == MAGIC
+    except (IOError, OSError, TypeError):
+        return False
+
+
+def xml_to_binary(source, target):
+    """Converts output.xml `source` to binary output file `target`."""
+    from .resultbuilder import ExecutionResult
+    ExecutionResult(source).visit(BinaryOutputWriter(target))
+
+
+def binary_to_xml(source, target):
+    """Converts binary output file `source` to output.xml `target`."""
+    from .resultbuilder import ExecutionResult
+    ExecutionResult(source).save(target)
+
+
+class BinaryOutputWriter(OutputWriter):
+    """Writes binary output file based on a result object."""
+
+    def _create_writer(self, path):
+        return BinaryWriter(path)
+
+
+class BinaryResultBuilder(object):
+    """Builds :class:`~.executionresult.Result` from a binary output file."""
+
+    def __init__(self, source):
+        self._source = source
+        self.inputs = []
+
+    def build(self, result):
+        strings, fields = self._read()
+        self._build(result, strings, fields)
+        SuiteTeardownFailureHandler(result.generator).visit_suite(result.suite)
+        return result
+
+    def _read(self):
+        try:
+            with open(self._source, 'rb') as source:
+                data = source.read()
+        except EnvironmentError, err:
+            raise DataError(err.strerror)
+        if data[:len(MAGIC)] != MAGIC:
+            raise DataError('Not a binary output file.')
+        if data[len(MAGIC):len(HEADER)] != HEADER[-1]:
+            raise DataError('Unsupported binary output version %d.'
+                            % ord(data[len(MAGIC)]))
+        try:
+            offset = FOOTER.unpack(data[-FOOTER.size:])[0]
+            table = zlib.decompress(data[offset:-FOOTER.size])
+            fields = decode_integers(zlib.decompress(data[len(HEADER):offset]))
+        except (struct.error, zlib.error, ValueError, IndexError):
+            raise DataError('File is incomplete or corrupted.')
+        strings = [None] + table.decode('UTF-8').split(u'\x00')
+        return strings, fields
+
+    def _build(self, result, strings, fields):
+        timestamps = _TimestampDecoder(strings)
+        stack = [result]
+        current = result
+        messages = None
+        index = 0
+        length = len(fields)
+        try:
+            while index < length:
+                type = fields[index]
+                start = index + 2
+                index = start + fields[index+1]
+                if type == MESSAGE:
+                    text, level, html, timestamp = fields[start:index]
+                    if messages is None:
+                        messages = current.messages
+                        packed = isinstance(messages, Messages)
+                    if packed and not timestamp & 1:
+                        messages.append_with_millis(strings[text] or '',
+                                                    strings[level], bool(html),
+                                                    timestamps.millis(timestamp))
+                    else:
+                        messages.create(strings[text] or '', strings[level],
+                                        bool(html), timestamps.decode(timestamp))
+                    continue
+                messages = None
+                if type == END:
+                    stack.pop()
+                    current = stack[-1]
+                elif type == KEYWORD:
+                    name, kw_type, timeout = fields[start:index]
+                    current = current.keywords.create(name=strings[name],
+                                                      type=strings[kw_type],
+                                                      timeout=strings[timeout])
+                    stack.append(current)
+                elif type == STATUS:
+                    status, message, starttime, endtime = fields[start:index]
+                    if status:
+                        current.status = strings[status]
+                    if message:
+                        current.message = strings[message]
+                    current.starttime = timestamps.decode(starttime)
+                    current.endtime = timestamps.decode(endtime)
+                elif type == ARGS:
+                    current.args = [strings[arg] or ''
+                                    for arg in fields[start:index]]
+                elif type == DOC:
+                    current.doc = strings[fields[start]] or ''
+                elif type == TAGS:
+                    current.tags = [strings[tag] or ''
+                                    for tag in fields[start:index]]
+                elif type == TEST:
+                    name, timeout = fields[start:index]
+                    current = current.tests.create(name=strings[name],
+                                                   timeout=strings[timeout])
+                    stack.append(current)
+                elif type == SUITE:
+                    current = self._create_suite(current, result,
+                                                 strings[fields[start]],
+                                                 strings[fields[start+1]])
+                    stack.append(current)
+                elif type == METADATA:
+                    name, value = fields[start:index]
+                    current.metadata[strings[name]] = strings[value] or ''
+                elif type == ERRORS:
+                    current = result.errors
+                    stack.append(current)
+                elif type == ROBOT:
+                    generator = strings[fields[start]] or 'unknown'
+                    result.generator = generator.split()[0].upper()
+                elif type == INPUT:
+                    path, signature = fields[start:index]
+                    self.inputs.append((strings[path], strings[signature]))
+        except (IndexError, ValueError, AttributeError):
+            raise DataError('File is incomplete or corrupted.')
+
+    def _create_suite(self, parent, result, name, source):
+        if parent is result:
+            suite = result.suite
+            suite.name = name
+            suite.source = source
+            return suite
+        return parent.suites.create(name=name, source=source)
+
+
+class _TimestampDecoder(object):
+
+    def __init__(self, strings):
+        self._strings = strings
+        self._previous = 0
+        self._formatted = {}
+
+    def decode(self, value):
+        if not value:
+            return None
+        if value & 1:
+            return self._strings[value >> 1]
+        seconds, millis = divmod(self.millis(value), 1000)
+        try:
+            formatted = self._formatted[seconds]
+        except KeyError:
+            formatted = time.strftime('%Y%m%d %H:%M:%S', time.gmtime(seconds))
+            self._formatted[seconds] = formatted
+        return '%s.%03d' % (formatted, millis)
+
+    def millis(self, value):
+        """Returns a normal timestamp as milliseconds or `None` if not set."""
+        if not value:
+            return None
+        zigzag = (value >> 1) - 1
+        self._previous += zigzag >> 1 if not zigzag & 1 else -(zigzag + 1 >> 1)
+        return self._previous
@@ -0,0 +1,130 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Combined results that are persisted and extended incrementally.
+
+An :class:`IncrementalResult` is stored as a binary output file that, in
+addition to the combined results, records the outputs it was created from.
+When new outputs are combined into it, only outputs not already recorded
+need to be parsed. Outputs are identified by their absolute path and
+validated using their modification time and size.
+"""
+
+from __future__ import with_statement
+import os
+import tempfile
+
+from robot import utils
+from robot.errors import DataError
+
+from .binaryformat import BinaryOutputWriter, BinaryResultBuilder
+from .executionresult import CombinedResult
+from .resultbuilder import ExecutionResult
+
+
+class IncrementalResult(CombinedResult):
+    """Combined result persisted into a binary output file.
+
+    :ivar source: Path to the binary file where the result is stored.
+    :ivar inputs: List of `(path, signature)` tuples identifying outputs
+        that are already combined. Child suites are in the same order.
+    """
+
+    def __init__(self, path):
+        CombinedResult.__init__(self)
+        self.source = utils.abspath(path)
+        self.inputs = []
+        if os.path.exists(self.source):
+            self._load()
+
+    def _load(self):
+        builder = BinaryResultBuilder(self.source)
+        try:
+            builder.build(self)
+        except DataError, err:
+            raise DataError("Reading combined result '%s' failed: %s"
+                            % (self.source, unicode(err)))
+        if len(builder.inputs) != len(self.suite.suites) or self.suite.tests:
+            raise DataError("File '%s' is not a combined result."
+                            % self.source)
+        # Name of the combined suite is got from its child suites.
+        self.suite.name = None
+        self.suite.source = None
+        self.inputs = builder.inputs
+
+    def add_outputs(self, *sources):
+        """Combines outputs that are not yet part of this result.
+
+        Returns the number of added outputs. Raises a `DataError` if an
+        already combined output has changed afterwards.
+        """
+        combined = dict(self.inputs)
+        added = 0
+        for source in sources:
+            path = utils.abspath(source)
+            signature = self._get_signature(path)
+            if path not in combined:
+                self.add_result(ExecutionResult(path))
+                self.inputs.append((path, signature))
+                combined[path] = signature
+                added += 1
+            elif combined[path] != signature:
+                raise DataError("Output '%s' has changed after it was "
+                                "combined into '%s'." % (path, self.source))
+        return added
+
+    def _get_signature(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError, err:
+            raise DataError("Reading output '%s' failed: %s"
+                            % (path, err.strerror))
+        return '%.3f:%d' % (stat.st_mtime, stat.st_size)
+
+    def save_combined(self, path=None):
+        """Saves the combined state atomically in the binary format.
+
+        Unlike :meth:`save`, which writes a normal XML output, the saved
+        file also records the combined outputs.
+        """
+        path = utils.abspath(path or self.source)
+        directory = os.path.dirname(path)
+        fd, temp = tempfile.mkstemp(dir=directory, suffix='.rfb')
+        os.close(fd)
+        try:
+            self.visit(_CombinedOutputWriter(temp, self.inputs))
+            self._replace(temp, path)
+        except EnvironmentError, err:
+            if os.path.exists(temp):
+                os.remove(temp)
+            raise DataError("Writing combined result '%s' failed: %s"
+                            % (path, err.strerror))
+
+    def _replace(self, source, target):
+        # os.rename does not overwrite existing files on Windows.
+        if os.name == 'nt' and os.path.exists(target):
+            os.remove(target)
+        os.rename(source, target)
+
+
+class _CombinedOutputWriter(BinaryOutputWriter):
+
+    def __init__(self, path, inputs):
+        BinaryOutputWriter.__init__(self, path)
+        self._inputs = inputs
+
+    def start_result(self, result):
+        for path, signature in self._inputs:
+            self._writer.element('input', attrs={'path': path,
+                                                 'signature': signature})
@@ -13,8 +13,9 @@
 #  limitations under the License.
 
 from robot import model, utils
+from robot.utils import setter
 
-from .message import Message
+from .message import Message, Messages
 
 
 class Keyword(model.Keyword):
@@ -45,6 +46,10 @@ class Keyword(model.Keyword):
         self.starttime = starttime
         self.endtime = endtime
 
+    @setter
+    def messages(self, messages):
+        return Messages(self.message_class, self, messages)
+
     @property
     def elapsedtime(self):
         return utils.get_elapsed_time(self.starttime, self.endtime)
@@ -16,6 +16,9 @@ from robot import utils
 
 from robot.model import SuiteVisitor, SkipAllVisitor
 
+from .keyword import Keyword
+from .testcase import TestCase
+
 
 def KeywordRemover(how):
     return {
@@ -38,9 +41,7 @@ class _KeywordRemover(SuiteVisitor):
         self._removal_message.set(kw)
 
     def _contains_warning(self, item):
-        contains_warning = ContainsWarning()
-        item.visit(contains_warning)
-        return contains_warning.result
+        return _contains_warning(item)
 
 
 class AllKeywordsRemover(_KeywordRemover):
@@ -82,9 +83,10 @@ class ForLoopItemsRemover(_KeywordRemover):
 
 class WaitUntilKeywordSucceedsRemover(_KeywordRemover):
     _message = '%d failing step%s removed using --RemoveKeywords option.'
+    _name = 'BuiltIn.Wait Until Keyword Succeeds'
 
     def start_keyword(self, kw):
-        if kw.name == 'BuiltIn.Wait Until Keyword Succeeds' and kw.keywords:
+        if kw.name == self._name and kw.keywords:
             keywords = list(kw.keywords)
             last_included = 2 if kw.keywords[-1].passed else 1
             kw.keywords = self._kws_with_warnings(keywords[:-last_included]) + \
@@ -95,6 +97,174 @@ class WaitUntilKeywordSucceedsRemover(_KeywordRemover):
         return [k for k in keywords if self._contains_warning(k)]
 
 
+class RuntimeKeywordRemover(object):
+    """Removes keywords already when outputs are written during execution.
+
+    Used by :class:`~robot.output.xmllogger.XmlLogger` so that removed
+    keywords are never written to the output file. Keywords that may need
+    to be removed are buffered as result model objects until they, or with
+    `PASSED` mode the test containing them, end. Then they are removed
+    using the same rules as with :func:`KeywordRemover` and given back to
+    the logger to be written. Passed for loop iterations and failed
+    `Wait Until Keyword Succeeds` attempts are removed as soon as possible
+    to keep the buffer small. With `ALL` mode child keywords and messages
+    are not buffered at all.
+
+    Failed `Wait Until Keyword Succeeds` attempts are removed also when
+    `WUKS` mode is not used so that outputs do not grow with every attempt.
+
+    With `PASSED` mode, suite setups and teardowns are not removed because
+    whether the suite passes is known only after its tests have been
+    written. They are still removed when log and report are created.
+
+    Modes are applied in the given order similarly as when removing
+    keywords from outputs. If `PASSED` mode is given before `FOR` or `WUKS`,
+    removal messages of top level loops and `Wait Until Keyword Succeeds`
+    keywords are set only if the test is not cleared. Removing failed
+    `Wait Until Keyword Succeeds` attempts without `WUKS` mode is
+    considered to be done last.
+
+    Methods handling execution events return `True` if the event was
+    handled and `False` if the logger should write it normally.
+    """
+    _wuks_name = WaitUntilKeywordSucceedsRemover._name
+    _for_message = ForLoopItemsRemover._message
+    _default_wuks_message = '%d failing step%s removed.'
+
+    def __init__(self, how, logger):
+        how = [h.upper() for h in how]
+        self._all = 'ALL' in how
+        self._passed = 'PASSED' in how and not self._all
+        self._for = 'FOR' in how
+        self._wuks_message = WaitUntilKeywordSucceedsRemover._message \
+            if 'WUKS' in how else self._default_wuks_message
+        self._after_passed = self._get_modes_after_passed(how)
+        self._logger = logger
+        self._stack = []
+        self._removed = []
+        self._ignored = 0
+        self._test_keywords = None
+        self._test_messages = []
+
+    def _get_modes_after_passed(self, how):
+        if not self._passed:
+            return set()
+        index = how.index('PASSED')
+        return set(mode for mode in ('FOR', 'WUKS')
+                   if mode not in how or how.index(mode) > index)
+
+    def start_test(self, test):
+        if self._passed:
+            self._test_keywords = []
+
+    def end_test(self, test):
+        keywords, self._test_keywords = self._test_keywords, None
+        messages, self._test_messages = self._test_messages, []
+        if keywords:
+            result = TestCase(status=test.status)
+            result.keywords = keywords
+            if not result.passed or _contains_warning(result):
+                for kw, message, len_before in messages:
+                    RemovalMessage(message).set_if_removed(kw, len_before)
+            result.visit(PassedKeywordRemover())
+            for kw in result.keywords:
+                self._logger.write_keyword(kw)
+
+    def start_keyword(self, kw):
+        if self._ignored or (self._all and self._stack):
+            self._ignored += 1
+            return True
+        if not (self._stack or self._should_be_buffered(kw)):
+            return False
+        self._stack.append(Keyword(kw.name, kw.doc,
+                                   [utils.unic(a) for a in kw.args],
+                                   kw.type, str(kw.timeout)))
+        self._removed.append(0)
+        return True
+
+    def _should_be_buffered(self, kw):
+        return (self._all or self._test_keywords is not None or
+                (self._for and kw.type == Keyword.FOR_LOOP_TYPE) or
+                kw.name == self._wuks_name)
+
+    def end_keyword(self, kw):
+        if self._ignored:
+            self._ignored -= 1
+            return True
+        if not self._stack:
+            return False
+        result = self._stack.pop()
+        result.status = kw.status
+        result.starttime = kw.starttime
+        result.endtime = kw.endtime
+        self._remove(result, self._removed.pop())
+        if self._stack:
+            self._add_to_parent(result)
+        elif self._test_keywords is not None:
+            self._test_keywords.append(result)
+        else:
+            self._logger.write_keyword(result)
+        return True
+
+    def _remove(self, kw, removed):
+        if self._all:
+            kw.visit(AllKeywordsRemover())
+        elif self._for and kw.type == kw.FOR_LOOP_TYPE:
+            self._set_removal_message(kw, self._for_message,
+                                      len(kw.keywords) + removed, 'FOR')
+        elif kw.name == self._wuks_name:
+            keywords = list(kw.keywords)
+            if len(keywords) > 1 and not keywords[-1].passed and \
+                    not _contains_warning(keywords[-2]):
+                keywords.pop(-2)
+                kw.keywords = keywords
+                removed += 1
+            self._set_removal_message(kw, self._wuks_message,
+                                      len(keywords) + removed, 'WUKS')
+
+    def _set_removal_message(self, kw, message, len_before, mode):
+        # Messages of top level keywords are not needed if PASSED mode,
+        # applied before this mode, clears the test.
+        if mode in self._after_passed and not self._stack \
+                and self._test_keywords is not None:
+            self._test_messages.append((kw, message, len_before))
+        else:
+            RemovalMessage(message).set_if_removed(kw, len_before)
+
+    def _add_to_parent(self, kw):
+        parent = self._stack[-1]
+        if self._for and parent.type == parent.FOR_LOOP_TYPE:
+            if kw.passed and not _contains_warning(kw):
+                self._removed[-1] += 1
+            else:
+                parent.keywords.append(kw)
+        elif parent.name == self._wuks_name:
+            # The last two attempts are needed to decide what to keep when
+            # the keyword ends. Earlier attempts can be removed already now.
+            keywords = list(parent.keywords) + [kw]
+            if len(keywords) > 2 and not _contains_warning(keywords[-3]):
+                keywords.pop(-3)
+                self._removed[-1] += 1
+            parent.keywords = keywords
+        else:
+            parent.keywords.append(kw)
+
+    def log_message(self, msg):
+        if self._ignored or (self._all and self._stack):
+            return True
+        if not self._stack:
+            return False
+        self._stack[-1].messages.create(msg.message, msg.level, msg.html,
+                                        msg.timestamp)
+        return True
+
+
+def _contains_warning(item):
+    contains_warning = ContainsWarning()
+    item.visit(contains_warning)
+    return contains_warning.result
+
+
 class ContainsWarning(SuiteVisitor):
 
     def __init__(self):
@@ -128,4 +298,8 @@ class RemovalMessage(object):
         self._set(kw, self._message)
 
     def _set(self, kw, message):
-        kw.doc = ('%s\n\n_%s_' % (kw.doc, message)).strip()
+        # Keywords already removed during execution must not get the
+        # message again when removing is done also when creating outputs.
+        message = '_%s_' % message
+        if not kw.doc.endswith(message):
+            kw.doc = ('%s\n\n%s' % (kw.doc, message)).strip()
@@ -12,8 +12,317 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import re
+import time
+from array import array
+from calendar import timegm
+
 from robot import model
 
 
 class Message(model.Message):
     __slots__ = []
+
+
+class Messages(model.Messages):
+    """Messages stored compactly in a list of texts and an array of numbers.
+
+    Level, html flag and timestamp of each message are packed into a single
+    number and the level is stored as an index to known levels. Messages
+    that cannot be packed, for example because their timestamp is not in the
+    normal format, are stored as objects.
+
+    Creating messages and iterating over them returns light message objects
+    that read their data from this list. Modifying such an object, as well
+    as accessing a message using its index, replaces the packed message with
+    a normal :class:`Message` object stored in this list. Changes are thus
+    preserved and the same object is returned when accessed again.
+    """
+    __slots__ = ['_texts', '_values', '_others']
+    _levels = ('TRACE', 'DEBUG', 'INFO', 'WARN', 'FAIL', 'ERROR', 'NONE')
+    _level_indices = dict((level, index) for index, level in enumerate(_levels))
+
+    def __init__(self, message_class=Message, parent=None, messages=None):
+        # ItemList.__init__ is not called to avoid creating the unused list.
+        self._item_class = message_class
+        self._common_attrs = {'parent': parent}
+        self._texts = self._values = self._others = None
+        if messages:
+            self.extend(messages)
+
+    def create(self, message='', level='INFO', html=False, timestamp=None):
+        value = self._pack(level, html, timestamp) \
+            if self._item_class is Message else None
+        if value is None:
+            item = self._item_class(message, level, html, timestamp)
+            self.append(item)
+            return item
+        texts = self._texts
+        if texts is None:
+            texts = self._texts = []
+            self._values = array('d')
+        texts.append(message)
+        self._values.append(value)
+        return _PackedMessage(self, len(texts) - 1)
+
+    def append_with_millis(self, message, level, html, millis):
+        """Appends a message whose timestamp is milliseconds since the epoch.
+
+        Avoids formatting and parsing timestamps when reading outputs that
+        store them as numbers. `None` means that there is no timestamp.
+        Unlike :meth:`create`, does not return the message because creating
+        it would slow down reading big outputs considerably.
+        """
+        index = self._level_indices.get(level)
+        if index is None or millis is not None and millis < 0 or \
+                html is not True and html is not False or \
+                self._item_class is not Message:
+            if millis is not None:
+                millis = _millis_to_timestamp(millis)
+            self.create(message, level, html, millis)
+            return
+        if millis is None:
+            millis = -1
+        texts = self._texts
+        if texts is None:
+            texts = self._texts = []
+            self._values = array('d')
+        texts.append(message)
+        self._values.append(float((millis + 1) * 16 + index * 2 + html))
+
+    def append(self, item):
+        self._check_type_and_set_attrs(item)
+        if type(item) is _PackedMessage:
+            message = item._get_message()
+            if message is None:
+                self._add_packed(item._texts[item._index],
+                                 item._values[item._index])
+                item._attach(self, len(self._texts) - 1)
+                return
+            self._check_type_and_set_attrs(message)
+            item = message
+        self._add_object(item)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def serialize(self):
+        """Returns messages in a format that :mod:`marshal` can serialize.
+
+        Packed messages are returned as a list of texts and a string
+        containing their packed values. If the list contains normal message
+        objects, all messages are returned as a tuple of
+        `(message, level, html, timestamp)` tuples. An empty list is
+        returned as `None`. The returned data can be given to
+        :meth:`restore`.
+        """
+        if not self:
+            return None
+        if not self._others:
+            return (self._texts, self._values.tostring())
+        return tuple((msg.message, msg.level, msg.html, msg.timestamp)
+                     for msg in self)
+
+    def restore(self, data):
+        """Appends messages serialized by :meth:`serialize` to this list."""
+        if not data:
+            return
+        if isinstance(data[0], list):
+            texts, values = data
+            if self._texts is None:
+                self._texts = []
+                self._values = array('d')
+            self._texts.extend(texts)
+            self._values.fromstring(values)
+        else:
+            for message, level, html, timestamp in data:
+                self.create(message, level, html, timestamp)
+
+    def _add_packed(self, text, value):
+        if self._texts is None:
+            self._texts = []
+            self._values = array('d')
+        self._texts.append(text)
+        self._values.append(value)
+
+    def _add_object(self, item):
+        if self._others is None:
+            self._others = {}
+        self._others[len(self)] = item
+        self._add_packed(None, 0)
+
+    def _pack(self, level, html, timestamp):
+        index = self._level_indices.get(level)
+        if index is None or (html is not True and html is not False):
+            return None
+        millis = _timestamp_to_millis(timestamp) if timestamp else -1
+        if millis is None:
+            return None
+        # Float arrays store integers exactly up to 2**53.
+        return float((millis + 1) * 16 + index * 2 + html)
+
+    def _get_object(self, index):
+        if self._others:
+            return self._others.get(index)
+        return None
+
+    def _promote(self, index):
+        item = self._get_object(index)
+        if item is None:
+            item = self._item_class(*_unpack(self._texts, self._values, index))
+            self._check_type_and_set_attrs(item)
+            if self._others is None:
+                self._others = {}
+            self._others[index] = item
+            self._texts[index] = None
+        return item
+
+    def index(self, item):
+        if type(item) is _PackedMessage and item._messages is self \
+                and item._texts is self._texts:
+            return item._index
+        for index, message in (self._others or {}).items():
+            if message is item:
+                return index
+        raise ValueError('%s not in list' % item)
+
+    def clear(self):
+        self._texts = self._values = self._others = None
+
+    def __iter__(self):
+        others = self._others
+        for index in xrange(len(self)):
+            if others and index in others:
+                yield others[index]
+            else:
+                yield _PackedMessage(self, index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            raise ValueError("'%s' object does not support slicing"
+                             % type(self).__name__)
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('list index out of range')
+        return self._promote(index)
+
+    def __len__(self):
+        return len(self._texts) if self._texts is not None else 0
+
+
+def _packed_attribute(name, unpack):
+
+    def getter(self):
+        message = self._get_message()
+        if message is None:
+            return unpack(self._texts, self._values, self._index)
+        return getattr(message, name)
+
+    def setter(self, value):
+        message = self._get_message()
+        if message is None:
+            message = self._promote()
+        setattr(message, name, value)
+
+    return property(getter, setter)
+
+
+class _PackedMessage(Message):
+    """Message whose data is stored in a :class:`Messages` list.
+
+    After the message is modified, its data is stored in a normal
+    :class:`Message` object that is also used by the list.
+    """
+    __slots__ = ['_messages', '_texts', '_values', '_index', '_message']
+
+    def __init__(self, messages, index):
+        self._messages = messages
+        self._texts = messages._texts
+        self._values = messages._values
+        self._index = index
+        self._message = None
+        self.parent = messages._common_attrs['parent']
+
+    def _attach(self, messages, index):
+        self._messages = messages
+        self._texts = messages._texts
+        self._values = messages._values
+        self._index = index
+        self._message = None
+
+    def _get_message(self):
+        # Messages in a cleared list are not looked up from it anymore.
+        if self._message is None and self._texts is self._messages._texts:
+            self._message = self._messages._get_object(self._index)
+        return self._message
+
+    def _promote(self):
+        if self._texts is self._messages._texts:
+            self._message = self._messages._promote(self._index)
+        else:
+            self._message = Message(*_unpack(self._texts, self._values,
+                                             self._index))
+            self._message.parent = self.parent
+        return self._message
+
+    message = _packed_attribute('message',
+                                lambda texts, values, index: texts[index])
+    level = _packed_attribute('level', lambda texts, values, index:
+                              Messages._levels[int(values[index]) % 16 >> 1])
+    html = _packed_attribute('html', lambda texts, values, index:
+                             bool(int(values[index]) & 1))
+    timestamp = _packed_attribute('timestamp', lambda texts, values, index:
+                                  _unpack_timestamp(values[index]))
+
+
+def _unpack(texts, values, index):
+    value = int(values[index])
+    return (texts[index], Messages._levels[value % 16 >> 1],
+            bool(value & 1), _unpack_timestamp(value))
+
+
+def _unpack_timestamp(value):
+    millis = int(value) // 16
+    return _millis_to_timestamp(millis - 1) if millis else None
+
+
+_TIMESTAMP = re.compile(r'^\d{8} \d\d:\d\d:\d\d\.\d\d\d$')
+_MILLIS = {}
+_FORMATTED = {}
+_MAX_CACHED = 10000
+
+
+def _timestamp_to_millis(timestamp):
+    millis = timestamp[18:]
+    if len(millis) != 3 or not millis.isdigit():
+        return None
+    try:
+        return _MILLIS[timestamp[:18]] + int(millis)
+    except KeyError:
+        if not _TIMESTAMP.match(timestamp):
+            return None
+        try:
+            seconds = timegm(time.strptime(timestamp[:17], '%Y%m%d %H:%M:%S'))
+        except ValueError:
+            return None
+        if seconds < 0:
+            return None
+        if len(_MILLIS) >= _MAX_CACHED:
+            _MILLIS.clear()
+        _MILLIS[timestamp[:18]] = seconds * 1000
+        return seconds * 1000 + int(millis)
+
+
+def _millis_to_timestamp(millis):
+    seconds, millis = divmod(millis, 1000)
+    try:
+        formatted = _FORMATTED[seconds]
+    except KeyError:
+        formatted = time.strftime('%Y%m%d %H:%M:%S', time.gmtime(seconds))
+        if len(_FORMATTED) >= _MAX_CACHED:
+            _FORMATTED.clear()
+        _FORMATTED[seconds] = formatted
+    return '%s.%03d' % (formatted, millis)
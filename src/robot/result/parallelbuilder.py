@@ -0,0 +1,158 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Reads multiple outputs in parallel using separate worker processes.
+
+Every output is read in a worker process into a normal result model, which
+is converted to nested tuples and serialized using :mod:`marshal`.
+Building the model from this data is several times faster than reading the
+original output, and it is done in the main process while workers continue
+reading remaining outputs. Results are combined in the order outputs were
+given, exactly like :func:`~.resultbuilder.ExecutionResult` combines them.
+"""
+
+import marshal
+import signal
+
+try:
+    from multiprocessing import Pool
+except ImportError:  # Not available on Jython and IronPython
+    Pool = None
+
+from .executionresult import CombinedResult, Result
+from .message import Messages
+from .resultbuilder import ExecutionResult
+
+
+class ParallelResultBuilder(object):
+
+    def __init__(self, processes=None):
+        """:param processes: Maximum number of worker processes. Defaults
+            to the number of CPUs like with :class:`multiprocessing.Pool`.
+        """
+        self._processes = processes
+
+    def build(self, *sources):
+        """Reads and combines given outputs into :class:`CombinedResult`.
+
+        Outputs are read sequentially if there is only one worker process
+        or if the :mod:`multiprocessing` module is not available.
+        """
+        processes = min(self._processes or len(sources), len(sources))
+        if processes < 2 or not Pool:
+            return ExecutionResult(*sources)
+        pool = Pool(processes, _init_worker)
+        try:
+            result = CombinedResult()
+            for data in pool.imap(serialize_result, sources):
+                result.add_result(deserialize_result(data))
+        except:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+        return result
+
+
+def _init_worker():
+    # Workers inherit possible signal handlers of the main process. They
+    # are stopped by the main process and should not handle signals.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def serialize_result(source):
+    """Reads the given output and returns it as a marshalled string."""
+    result = ExecutionResult(source)
+    serializer = _Serializer()
+    return marshal.dumps((result.source, result.generator,
+                          serializer.suite(result.suite),
+                          serializer.messages(result.errors.messages)))
+
+
+def deserialize_result(data):
+    """Builds :class:`~.executionresult.Result` from a marshalled string."""
+    source, generator, suite, errors = marshal.loads(data)
+    result = Result(source)
+    result.generator = generator
+    builder = _Builder()
+    builder.suite(result.suite, suite)
+    builder.messages(result.errors.messages, errors)
+    return result
+
+
+class _Serializer(object):
+
+    def suite(self, suite):
+        return (suite.source, suite.name, suite.doc,
+                tuple(suite.metadata.items()), suite.message,
+                suite.starttime, suite.endtime,
+                tuple(self.keyword(kw) for kw in suite.keywords),
+                tuple(self.suite(child) for child in suite.suites),
+                tuple(self.test(test) for test in suite.tests))
+
+    def test(self, test):
+        return (test.name, test.doc, tuple(test.tags), test.timeout,
+                test.status, test.message, test.starttime, test.endtime,
+                tuple(self.keyword(kw) for kw in test.keywords))
+
+    def keyword(self, kw):
+        return (kw.name, kw.doc, tuple(kw.args), kw.type, kw.timeout,
+                kw.status, kw.starttime, kw.endtime,
+                self.messages(kw.messages),
+                tuple(self.keyword(child) for child in kw.keywords))
+
+    def messages(self, messages):
+        if isinstance(messages, Messages):
+            return messages.serialize()
+        return tuple((msg.message, msg.level, msg.html, msg.timestamp)
+                     for msg in messages)
+
+
+class _Builder(object):
+
+    def suite(self, suite, data):
+        (suite.source, suite.name, suite.doc, metadata, suite.message,
+         suite.starttime, suite.endtime, keywords, suites, tests) = data
+        for name, value in metadata:
+            suite.metadata[name] = value
+        self.keywords(suite.keywords, keywords)
+        for child in suites:
+            self.suite(suite.suites.create(), child)
+        create = suite.tests.create
+        for (name, doc, tags, timeout, status, message, starttime, endtime,
+             keywords) in tests:
+            test = create(name, doc, tags, timeout, status, message,
+                          starttime, endtime)
+            self.keywords(test.keywords, keywords)
+
+    def keywords(self, keywords, data):
+        create = keywords.create
+        for (name, doc, args, type, timeout, status, starttime, endtime,
+             messages, children) in data:
+            kw = create(name, doc, list(args), type, timeout, status,
+                        starttime, endtime)
+            if messages:
+                self.messages(kw.messages, messages)
+            if children:
+                self.keywords(kw.keywords, children)
+
+    def messages(self, messages, data):
+        if isinstance(messages, Messages):
+            messages.restore(data)
+        elif data:
+            for message, level, html, timestamp in data:
+                messages.create(message, level, html, timestamp)
@@ -17,6 +17,7 @@ from __future__ import with_statement
 from robot.errors import DataError
 from robot.utils import ET, ETSource
 
+from .binaryformat import BinaryResultBuilder, is_binary_result
 from .suiteteardownfailed import SuiteTeardownFailureHandler
 from .xmlelementhandlers import XmlElementHandler
 from .executionresult import Result, CombinedResult
@@ -25,7 +26,8 @@ from .executionresult import Result, CombinedResult
 def ExecutionResult(*sources):
     """Constructs :class:`Result` object based on execution result xml file(s).
 
-    :param sources: The Robot Framework output xml file(s).
+    :param sources: The Robot Framework output xml file(s). Binary output
+        files created with `--binaryoutput` option are supported too.
     :returns: :py:class:`~.executionresult.Result` instance.
 
     See :py:mod:`robot.result` for usage example.
@@ -34,6 +36,8 @@ def ExecutionResult(*sources):
         raise DataError('One or more data source needed.')
     if len(sources) > 1:
         return CombinedResult(*[ExecutionResult(src) for src in sources])
+    if is_binary_result(sources[0]):
+        return _binary_result(sources[0])
     source = ETSource(sources[0])
     try:
         return ExecutionResultBuilder(source).build(Result(sources[0]))
@@ -42,14 +46,23 @@ def ExecutionResult(*sources):
                         % (unicode(source), unicode(err)))
 
 
+def _binary_result(source):
+    try:
+        return BinaryResultBuilder(source).build(Result(source))
+    except DataError, err:
+        raise DataError("Reading binary source '%s' failed: %s"
+                        % (source, unicode(err)))
+
+
 class ExecutionResultBuilder(object):
 
-    def __init__(self, source):
+    def __init__(self, source, root_handler=None):
         self._source = source \
             if isinstance(source, ETSource) else ETSource(source)
+        self._root_handler = root_handler
 
     def build(self, result):
-        handler = XmlElementHandler(result)
+        handler = XmlElementHandler(result, self._root_handler)
         # Faster attribute lookup inside for loop
         start, end = handler.start, handler.end
         with self._source as source:
@@ -15,6 +15,17 @@
 from robot.errors import DataError
 
 
+# Values repeated in every keyword are shared instead of having a string
+# object per element.
+_SHARED_VALUES = dict((value, value) for value in
+                      ('PASS', 'FAIL', 'NOT_RUN', 'kw', 'setup', 'teardown',
+                       'for', 'foritem', ''))
+
+
+def _shared(value):
+    return _SHARED_VALUES.get(value, value)
+
+
 class XmlElementHandler(object):
 
     def __init__(self, execution_result, root_handler=None):
@@ -111,9 +122,10 @@ class KeywordHandler(_Handler):
     tag = 'kw'
 
     def start(self, elem, result):
+        type, timeout = elem.get('type'), elem.get('timeout')
         return result.keywords.create(name=elem.get('name'),
-                                      timeout=elem.get('timeout'),
-                                      type=elem.get('type'))
+                                      timeout=_shared(timeout),
+                                      type=_shared(type))
 
     def _children(self):
         return [DocHandler(), ArgumentsHandler(), KeywordStatusHandler(),
@@ -134,7 +146,7 @@ class _StatusHandler(_Handler):
     tag = 'status'
 
     def _set_status(self, elem, result):
-        result.status = elem.get('status', 'FAIL')
+        result.status = _shared(elem.get('status', 'FAIL'))
 
     def _set_message(self, elem, result):
         result.message = elem.text or ''
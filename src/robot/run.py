@@ -130,7 +130,8 @@ Options
                           output files after the test execution and XML outputs
                           can also be further processed with Rebot tool. Can be
                           disabled by giving a special value `NONE`. In this
-                          case, also log and report are automatically disabled.
+                          case, also log and report are automatically disabled
+                          unless --binaryoutput is used.
                           Default: output.xml
  -l --log file            HTML log file. Can be disabled by giving a special
                           value `NONE`. Default: log.html
@@ -139,8 +140,30 @@ Options
                           similarly as --log. Default: report.html
  -x --xunitfile file      xUnit compatible result file. Not created unless this
                           option is specified.
+    --binaryoutput file   Compact binary output file written in addition to or,
+                          when used with `--output NONE`, instead of the XML
+                          output. Binary outputs are faster to process than
+                          XML outputs and Rebot accepts them as inputs.
+                          Not created unless this option is specified.
+    --asyncoutput         Write the XML output file on a background thread
+                          using large buffered writes. Makes execution faster
+                          when logging a lot or when the output directory is
+                          on a slow disk or on a network file system.
+    --fsyncoutput         Flush the XML output file and sync it to disk after
+                          each suite. With --asyncoutput the syncing is done
+                          on the background thread.
  -b --debugfile file      Debug file written during execution. Not created
                           unless this option is specified.
+    --profile file        Profile file containing time spent in library and
+                          user keywords aggregated by their call paths. Uses
+                          the collapsed stack format supported by flame graph
+                          tools. Keywords taking most time are also listed
+                          on the console after execution. Not created unless
+                          this option is specified and not supported when
+                          running tests with --processes.
+    --profiletop count    Number of keywords to list on the console when
+                          --profile is used. Default is 10 and 0 disables
+                          the listing.
  -T --timestampoutputs    When this option is used, timestamp in a format
                           `YYYYMMDD-hhmmss` is added to all generated output
                           files between their basename and extension. For
@@ -149,6 +172,13 @@ Options
                           `report-20070503-154410.html`.
     --splitlog            Split log file into smaller pieces that open in
                           browser transparently.
+    --compressionlevel level  Compression level from 0 to 9 used with long
+                          texts in log and report. Lower levels make creating
+                          them faster but files bigger. 0 disables
+                          compression. Default is 9.
+    --compressblocks      Compress long texts in log in blocks instead of one
+                          by one. Makes creating log faster and the log file
+                          smaller, but opening messages in it a bit slower.
     --logtitle title      Title for the generated test log. The default title
                           is `<Name Of The Suite> Test Log`. Underscores in
                           the title are converted into spaces in all titles.
@@ -203,8 +233,8 @@ Options
                           Examples: --tagstatlink mytag:http://my.domain:Link
                           --tagstatlink bug-*:http://tracker/id=%1:Bug_Tracker
     --removekeywords all|passed|for|wuks *  Remove keyword data from the
-                          generated log file. Keywords containing warnings are
-                          not removed except in `all` mode.
+                          generated output and log files. Keywords containing
+                          warnings are not removed except in `all` mode.
                           all:    remove data from all keywords
                           passed: remove data only from keywords in passed
                                   test cases and suites
@@ -234,6 +264,17 @@ Options
                           be skipped if test execution is stopped prematurely.
                           In the `DryRun` test data is verified and tests run
                           so that library keywords are not executed.
+ -J --processes count    Execute tests in parallel using the given number of
+                          processes. Execution is split to units that are
+                          suites containing tests and each unit is executed
+                          in a separate process. Outputs are combined in the
+                          end. Setups and teardowns of higher level suites are
+                          executed in every process and a warning is shown
+                          about them. Also result files are written in
+                          parallel. Default is 1 meaning tests
+                          are executed sequentially.
+    --testlevelsplit      Use individual tests, not suites, as units when
+                          executing tests in parallel with --processes.
  -W --monitorwidth chars  Width of the monitor output. Default is 78.
  -C --monitorcolors auto|on|off  Use colors on console output or not.
                           auto: use colors when output not redirected (default)
@@ -330,7 +371,9 @@ if 'robot' not in sys.modules and __name__ == '__main__':
 from robot.conf import RobotSettings
 from robot.output import LOGGER, Output, pyloggingconf
 from robot.reporting import ResultWriter
+from robot.result.keywordremover import RuntimeKeywordRemover
 from robot.running import TestSuite, STOP_SIGNAL_MONITOR, namespace
+from robot.running.parallel import ParallelRunner, select_execution_unit
 from robot.utils import Application
 from robot.variables import init_global_variables
 
@@ -351,15 +394,30 @@ class RobotFramework(Application):
                                        stderr=settings['StdErr'])
         init_global_variables(settings)
         suite = TestSuite(datasources, settings)
-        output = Output(settings)
-        suite.run(output)
-        LOGGER.info("Tests execution ended. Statistics:\n%s" % suite.get_stat_message())
-        output.close(suite)
+        select_execution_unit(suite)
+        if settings['Processes'] > 1:
+            rc = self._run_in_parallel(suite, datasources, settings, options)
+        else:
+            rc = self._run(suite, settings)
         if settings.is_rebot_needed():
             output, settings = settings.get_rebot_datasource_and_settings()
             ResultWriter(output).write_results(settings)
+        return rc
+
+    def _run(self, suite, settings):
+        output = Output(settings, RuntimeKeywordRemover)
+        suite.run(output)
+        LOGGER.info("Tests execution ended. Statistics:\n%s" % suite.get_stat_message())
+        output.close(suite)
         return suite.return_code
 
+    def _run_in_parallel(self, suite, datasources, settings, options):
+        runner = ParallelRunner(settings, options)
+        result = runner.run(suite, datasources)
+        LOGGER.info("Tests execution ended. Statistics:\n%s"
+                    % result.suite.statistics.message)
+        return runner.return_code(result)
+
 
 def run_cli(arguments):
     """Command line execution entry point for running tests.
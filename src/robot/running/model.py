@@ -87,7 +87,7 @@ class RunnableTestSuite(BaseTestSuite):
 
     def __init__(self, data, parent=None, defaults=None):
         BaseTestSuite.__init__(self, data.name, data.source, parent)
-        self.variables = GLOBAL_VARIABLES.copy()
+        self.variables = GLOBAL_VARIABLES.new_scope()
         self.variables.set_from_variable_table(data.variable_table)
         self.source = data.source
         self.doc = data.setting_table.doc.value
@@ -200,7 +200,7 @@ class RunnableMultiTestSuite(RunnableTestSuite):
 
     def __init__(self, suitedatas):
         BaseTestSuite.__init__(self, name='')
-        self.variables = GLOBAL_VARIABLES.copy()
+        self.variables = GLOBAL_VARIABLES.new_scope()
         self.doc = ''
         self.imports = []
         self.setup = Setup(None, None)
@@ -53,6 +53,8 @@ class Namespace:
         self._testlibs = {}
         self._imported_resource_files = ImportCache()
         self._imported_variable_files = ImportCache()
+        self._resource_handler_cache = {}
+        self._library_handler_cache = {}
 
     def handle_imports(self):
         self._import_default_libraries()
@@ -96,6 +98,7 @@ class Namespace:
                                                    overwrite)
             self._imported_resource_files[path] \
                 = UserLibrary(resource.keyword_table.keywords, resource.source)
+            self._resource_handler_cache.clear()
             self._handle_imports(resource.setting_table.imports)
         else:
             LOGGER.info("Resource file '%s' already imported by suite '%s'"
@@ -129,6 +132,7 @@ class Namespace:
                         % (lib.name, self.suite.longname))
             return
         self._testlibs[lib.name] = lib
+        self._library_handler_cache.clear()
         lib.start_suite()
         if self.test:
             lib.start_test()
@@ -301,9 +305,9 @@ class Namespace:
             return self.suite.user_keywords.get_handler(name)
 
     def _get_handler_from_resource_file_user_keywords(self, name):
-        found = [lib.get_handler(name) for lib
-                 in self._imported_resource_files.values()
-                 if lib.has_handler(name)]
+        found = [lib.get_handler(name) for lib in self._get_libraries_having(
+                    name, self._imported_resource_files.values(),
+                    self._resource_handler_cache)]
         if not found:
             return None
         if len(found) > 1:
@@ -313,8 +317,8 @@ class Namespace:
         self._raise_multiple_keywords_found(name, found)
 
     def _get_handler_from_library_keywords(self, name):
-        found = [lib.get_handler(name) for lib in self._testlibs.values()
-                 if lib.has_handler(name)]
+        found = [lib.get_handler(name) for lib in self._get_libraries_having(
+                    name, self._testlibs.values(), self._library_handler_cache)]
         if not found:
             return None
         if len(found) > 1:
@@ -325,6 +329,13 @@ class Namespace:
             return found[0]
         self._raise_multiple_keywords_found(name, found)
 
+    def _get_libraries_having(self, name, libraries, cache):
+        # Libraries containing a keyword do not change until new imports,
+        # which clear the cache. Search order is applied on every call.
+        if name not in cache:
+            cache[name] = [lib for lib in libraries if lib.has_handler(name)]
+        return cache[name]
+
     def _get_handler_based_on_library_search_order(self, handlers):
         for libname in self.library_search_order:
             for handler in handlers:
@@ -375,11 +386,14 @@ class Namespace:
 
 
 class _VariableScopes:
+    _prev_test_variables = ('${PREV_TEST_NAME}', '${PREV_TEST_STATUS}',
+                            '${PREV_TEST_MESSAGE}')
 
     def __init__(self, suite, parent_vars):
         # suite and parent are None only when used by copy_all
         if suite is not None:
-            suite.variables.update(GLOBAL_VARIABLES)
+            suite.variables.rebase(GLOBAL_VARIABLES)
+            self._set_prev_test_variables(suite.variables)
             self._suite = self.current = suite.variables
         else:
             self._suite = self.current = None
@@ -390,11 +404,21 @@ class _VariableScopes:
         self._test = None
         self._uk_handlers = []
 
+    def _set_prev_test_variables(self, variables):
+        # These are updated to global variables directly when suites end and
+        # must thus be copied to not change in suites that are still running.
+        for name in self._prev_test_variables:
+            if GLOBAL_VARIABLES.contains(name):
+                variables[name] = GLOBAL_VARIABLES[name]
+
     def __len__(self):
         if self.current:
             return len(self.current)
         return 0
 
+    def __nonzero__(self):
+        return bool(self.current)
+
     def copy_all(self):
         vs = _VariableScopes(None, None)
         vs._suite = self._suite
@@ -468,14 +492,14 @@ class _VariableScopes:
         self._suite = self._test = self.current = None
 
     def start_test(self, test):
-        self._test = self.current = self._suite.copy()
+        self._test = self.current = self._suite.new_scope()
 
     def end_test(self):
         self.current = self._suite
 
     def start_uk(self, handler):
         self._uk_handlers.append(self.current)
-        self.current = self.current.copy()
+        self.current = self.current.new_scope()
 
     def end_uk(self):
         self.current = self._uk_handlers.pop()
@@ -0,0 +1,387 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Executes tests in parallel in multiple worker processes.
+
+The parsed suite is split into units that are either suites containing
+tests or, optionally, individual tests. Every unit is executed in a separate
+process running Robot Framework with the same options and data sources.
+The unit is selected with `--suite` and `--test` options and, because they
+accept patterns and ignore case and spaces, also by its exact names given
+to the process in a file. Setups and teardowns of the higher level suites
+are executed in every process and a warning is logged about them.
+Outputs of the units are merged into one result afterwards. Tests of units
+whose process did not create a valid output are marked failed.
+"""
+
+from __future__ import with_statement
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+import cPickle as pickle
+
+from robot.errors import DataError
+from robot.output import LOGGER
+from robot.output.monitor import CommandLineWriter
+from robot.result import ExecutionResult
+from robot.result.binaryformat import BinaryOutputWriter
+from robot.result.executionresult import Result
+from robot.result.testsuite import TestSuite
+from robot.utils import utf8open, get_timestamp
+
+from .signalhandler import STOP_SIGNAL_MONITOR
+
+
+_UNIT_FILE_VARIABLE = 'ROBOT_PARALLEL_UNIT_FILE'
+
+
+def select_execution_unit(suite):
+    """Selects tests of the unit executed by this worker process, if any.
+
+    Removes other tests and suites from `suite` based on exact names written
+    by :class:`ExecutionUnit`. The environment variable telling the file
+    is removed so that processes started by tests do not use it.
+    """
+    path = os.environ.pop(_UNIT_FILE_VARIABLE, None)
+    if not path:
+        return
+    with open(path, 'rb') as unit:
+        names, test = pickle.load(unit)
+    _select(suite, names, test)
+
+
+def _select(suite, names, test):
+    if len(names) > 1:
+        suite.tests = []
+        suite.suites = [child for child in suite.suites
+                        if child.name == names[1]]
+        for child in suite.suites:
+            _select(child, names[1:], test)
+    else:
+        # Child suites are executed as their own units.
+        suite.suites = []
+        if test is not None:
+            suite.tests = [t for t in suite.tests if t.name == test]
+
+
+class ParallelRunner(object):
+    _overridden_options = ['outputdir', 'output', 'binaryoutput', 'log',
+                           'report', 'xunitfile', 'debugfile', 'profile',
+                           'timestampoutputs', 'splitlog', 'monitorcolors',
+                           'processes', 'testlevelsplit', 'stdout', 'stderr']
+
+    def __init__(self, settings, options=None):
+        self._settings = settings
+        self._options = dict((name, value) for name, value
+                             in (options or {}).items()
+                             if name not in self._overridden_options)
+        self._processes = settings['Processes']
+        self._test_level = settings['TestLevelSplit']
+        self._stdout = settings['StdOut'] or sys.__stdout__
+        self._failed_units = []
+
+    def run(self, suite, datasources):
+        """Runs the given suite in parallel and returns merged results.
+
+        :param suite: Parsed and configured runnable suite used for splitting
+                      execution into units.
+        :param datasources: Data sources given to worker processes.
+        :returns: :class:`~robot.result.executionresult.Result` instance.
+        """
+        units = self._get_units(suite)
+        self._warn_about_shared_fixtures(suite)
+        tempdir = tempfile.mkdtemp(prefix='robot-parallel-')
+        try:
+            for unit in self._run_units(units, datasources, tempdir):
+                self._report(unit)
+            result = self._merge(self._get_results(units))
+        finally:
+            shutil.rmtree(tempdir, ignore_errors=True)
+        self._configure(result)
+        self._write_summary(result.suite)
+        self._save(result)
+        return result
+
+    def _get_units(self, suite):
+        units = []
+        seen = set()
+        for unit in UnitSplitter(self._test_level).split(suite):
+            if unit.selectors not in seen:
+                unit.index = len(units) + 1
+                units.append(unit)
+                seen.add(unit.selectors)
+        return units
+
+    def _warn_about_shared_fixtures(self, suite):
+        for name in UnitSplitter(self._test_level).shared_fixtures(suite):
+            LOGGER.warn("Setup and teardown of suite '%s' are executed "
+                        "separately in every process running its tests."
+                        % name)
+
+    def _run_units(self, units, datasources, tempdir):
+        waiting = list(units)
+        running = []
+        while waiting or running:
+            while waiting and len(running) < self._processes \
+                    and not STOP_SIGNAL_MONITOR.signal_received:
+                unit = waiting.pop(0)
+                unit.start(self._options, datasources, tempdir)
+                running.append(unit)
+            if STOP_SIGNAL_MONITOR.signal_received:
+                waiting = []
+            for unit in running[:]:
+                if unit.finished():
+                    running.remove(unit)
+                    yield unit
+            time.sleep(0.05)
+
+    def _report(self, unit):
+        with open(unit.stdout) as stdout:
+            self._stdout.write(stdout.read())
+        self._stdout.flush()
+
+    def _get_results(self, units):
+        for unit in units:
+            # Units are not started if execution is stopped.
+            if unit.output is None:
+                continue
+            message = ("Executing %s in a separate process failed with "
+                       "return code %d." % (unit, unit.rc))
+            try:
+                result = ExecutionResult(unit.output)
+            except DataError, err:
+                result = unit.failed_result(message)
+                self._unit_failed(unit, result, '%s %s' % (message, err))
+            else:
+                if unit.rc > 250:
+                    self._unit_failed(unit, result, message)
+            yield result
+
+    def _unit_failed(self, unit, result, message):
+        LOGGER.error(message)
+        result.errors.messages.create(message, 'ERROR',
+                                      timestamp=get_timestamp())
+        self._failed_units.append(unit)
+
+    def _merge(self, results):
+        results = list(results)
+        if not results:
+            raise DataError('No outputs created by worker processes.')
+        result = results[0]
+        for other in results[1:]:
+            SuiteMerger().merge(result.suite, other.suite)
+            result.errors.add(other.errors)
+        return result
+
+    def return_code(self, result):
+        """Returns the return code of the parallel execution.
+
+        The return code is non-zero if some worker process failed even if
+        all critical tests passed.
+        """
+        if self._failed_units:
+            return max(result.return_code, 1)
+        return result.return_code
+
+    def _configure(self, result):
+        settings = self._settings
+        result.configure(settings.status_rc,
+                         {'critical': settings['Critical'],
+                          'noncritical': settings['NonCritical'],
+                          'process_empty_suite': True},
+                         settings.statistics_config)
+
+    def _save(self, result):
+        output = self._settings.output
+        if output:
+            result.save(output)
+            LOGGER.output_file('Output', output)
+        binary_output = self._settings.binary_output
+        if binary_output:
+            result.visit(BinaryOutputWriter(binary_output))
+            LOGGER.output_file('Binary', binary_output)
+
+    def _write_summary(self, suite):
+        writer = CommandLineWriter(self._settings['MonitorWidth'],
+                                   self._settings['MonitorColors'],
+                                   self._settings['StdOut'],
+                                   self._settings['StdErr'])
+        writer.suite_separator()
+        writer.info(suite.longname, suite.doc)
+        writer.status(suite.status)
+        writer.message(suite.full_message)
+        writer.suite_separator()
+
+
+class UnitSplitter(object):
+
+    def __init__(self, test_level=False):
+        self._test_level = test_level
+
+    def split(self, suite):
+        units = []
+        self._split(suite, [], units)
+        return units
+
+    def _split(self, suite, parents, units):
+        names = parents + [suite.name]
+        if suite.tests and self._test_level:
+            units.extend(ExecutionUnit(names, test.name, [test])
+                         for test in suite.tests)
+        elif suite.tests:
+            units.append(ExecutionUnit(names, tests=suite.tests))
+        for child in suite.suites:
+            self._split(child, names, units)
+
+    def shared_fixtures(self, suite):
+        """Returns names of suites whose setups and teardowns are executed
+        in more than one unit."""
+        shared = []
+        self._count_units(suite, shared)
+        return shared
+
+    def _count_units(self, suite, shared):
+        index = len(shared)
+        count = len(suite.tests) if self._test_level else int(bool(suite.tests))
+        count += sum(self._count_units(child, shared)
+                     for child in suite.suites)
+        if count > 1 and (suite.setup.name or suite.teardown.name):
+            shared.insert(index, suite.longname)
+        return count
+
+
+class ExecutionUnit(object):
+
+    def __init__(self, names, test=None, tests=()):
+        self.names = tuple(names)
+        self.tests = list(tests)
+        # Dots in names would be interpreted as suite separators by --suite.
+        self.selectors = ('.'.join(name.replace('.', '?') for name in names),
+                          test)
+        self.index = 0
+        self.output = self.stdout = None
+        self.rc = None
+        self._process = None
+
+    def start(self, options, datasources, tempdir):
+        self.output = os.path.join(tempdir, 'output-%d.xml' % self.index)
+        self.stdout = os.path.join(tempdir, 'stdout-%d.txt' % self.index)
+        argfile = os.path.join(tempdir, 'arguments-%d.txt' % self.index)
+        unitfile = os.path.join(tempdir, 'unit-%d.pickle' % self.index)
+        self._write_argument_file(argfile, options, datasources, tempdir)
+        self._write_unit_file(unitfile)
+        with open(self.stdout, 'w') as stdout:
+            self._process = subprocess.Popen(
+                [sys.executable, '-m', 'robot.run', '--argumentfile', argfile],
+                stdout=stdout, stderr=subprocess.STDOUT,
+                env=self._get_env(unitfile))
+
+    def _write_argument_file(self, path, options, datasources, tempdir):
+        options = dict(options, outputdir=tempdir, output=self.output,
+                       log='NONE', report='NONE', xunitfile='NONE',
+                       debugfile='NONE', monitorcolors='off')
+        suite, test = self.selectors
+        options['suite'] = [suite]
+        if test:
+            options['test'] = [test]
+        with utf8open(path, 'w') as argfile:
+            for line in self._get_argument_lines(options, datasources):
+                argfile.write(line + '\n')
+
+    def _write_unit_file(self, path):
+        with open(path, 'wb') as unitfile:
+            pickle.dump((self.names, self.selectors[1]), unitfile)
+
+    def _get_argument_lines(self, options, datasources):
+        for name, value in sorted(options.items()):
+            if value in (None, False, []):
+                continue
+            if value is True:
+                yield '--%s' % name
+            elif isinstance(value, basestring):
+                yield '--%s %s' % (name, value)
+            else:
+                for item in value:
+                    yield '--%s %s' % (name, item)
+        for source in datasources:
+            yield source
+
+    def _get_env(self, unitfile):
+        env = os.environ.copy()
+        env['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if path)
+        env[_UNIT_FILE_VARIABLE] = unitfile
+        return env
+
+    def failed_result(self, message):
+        """Returns a result where tests of this unit have failed."""
+        suite = root = TestSuite(name=self.names[0])
+        for name in self.names[1:]:
+            suite = suite.suites.create(name=name)
+        for test in self.tests:
+            suite.tests.create(name=test.name, doc=test.doc, tags=test.tags,
+                               status='FAIL', message=message)
+        return Result(root_suite=root)
+
+    def finished(self):
+        self.rc = self._process.poll()
+        return self.rc is not None
+
+    def __str__(self):
+        suite, test = self.selectors
+        if test:
+            return "test '%s' in suite '%s'" % (test, suite)
+        return "suite '%s'" % suite
+
+
+class SuiteMerger(object):
+    """Merges results of a suite executed in parts to the first result."""
+
+    def merge(self, target, source):
+        target.starttime = self._min_time(target.starttime, source.starttime)
+        target.endtime = self._max_time(target.endtime, source.endtime)
+        target.message = target.message or source.message
+        target.keywords = self._merge_fixtures(target.keywords,
+                                               source.keywords)
+        for suite in list(source.suites):
+            existing = self._find_suite(target.suites, suite.name)
+            if existing:
+                self.merge(existing, suite)
+            else:
+                target.suites.append(suite)
+        target.tests.extend(list(source.tests))
+
+    def _min_time(self, time1, time2):
+        return min(time1, time2) if time1 and time2 else time1 or time2
+
+    def _max_time(self, time1, time2):
+        return max(time1, time2)
+
+    def _merge_fixtures(self, target, source):
+        setup = self._select_fixture(target.setup, source.setup)
+        teardown = self._select_fixture(target.teardown, source.teardown)
+        return [kw for kw in (setup, teardown) if kw]
+
+    def _select_fixture(self, ours, theirs):
+        if not ours or (theirs and ours.passed and not theirs.passed):
+            return theirs
+        return ours
+
+    def _find_suite(self, suites, name):
+        for suite in suites:
+            if suite.name == name:
+                return suite
+        return None
@@ -67,6 +67,10 @@ class _StopSignalMonitor(object):
                     'gracefully with this signal %sis not possible. '
                     'Original error was: %s' % (name, ctrlc, err))
 
+    @property
+    def signal_received(self):
+        return self._signal_count > 0
+
     def start_running_keyword(self, in_teardown):
         self._running_keyword = True
         if self._signal_count and not in_teardown:
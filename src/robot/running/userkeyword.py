@@ -50,6 +50,7 @@ class UserLibrary(BaseLibrary):
                 err = "Keyword '%s' defined multiple times" % handler.name
                 handler = UserErrorHandler(handler.name, err)
             self.handlers[handler.name] = handler
+        self._embedded_args_index = EmbeddedArgsIndex(self.embedded_arg_handlers)
 
     def _get_name_for_resource_file(self, path):
         if path is None:
@@ -59,7 +60,7 @@ class UserLibrary(BaseLibrary):
     def has_handler(self, name):
         if BaseLibrary.has_handler(self, name):
             return True
-        for template in self.embedded_arg_handlers:
+        for template in self._embedded_args_index.get_candidates(name):
             try:
                 EmbeddedArgs(name, template)
             except TypeError:
@@ -81,7 +82,7 @@ class UserLibrary(BaseLibrary):
 
     def _get_embedded_arg_handlers(self, name):
         found = []
-        for template in self.embedded_arg_handlers:
+        for template in self._embedded_args_index.get_candidates(name):
             try:
                 found.append(EmbeddedArgs(name, template))
             except TypeError:
@@ -98,6 +99,35 @@ class UserLibrary(BaseLibrary):
                         "Found: %s" % (where, name, names))
 
 
+class EmbeddedArgsIndex(object):
+    """Groups embedded argument templates by the first letter of their names.
+
+    Only templates whose name starts with the same letter as the used name,
+    or with an embedded argument, can match the name. This avoids trying
+    every template regexp with every keyword name.
+    """
+
+    def __init__(self, templates):
+        self._index = {}
+        for position, template in enumerate(templates):
+            key = self._get_key(self._get_name_prefix(template.name))
+            self._index.setdefault(key, []).append((position, template))
+
+    def _get_name_prefix(self, name):
+        var = VariableSplitter(name, identifiers=['$'])
+        return name[:var.start] if var.identifier else name
+
+    def _get_key(self, name):
+        return name[:1].lower()
+
+    def get_candidates(self, name):
+        key = self._get_key(name)
+        candidates = self._index.get(key, [])
+        if key and '' in self._index:
+            candidates = sorted(candidates + self._index[''])
+        return [template for position, template in candidates]
+
+
 class UserKeywordHandler(object):
     type = 'user'
 
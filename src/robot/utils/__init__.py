@@ -20,7 +20,7 @@ between major versions is not guaranteed.
 
 from .argumentparser import ArgumentParser
 from .application import Application
-from .compress import compress_text
+from .compress import compress_text, decompress_text
 from .connectioncache import ConnectionCache
 from .encoding import (decode_output, encode_output,
                        decode_from_system, encode_to_system, utf8open)
@@ -14,18 +14,27 @@
 
 import base64
 import sys
+import zlib
 
+# Log and report can decompress only streams having the header used by the
+# highest compression level. The level does not affect decompression, so
+# the same header can be used regardless the level.
+_HEADER = '\x78\xda'
 
-def compress_text(text):
-    return base64.b64encode(_compress(text.encode('UTF-8')))
 
+def compress_text(text, level=9):
+    compressed = _compress(text.encode('UTF-8'), level)
+    return base64.b64encode(_HEADER + compressed[2:])
 
-if not sys.platform.startswith('java'):
 
-    import zlib
+def decompress_text(text):
+    return zlib.decompress(base64.b64decode(text)).decode('UTF-8')
+
+
+if not sys.platform.startswith('java'):
 
-    def _compress(text):
-        return zlib.compress(text, 9)
+    def _compress(text, level=9):
+        return zlib.compress(text, level)
 
 else:
     # Custom compress implementation needed to avoid memory leak:
@@ -38,7 +47,8 @@ else:
 
     _DEFLATOR = Deflater(9, False)
 
-    def _compress(text):
+    def _compress(text, level=9):
+        _DEFLATOR.setLevel(level)
         _DEFLATOR.setInput(text)
         _DEFLATOR.finish()
         buf = jarray.zeros(1024, 'b')
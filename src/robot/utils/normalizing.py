@@ -13,7 +13,6 @@
 #  limitations under the License.
 
 import re
-from UserDict import UserDict
 
 
 _WHITESPACE_REGEXP = re.compile('\s+')
@@ -53,8 +52,40 @@ def normalize_tags(tags):
     return norm.keys()
 
 
-class NormalizedDict(UserDict):
-    """Custom dictionary implementation automatically normalizing keys."""
+class _CachingNormalizer(object):
+    _max_cache_size = 10000
+
+    def __init__(self, ignore, caseless, spaceless):
+        self._spec = (ignore, caseless, spaceless)
+        self._cache = {}
+
+    def normalize(self, string):
+        try:
+            return self._cache[string]
+        except KeyError:
+            if len(self._cache) >= self._max_cache_size:
+                self._cache.clear()
+            normalized = self._cache[string] = normalize(string, *self._spec)
+            return normalized
+
+
+_normalizers = {}
+
+def _get_normalizer(ignore, caseless, spaceless):
+    spec = (tuple(ignore), caseless, spaceless)
+    if spec not in _normalizers:
+        _normalizers[spec] = _CachingNormalizer(*spec).normalize
+    return _normalizers[spec]
+
+
+class NormalizedDict(dict):
+    """Custom dictionary implementation automatically normalizing keys.
+
+    Values are stored using the key that was used first. Normalized keys
+    are mapped to these original keys, and normalizing results are cached
+    and shared by all dictionaries using the same normalizing spec. Lookups
+    with the original key do not need normalizing at all.
+    """
 
     def __init__(self, initial=None, ignore=[], caseless=True, spaceless=True):
         """Initializes with possible initial value and normalizing spec.
@@ -64,9 +95,9 @@ class NormalizedDict(UserDict):
 
         Normalizing spec has exact same semantics as with `normalize` method.
         """
-        UserDict.__init__(self)
+        dict.__init__(self)
         self._keys = {}
-        self._normalize = lambda s: normalize(s, ignore, caseless, spaceless)
+        self._normalize = _get_normalizer(ignore, caseless, spaceless)
         if initial:
             self._add_initial(initial)
 
@@ -76,6 +107,12 @@ class NormalizedDict(UserDict):
         for key, value in items:
             self[key] = value
 
+    @property
+    def data(self):
+        """Normalized keys mapped to values in a new dictionary."""
+        return dict((nkey, dict.__getitem__(self, key))
+                    for nkey, key in self._keys.iteritems())
+
     def update(self, dict=None, **kwargs):
         if dict:
             for key in dict:
@@ -85,12 +122,10 @@ class NormalizedDict(UserDict):
 
     def _add_key(self, key):
         nkey = self._normalize(key)
-        self._keys.setdefault(nkey, key)
-        return nkey
+        return self._keys.setdefault(nkey, key)
 
     def set(self, key, value):
-        nkey = self._add_key(key)
-        self.data[nkey] = value
+        dict.__setitem__(self, self._add_key(key), value)
 
     __setitem__ = set
 
@@ -101,21 +136,32 @@ class NormalizedDict(UserDict):
             return default
 
     def __getitem__(self, key):
-        return self.data[self._normalize(key)]
+        try:
+            return dict.__getitem__(self, key)
+        except KeyError:
+            return dict.__getitem__(self, self._keys[self._normalize(key)])
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
 
     def pop(self, key):
-        nkey = self._normalize(key)
-        del self._keys[nkey]
-        return self.data.pop(nkey)
+        return dict.pop(self, self._keys.pop(self._normalize(key)))
 
     __delitem__ = pop
 
+    def popitem(self):
+        key, value = dict.popitem(self)
+        del self._keys[self._normalize(key)]
+        return key, value
+
     def clear(self):
-        UserDict.clear(self)
+        dict.clear(self)
         self._keys.clear()
 
     def has_key(self, key):
-        return self.data.has_key(self._normalize(key))
+        return dict.__contains__(self, key) or self._normalize(key) in self._keys
 
     __contains__ = has_key
 
@@ -132,23 +178,36 @@ class NormalizedDict(UserDict):
         return list(self.itervalues())
 
     def itervalues(self):
-        return (self[key] for key in self)
+        return (dict.__getitem__(self, key) for key in self)
 
     def items(self):
         return list(self.iteritems())
 
     def iteritems(self):
-        return ((key, self[key]) for key in self)
+        return ((key, dict.__getitem__(self, key)) for key in self)
 
     def copy(self):
-        copy = UserDict.copy(self)
+        copy = self.__class__.__new__(self.__class__)
+        copy.__dict__.update(self.__dict__)
         copy._keys = self._keys.copy()
+        dict.update(copy, self)
         return copy
 
+    __copy__ = copy
+
     def __str__(self):
         return str(dict(self.items()))
 
     def __cmp__(self, other):
+        return cmp(self.data, self._get_normalized_data(other))
+
+    def __eq__(self, other):
+        return self.data == self._get_normalized_data(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def _get_normalized_data(self, other):
         if not isinstance(other, NormalizedDict):
             other = NormalizedDict(other)
-        return UserDict.__cmp__(self, other)
+        return other.data
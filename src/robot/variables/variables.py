@@ -28,7 +28,7 @@ from robot.errors import DataError
 from robot.output import LOGGER
 
 from .isvar import is_var, is_scalar_var
-from .variablesplitter import VariableSplitter
+from .variabletemplate import get_template
 
 
 class Variables(utils.NormalizedDict):
@@ -37,6 +37,9 @@ class Variables(utils.NormalizedDict):
     Contains methods for replacing variables from list, scalars, and strings.
     On top of ${scalar} and @{list} variables these methods handle also
     %{environment} variables.
+
+    Variables can be layered using :meth:`new_scope`. Lookups fall back to
+    parent scopes and setting variables only affects the scope itself.
     """
 
     _extended_var_re = re.compile(r'''
@@ -45,10 +48,13 @@ class Variables(utils.NormalizedDict):
     ([^\s\w].+)  # extended part (group 2)
     }$           # "}" and end of the string
     ''', re.VERBOSE)
+    _extended_var_code = {}
+    _max_extended_var_code = 1000
 
     def __init__(self, identifiers=('$','@','%','&','*')):
         utils.NormalizedDict.__init__(self, ignore=['_'])
         self._identifiers = identifiers
+        self._parent = None
         importer = utils.Importer('variable file').import_class_or_module_by_path
         self._import_variable_file = partial(importer, instantiate_with_args=())
 
@@ -56,18 +62,92 @@ class Variables(utils.NormalizedDict):
         self._validate_var_name(name)
         utils.NormalizedDict.__setitem__(self, name, value)
 
+    def new_scope(self):
+        """Returns a new scope that falls back to these variables.
+
+        Unlike with :meth:`copy`, changes to these variables are visible in
+        the returned scope unless it has set the same variable itself.
+        """
+        scope = self.__class__.__new__(self.__class__)
+        scope.__dict__.update(self.__dict__)
+        scope._keys = {}
+        scope._parent = self
+        return scope
+
+    def rebase(self, parent):
+        """Makes this scope fall back to `parent`.
+
+        Variables in `parent` override variables in this scope.
+        """
+        for key in [key for key in self._keys.values() if parent.contains(key)]:
+            self.pop(key)
+        self._parent = parent
+
+    def copy(self):
+        if self._parent is None:
+            return utils.NormalizedDict.copy(self)
+        copy = self._parent.copy()
+        for key in self._keys.itervalues():
+            copy.set(key, dict.__getitem__(self, key))
+        return copy
+
+    __copy__ = copy
+
+    def _find(self, name):
+        try:
+            return dict.__getitem__(self, name)
+        except KeyError:
+            pass
+        nkey = self._normalize(name)
+        variables = self._find_scope(nkey)
+        if variables is None:
+            raise KeyError(nkey)
+        return dict.__getitem__(variables, variables._keys[nkey])
+
+    def _find_scope(self, nkey):
+        variables = self
+        while variables is not None and nkey not in variables._keys:
+            variables = variables._parent
+        return variables
+
+    def _get_keys(self):
+        if self._parent is None:
+            return self._keys
+        keys = self._keys.copy()
+        keys.update(self._parent._get_keys())
+        return keys
+
+    def __iter__(self):
+        keys = self._get_keys()
+        return (keys[nkey] for nkey in sorted(keys))
+
+    def __len__(self):
+        return len(self._get_keys())
+
+    def __nonzero__(self):
+        return bool(self._keys) or bool(self._parent)
+
+    def itervalues(self):
+        return (self._find(key) for key in self)
+
+    def iteritems(self):
+        return ((key, self._find(key)) for key in self)
+
+    @property
+    def data(self):
+        return dict((self._normalize(key), value)
+                    for key, value in self.iteritems())
+
     def update(self, dict=None, **kwargs):
         if dict:
             self._validate_var_dict(dict)
-            UserDict.update(self, dict)
-            for key in dict:
-                self._add_key(key)
+            utils.NormalizedDict.update(self, dict)
         if kwargs:
             self.update(kwargs)
 
     def __getitem__(self, name):
         self._validate_var_name(name)
-        try: return utils.NormalizedDict.__getitem__(self, name)
+        try: return self._find(name)
         except KeyError:
             try: return self._get_number_var(name)
             except ValueError:
@@ -105,10 +185,20 @@ class Variables(utils.NormalizedDict):
         except DataError, err:
             raise DataError(err_pre + unicode(err))
         try:
-            return eval('_BASE_VAR_' + expression, {'_BASE_VAR_': variable})
+            code = self._compile_extended_var(expression)
+            return eval(code, {'_BASE_VAR_': variable})
         except:
             raise DataError(err_pre + utils.get_error_message())
 
+    def _compile_extended_var(self, expression):
+        cache = self._extended_var_code
+        if expression not in cache:
+            if len(cache) >= self._max_extended_var_code:
+                cache.clear()
+            cache[expression] = compile('_BASE_VAR_' + expression,
+                                        '<string>', 'eval')
+        return cache[expression]
+
     def _get_number_var(self, name):
         if name[0] != '$':
             raise ValueError
@@ -144,8 +234,8 @@ class Variables(utils.NormalizedDict):
         if not (isinstance(item, basestring) and
                 item.startswith('@{') and item.endswith('}')):
             return None
-        var = VariableSplitter(item, self._identifiers)
-        if var.start != 0 or var.end != len(item):
+        var = get_template(item, self._identifiers).variable
+        if var is None:
             return None
         return '@{%s}' % var.get_replaced_base(self)
 
@@ -158,39 +248,42 @@ class Variables(utils.NormalizedDict):
         """
         if self._cannot_have_variables(item):
             return utils.unescape(item)
-        var = VariableSplitter(item, self._identifiers)
-        if var.identifier and var.base and var.start == 0 and var.end == len(item):
+        template = get_template(item, self._identifiers)
+        var = template.variable
+        if var is not None and var.identifier and var.base:
             return self._get_variable(var)
-        return self.replace_string(item, var)
+        return self._replace_template(template)
 
     def _cannot_have_variables(self, item):
         return (not isinstance(item, basestring)) or '{' not in item
 
     def replace_string(self, string, splitted=None, ignore_errors=False):
-        """Replaces variables from a string. Result is always a string."""
+        """Replaces variables from a string. Result is always a string.
+
+        `splitted` is not used anymore and is preserved only for backwards
+        compatibility. Strings are split into variables only once and the
+        result is cached.
+        """
         if self._cannot_have_variables(string):
             return utils.unescape(string)
+        return self._replace_template(get_template(string, self._identifiers),
+                                      ignore_errors)
+
+    def _replace_template(self, template, ignore_errors=False):
         result = []
-        if splitted is None:
-            splitted = VariableSplitter(string, self._identifiers)
-        while True:
-            if splitted.identifier is None:
-                result.append(utils.unescape(string))
-                break
-            result.append(utils.unescape(string[:splitted.start]))
+        for literal, var, raw in template.parts:
+            result.append(literal)
             try:
-                value = self._get_variable(splitted)
+                value = self._get_variable(var)
             except DataError:
                 if not ignore_errors:
                     raise
-                value = string[splitted.start:splitted.end]
+                value = raw
             if not isinstance(value, basestring):
                 value = utils.unic(value)
             result.append(value)
-            string = string[splitted.end:]
-            splitted = VariableSplitter(string, self._identifiers)
-        result = ''.join(result)
-        return result
+        result.append(template.tail)
+        return ''.join(result)
 
     def _get_variable(self, var):
         """'var' is an instance of a VariableSplitter"""
@@ -343,4 +436,4 @@ class Variables(utils.NormalizedDict):
     def contains(self, variable, extended=False):
         if extended:
             return self.has_key(variable)
-        return utils.NormalizedDict.has_key(self, variable)
+        return self._find_scope(self._normalize(variable)) is not None
@@ -0,0 +1,62 @@
+#  Copyright 2008-2012 Nokia Siemens Networks Oyj
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from robot import utils
+
+from .variablesplitter import VariableSplitter
+
+
+class VariableTemplate(object):
+    """String compiled into literal and variable segments.
+
+    Splitting strings into variables is relatively slow, so templates are
+    cached and same strings, such as arguments of keywords inside loops,
+    are split only once. Use :func:`get_template` to get cached templates.
+
+    :ivar parts: List of `(literal, variable, raw)` tuples where `literal`
+        is already unescaped text preceding the variable, `variable` is
+        a :class:`VariableSplitter` and `raw` the variable in original form.
+    :ivar tail: Unescaped text after the last variable.
+    :ivar variable: :class:`VariableSplitter` if the whole string is
+        a single variable, otherwise `None`.
+    """
+    __slots__ = ['parts', 'tail', 'variable']
+
+    def __init__(self, string, identifiers):
+        self.parts = []
+        self.variable = None
+        splitted = VariableSplitter(string, identifiers)
+        if splitted.start == 0 and splitted.end == len(string):
+            self.variable = splitted
+        while splitted.identifier is not None:
+            self.parts.append((utils.unescape(string[:splitted.start]),
+                               splitted, string[splitted.start:splitted.end]))
+            string = string[splitted.end:]
+            splitted = VariableSplitter(string, identifiers)
+        self.tail = utils.unescape(string)
+
+
+_templates = {}
+_max_templates = 10000
+
+
+def get_template(string, identifiers):
+    key = (string, tuple(identifiers))
+    try:
+        return _templates[key]
+    except KeyError:
+        if len(_templates) >= _max_templates:
+            _templates.clear()
+        template = _templates[key] = VariableTemplate(string, identifiers)
+        return template
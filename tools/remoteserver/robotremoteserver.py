@@ -16,18 +16,32 @@ import sys
 import inspect
 import traceback
 from StringIO import StringIO
-from SimpleXMLRPCServer import SimpleXMLRPCServer
+from SimpleXMLRPCServer import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
 try:
     import signal
 except ImportError:
     signal = None
 
 
+class RobotRemoteRequestHandler(SimpleXMLRPCRequestHandler):
+    # Persistent connections require Python 2.7 or newer. Idle connections
+    # are closed after a timeout so that they do not block other clients.
+    if sys.version_info >= (2, 7):
+        protocol_version = 'HTTP/1.1'
+    timeout = 1
+
+    def log_message(self, format, *args):
+        if self.server.logRequests:
+            SimpleXMLRPCRequestHandler.log_message(self, format, *args)
+
+
 class RobotRemoteServer(SimpleXMLRPCServer):
     allow_reuse_address = True
 
     def __init__(self, library, host='localhost', port=8270, allow_stop=True):
-        SimpleXMLRPCServer.__init__(self, (host, int(port)), logRequests=False)
+        SimpleXMLRPCServer.__init__(self, (host, int(port)),
+                                    RobotRemoteRequestHandler,
+                                    logRequests=False)
         self._library = library
         self._allow_stop = allow_stop
         self._register_functions()
@@ -39,9 +53,11 @@ class RobotRemoteServer(SimpleXMLRPCServer):
     def _register_functions(self):
         self.register_function(self.get_keyword_names)
         self.register_function(self.run_keyword)
+        self.register_function(self.run_keywords)
         self.register_function(self.get_keyword_arguments)
         self.register_function(self.get_keyword_documentation)
         self.register_function(self.stop_remote_server)
+        self.register_introspection_functions()
 
     def _register_signal_handlers(self):
         def stop_with_signal(signum, frame):
@@ -90,6 +106,14 @@ class RobotRemoteServer(SimpleXMLRPCServer):
         result['output'] = self._restore_stdout()
         return result
 
+    def run_keywords(self, keywords):
+        results = []
+        for name, args in keywords:
+            results.append(self.run_keyword(name, args))
+            if results[-1]['status'] != 'PASS':
+                break
+        return results
+
     def get_keyword_arguments(self, name):
         kw = self._get_keyword(name)
         if not kw:
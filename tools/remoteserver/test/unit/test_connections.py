@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+
+import unittest
+import threading
+import socket
+import httplib
+import xmlrpclib
+from os.path import abspath, dirname as parent, join
+import sys
+
+REMOTEDIR = parent(parent(parent(abspath(__file__))))
+sys.path.insert(0, REMOTEDIR)
+sys.path.insert(0, join(parent(parent(REMOTEDIR)), 'src'))
+
+from robotremoteserver import RobotRemoteServer
+from robot.libraries.Remote import Remote, PersistentTransport
+from robot.errors import RemoteError
+
+
+class Library:
+    def __init__(self):
+        self.calls = []
+    def add(self, value):
+        self.calls.append(value)
+        return len(self.calls)
+    def fail(self, message):
+        raise AssertionError(message)
+
+
+class ThreadedServer(RobotRemoteServer):
+    started = threading.Event()
+
+    def _register_signal_handlers(self):
+        pass
+
+    def _log(self, msg, level=None):
+        pass
+
+    def serve_forever(self):
+        ThreadedServer.instance = self
+        self.started.set()
+        RobotRemoteServer.serve_forever(self)
+
+
+class NoBatchingServer(ThreadedServer):
+
+    def _register_functions(self):
+        ThreadedServer._register_functions(self)
+        del self.funcs['run_keywords']
+        del self.funcs['system.listMethods']
+
+
+class _RemoteTests(unittest.TestCase):
+    server = ThreadedServer
+    persistent = True
+
+    def setUp(self):
+        self.library = Library()
+        self.server.started.clear()
+        self.thread = threading.Thread(target=self.server,
+                                       args=(self.library, 'localhost', 0))
+        self.thread.start()
+        self.server.started.wait(5)
+        port = self.server.instance.server_address[1]
+        self.remote = Remote('localhost:%d' % port, self.persistent)
+
+    def tearDown(self):
+        self.remote.run_keyword('stop_remote_server', [])
+        self.remote._client._server('close')()
+        self.thread.join(5)
+
+    def test_run_keyword(self):
+        for index in range(1, 6):
+            self.assertEquals(self.remote.run_keyword('add', [index]), index)
+
+    def test_run_keywords(self):
+        self.assertEquals(self.remote.run_keywords([('add', ['a']),
+                                                    ('add', ['b'])]), [1, 2])
+        self.assertEquals(self.library.calls, ['a', 'b'])
+
+    def test_run_keywords_stops_to_failure(self):
+        self.assertRaises(RemoteError, self.remote.run_keywords,
+                          [('add', [1]), ('fail', ['x']), ('add', [2])])
+        self.assertEquals(self.library.calls, [1])
+
+
+class TestPersistentConnections(_RemoteTests):
+
+    def test_connection_is_reused(self):
+        self.remote.run_keyword('add', [1])
+        http = self.remote._client._server._ServerProxy__transport._http
+        self.remote.run_keyword('add', [2])
+        self.assertTrue(
+            self.remote._client._server._ServerProxy__transport._http is http)
+
+
+class TestNonPersistentConnections(_RemoteTests):
+    persistent = False
+
+
+class TestServerWithoutBatching(_RemoteTests):
+    server = NoBatchingServer
+
+    def test_falls_back_to_running_keywords_one_by_one(self):
+        self.remote.run_keywords([('add', [1])])
+        self.assertFalse(self.remote._client.supports_multiple_keywords())
+
+
+class ScriptedServer(object):
+    """HTTP server responding to requests as told by the given actions.
+
+    Actions are `ok` for a normal response, `close` for closing the
+    connection without a response, and `partial` for closing it in the
+    middle of a response.
+    """
+
+    def __init__(self, *actions):
+        self.actions = list(actions)
+        self.requests = 0
+        self._socket = socket.socket()
+        self._socket.bind(('localhost', 0))
+        self._socket.listen(5)
+        self.address = 'localhost:%d' % self._socket.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve)
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def _serve(self):
+        while self.actions:
+            connection = self._socket.accept()[0]
+            input = connection.makefile('rb')
+            while self.actions and self._read_request(input):
+                self.requests += 1
+                action = self.actions.pop(0)
+                if action == 'close':
+                    break
+                body = xmlrpclib.dumps((self.requests,), methodresponse=True)
+                headers = ('HTTP/1.1 200 OK\r\nContent-Type: text/xml\r\n'
+                           'Content-Length: %d\r\n\r\n' % len(body))
+                if action == 'partial':
+                    body = body[:10]
+                connection.sendall(headers + body)
+                if action == 'partial':
+                    break
+            input.close()
+            connection.close()
+        self._socket.close()
+
+    def _read_request(self, input):
+        length = 0
+        while True:
+            line = input.readline()
+            if not line:
+                return False
+            if line == '\r\n':
+                break
+            if line.lower().startswith('content-length:'):
+                length = int(line.split(':')[1])
+        input.read(length)
+        return True
+
+
+class TestPersistentTransportRetrying(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = PersistentTransport()
+
+    def tearDown(self):
+        self.transport.close()
+
+    def _request(self, server):
+        body = xmlrpclib.dumps(('kw',), 'run_keyword')
+        return self.transport.request(server.address, '/RPC2', body)
+
+    def test_request_is_retried_when_idle_connection_is_closed(self):
+        server = ScriptedServer('ok', 'close', 'ok')
+        self.assertEquals(self._request(server), (1,))
+        self.assertEquals(self._request(server), (3,))
+        self.assertEquals(server.requests, 3)
+
+    def test_request_is_not_retried_if_failing_after_response_started(self):
+        server = ScriptedServer('ok', 'partial', 'ok')
+        self._request(server)
+        self.assertRaises(httplib.HTTPException, self._request, server)
+        self.assertEquals(server.requests, 2)
+        self.assertEquals(self._request(server), (3,))
+
+    def test_request_on_new_connection_is_not_retried(self):
+        server = ScriptedServer('close', 'ok')
+        self.assertRaises(httplib.BadStatusLine, self._request, server)
+        self.assertEquals(server.requests, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
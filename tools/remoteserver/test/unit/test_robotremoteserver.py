@@ -59,6 +59,12 @@ class TestStaticApi(unittest.TestCase):
             self.assertEquals(ret['status'], 'FAIL')
             self.assertEquals(ret['error'], 'Hello, world!')
 
+    def test_run_keywords_stops_to_first_failure(self):
+        ret = self.server.run_keywords([('passing_keyword', []),
+                                        ('failing_keyword', [ValueError]),
+                                        ('passing_keyword', [])])
+        self.assertEquals([r['status'] for r in ret], ['PASS', 'FAIL'])
+
     def test_return_only_exception_name_if_no_error_message(self):
         for exception in AssertionError, ValueError:
             ret = self.server.run_keyword('failing_keyword', [exception, ''])
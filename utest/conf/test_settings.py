@@ -114,6 +114,34 @@ class TestRobotAndRebotSettings(unittest.TestCase):
     def _verify_invalid_log_level(self, input):
         self.assertRaises(DataError, RobotSettings, {'loglevel': input})
 
+    def test_binary_output_keeps_log_and_report_enabled(self):
+        settings = RobotSettings({'output': 'NONE', 'binaryoutput': 'out',
+                                  'outputdir': os.curdir})
+        assert_equals(settings.output, None)
+        assert_equals(settings.binary_output, abspath('out.rfb'))
+        assert_equals(settings.log, abspath('log.html'))
+        datasource, rebot = settings.get_rebot_datasource_and_settings()
+        assert_equals(datasource, abspath('out.rfb'))
+        assert_equals(rebot.binary_output, None)
+
+    def test_output_none_disables_log_and_report(self):
+        settings = RobotSettings({'output': 'NONE'})
+        assert_equals(settings.binary_output, None)
+        assert_equals(settings.log, None)
+
+    def test_compression_config(self):
+        assert_equals(RebotSettings().compression_config,
+                      {'compression_level': 9, 'compress_blocks': False})
+        settings = RebotSettings({'compressionlevel': '0',
+                                  'compressblocks': True})
+        assert_equals(settings.compression_config,
+                      {'compression_level': 0, 'compress_blocks': True})
+
+    def test_invalid_compression_level_uses_default(self):
+        for level in ['10', '-1', 'invalid']:
+            settings = RebotSettings({'compressionlevel': level})
+            assert_equals(settings.compression_config['compression_level'], 9)
+
 
 if __name__ == '__main__':
     unittest.main()
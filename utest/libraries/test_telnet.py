@@ -0,0 +1,202 @@
+import re
+import socket
+import unittest
+from telnetlib import IAC, DO, WILL, WONT, SB, SE, ECHO, theNULL
+
+from robot.utils.asserts import assert_equals, assert_true
+
+from robot.libraries.Telnet import (TelnetConnection, _TextMatcher,
+                                    _RegexpMatcher)
+
+
+TTYPE = chr(24)
+
+
+class Socket(object):
+    """Returns the given chunks one by one from `recv`.
+
+    A real socket pair, that always has data available, is needed to make
+    `select` work.
+    """
+
+    def __init__(self, *chunks):
+        self.chunks = list(chunks)
+        self.sent = []
+        self._reader, self._writer = socket.socketpair()
+        self._writer.sendall('x')
+
+    def recv(self, size):
+        return self.chunks.pop(0) if self.chunks else ''
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+    def fileno(self):
+        return self._reader.fileno()
+
+    def close(self):
+        self._reader.close()
+        self._writer.close()
+
+
+class _ConnectionTest(unittest.TestCase):
+
+    def setUp(self):
+        self._sockets = []
+
+    def tearDown(self):
+        for sock in self._sockets:
+            sock.close()
+
+    def _connection(self, *chunks):
+        conn = TelnetConnection()
+        conn.sock = Socket(*chunks)
+        self._sockets.append(conn.sock)
+        return conn
+
+    def _process(self, conn, *chunks):
+        for chunk in chunks:
+            conn.rawq += chunk
+            conn.process_rawq()
+        return conn.cookedq
+
+
+class TestProcessRawq(_ConnectionTest):
+
+    def test_text_is_processed_in_bulk(self):
+        conn = self._connection()
+        assert_equals(self._process(conn, 'first\r\n', 'sec%sond\021' % theNULL),
+                      'first\r\nsecond')
+        assert_equals(conn.rawq, '')
+
+    def test_option_negotiation(self):
+        conn = self._connection()
+        output = self._process(conn, 'a' + IAC + WILL + ECHO + 'b' +
+                                     IAC + DO + TTYPE + 'c')
+        assert_equals(output, 'abc')
+        assert_equals(conn.sock.sent, [IAC + DO + ECHO, IAC + WONT + TTYPE])
+
+    def test_iac_sequence_split_across_chunks(self):
+        conn = self._connection()
+        output = self._process(conn, 'a' + IAC, WILL, ECHO + 'b' + IAC + DO,
+                               TTYPE + 'c')
+        assert_equals(output, 'abc')
+        assert_equals(conn.sock.sent, [IAC + DO + ECHO, IAC + WONT + TTYPE])
+
+    def test_escaped_iac(self):
+        conn = self._connection()
+        assert_equals(self._process(conn, 'a' + IAC, IAC + 'b'), 'a' + IAC + 'b')
+
+    def test_subnegotiation_split_across_chunks(self):
+        conn = self._connection()
+        output = self._process(conn, 'a' + IAC + SB + TTYPE, 'sub', 'data' + IAC,
+                               SE + 'b')
+        assert_equals(output, 'ab')
+        assert_equals(conn.read_sb_data(), TTYPE + 'subdata')
+        assert_equals(conn.sock.sent, [])
+
+
+class TestReadUntil(_ConnectionTest):
+
+    def test_text_split_across_reads(self):
+        conn = self._connection('output before exp', 'ected', ' and after')
+        assert_equals(conn._read_until(_TextMatcher('expected'), 1),
+                      (True, 'output before expected'))
+        assert_equals(conn.cookedq, '')
+        assert_equals(conn._read_until(_TextMatcher('after'), 1),
+                      (True, ' and after'))
+
+    def test_output_after_match_is_left_unread(self):
+        conn = self._connection('first match, second match, rest')
+        assert_equals(conn._read_until(_TextMatcher('match'), 1),
+                      (True, 'first match'))
+        assert_equals(conn.cookedq, ', second match, rest')
+        assert_equals(conn._read_until(_TextMatcher('match'), 1),
+                      (True, ', second match'))
+
+    def test_regexp_split_across_reads(self):
+        conn = self._connection('prompt [us', 'er@host ~]', '$ rest')
+        matcher = _RegexpMatcher([r'\[\w+@\w+ ~\]\$'])
+        assert_equals(conn._read_until(matcher, 1),
+                      (True, 'prompt [user@host ~]$'))
+        assert_equals(conn.cookedq, ' rest')
+
+    def test_match_split_by_iac_sequence(self):
+        conn = self._connection('exp' + IAC, WILL + ECHO + 'ected')
+        assert_equals(conn._read_until(_TextMatcher('expected'), 1),
+                      (True, 'expected'))
+        assert_equals(conn.sock.sent, [IAC + DO + ECHO])
+
+    def test_no_match(self):
+        conn = self._connection('some', 'output')
+        assert_equals(conn._read_until(_TextMatcher('expected'), 1),
+                      (False, 'someoutput'))
+
+
+class TestTextMatcher(unittest.TestCase):
+
+    def test_match_in_one_feed(self):
+        assert_equals(_TextMatcher('bar').feed('foo bar baz'), 7)
+
+    def test_match_split_across_feeds(self):
+        matcher = _TextMatcher('expected')
+        for output in 'xxx', 'ex', 'p', 'ect':
+            assert_equals(matcher.feed(output), -1)
+        assert_equals(matcher.feed('ed!'), 11)
+
+    def test_only_possible_start_of_match_is_kept(self):
+        matcher = _TextMatcher('abc')
+        assert_equals(matcher.feed('x' * 1000 + 'a'), -1)
+        assert_equals(matcher._tail, 'xa')
+        assert_equals(matcher.feed('bc'), 1003)
+
+    def test_single_character(self):
+        matcher = _TextMatcher('$')
+        assert_equals(matcher.feed('no prompt'), -1)
+        assert_equals(matcher.feed('prompt $ '), 17)
+
+
+class TestRegexpMatcher(unittest.TestCase):
+
+    def setUp(self):
+        _RegexpMatcher._window_size = 10
+
+    def tearDown(self):
+        _RegexpMatcher._window_size = 64 * 1024
+
+    def test_match_split_across_feeds(self):
+        matcher = _RegexpMatcher(['a+b'])
+        assert_equals(matcher.feed('xaa'), -1)
+        assert_equals(matcher.feed('ab'), 5)
+
+    def test_patterns_are_tried_in_given_order(self):
+        assert_equals(_RegexpMatcher(['d', 'b']).feed('abcd'), 4)
+        assert_equals(_RegexpMatcher([re.compile('b'), 'd']).feed('abcd'), 2)
+
+    def test_window_slides(self):
+        matcher = _RegexpMatcher(['x.*y'])
+        assert_equals(matcher.feed('x' + '-' * 20), -1)
+        assert_equals(len(matcher._window), 11)
+        assert_equals(matcher.feed('y'), -1)
+        assert_equals(matcher.feed('x-y'), 25)
+
+    def test_match_at_end_of_window(self):
+        matcher = _RegexpMatcher(['ab'])
+        assert_equals(matcher.feed('-' * 30 + 'a'), -1)
+        assert_equals(matcher.feed('b'), 32)
+
+    def test_word_boundary_does_not_match_at_start_of_slid_window(self):
+        matcher = _RegexpMatcher([r'\bord'])
+        assert_equals(matcher.feed('-----wordxxxxxxx'), -1)
+        assert_equals(matcher._window, 'wordxxxxxxx')
+        assert_equals(matcher.feed(''), -1)
+        assert_equals(matcher.feed(' ord'), 20)
+
+    def test_window_is_not_slid_when_small(self):
+        matcher = _RegexpMatcher(['z'])
+        matcher.feed('abc')
+        assert_true(matcher._window == 'abc' and matcher._start == 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -154,6 +154,48 @@ class TestTagPatterns(unittest.TestCase):
         assert_false(patterns.match(['a', 'b', 'c', 'd', 'e', 'f']))
         assert_false(patterns.match(['a', 'b', 'c', 'd', 'e']))
 
+    def test_match_string(self):
+        patterns = TagPatterns(['x', 'y*'])
+        assert_true(patterns.match('X'))
+        assert_true(patterns.match('y_y'))
+        assert_false(patterns.match('z'))
+
+    def test_match_normalizes_tags(self):
+        patterns = TagPatterns(['xANDy', 'Foo Bar'])
+        assert_true(patterns.match(['X', 'y']))
+        assert_true(patterns.match(['foo_bar']))
+        assert_true(patterns.match(['FOOBAR']))
+
+    def test_none_and_empty_tags_are_ignored(self):
+        patterns = TagPatterns(['*', 'xNOTNONE'])
+        assert_false(patterns.match(['NONE']))
+        assert_false(patterns.match(['', 'n o n e']))
+        assert_true(patterns.match(['x', 'none']))
+
+    def test_tags_seen_after_pattern_was_used(self):
+        patterns = TagPatterns(['new*'])
+        assert_false(patterns.match(['old']))
+        assert_true(patterns.match(['old', 'newer tag not seen before']))
+        assert_true(patterns.match(['newest tag not seen before']))
+        assert_false(patterns.match(['old']))
+
+    def test_memory_does_not_grow_with_distinct_tags(self):
+        patterns = TagPatterns(['tag*', 'x NOT y'])
+        index = patterns._index
+        for i in range(index._max_cached_tags + 100):
+            tags = ['tag%d' % i, 'other%d' % i]
+            assert_true(patterns.match(tags))
+            assert_true(index.bits(tags) < 1 << 3)
+        assert_true(len(index._cache) <= index._max_cached_tags)
+
+    def test_patterns_do_not_share_state(self):
+        first = TagPatterns(['a*'])
+        second = TagPatterns(['b*', 'a'])
+        assert_true(first.match(['a1']))
+        assert_false(second.match(['a1']))
+        assert_true(second.match(['b1']))
+        assert_false(first.match(['b1']))
+
     def test_seq2str(self):
         patterns = TagPatterns([u'is\xe4', u'\xe4iti'])
         assert_equal(utils.seq2str(patterns), u"'is\xe4' and '\xe4iti'")
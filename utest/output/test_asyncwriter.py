@@ -0,0 +1,99 @@
+from __future__ import with_statement
+import os
+import tempfile
+import unittest
+
+from robot.output.asyncwriter import AsyncFileWriter
+from robot.output.xmllogger import XmlLogger
+from robot.result import ExecutionResult
+from robot.utils.asserts import assert_equals, assert_raises_with_msg
+
+
+class TestAsyncFileWriter(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_write(self):
+        writer = AsyncFileWriter(self.path, chunk_size=10)
+        for index in range(1000):
+            writer.write('%d\n' % index)
+        writer.close()
+        assert_equals(self._read(), ''.join('%d\n' % i for i in range(1000)))
+
+    def test_flush_and_sync(self):
+        writer = AsyncFileWriter(self.path)
+        writer.write('first')
+        writer.flush()
+        assert_equals(self._read(), 'first')
+        writer.write(' second')
+        writer.sync()
+        writer.flush()
+        assert_equals(self._read(), 'first second')
+        writer.close()
+
+    def test_close_is_idempotent(self):
+        writer = AsyncFileWriter(self.path)
+        writer.write('data')
+        writer.close()
+        writer.close()
+        assert_equals(self._read(), 'data')
+
+    def test_errors_are_raised_by_subsequent_calls(self):
+        writer = AsyncFileWriter(self.path)
+        writer._file = FailingFile()
+        writer.write('data')
+        assert_raises_with_msg(IOError, 'Disk full', writer.flush)
+        assert_raises_with_msg(IOError, 'Disk full', writer.write, 'more')
+        assert_raises_with_msg(IOError, 'Disk full', writer.close)
+
+    def _read(self):
+        with open(self.path) as output:
+            return output.read()
+
+
+class FailingFile(object):
+
+    def write(self, data):
+        raise IOError('Disk full')
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestAsyncXmlLogger(unittest.TestCase):
+
+    def test_output_is_written(self):
+        fd, path = tempfile.mkstemp(suffix='.xml')
+        os.close(fd)
+        try:
+            logger = XmlLogger(path, asynchronous=True, fsync=True)
+            logger.start_suite(Suite())
+            logger.end_suite(Suite())
+            logger.close()
+            assert_equals(ExecutionResult(path).suite.name, 'My Suite')
+        finally:
+            os.remove(path)
+
+
+class Suite(object):
+    id = 's1'
+    name = 'My Suite'
+    source = None
+    metadata = {}
+    doc = ''
+    status = 'PASS'
+    message = ''
+    starttime = endtime = '20121212 12:12:12.121'
+    elapsedtime = 0
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -58,6 +58,9 @@ class ListenOutputs(object):
     def xunit_file(self, path):
         self._out_file('XUnit', path)
 
+    def profile_file(self, path):
+        self._out_file('Profile', path)
+
     def _out_file(self, name, path):
         print '%s: %s' % (name, path)
 
@@ -171,6 +174,10 @@ class _BaseListenerTest:
         self.listeners.output_file('XUnit', 'path/to/xunit')
         self._assert_output('XUnit: path/to/xunit')
 
+    def test_profile_file(self):
+        self.listeners.output_file('Profile', 'path/to/profile')
+        self._assert_output('Profile: path/to/profile')
+
     def test_close(self):
         self.listeners.close()
         self._assert_output('Closing...')
@@ -0,0 +1,101 @@
+import unittest
+from StringIO import StringIO
+
+from robot.output import profiler
+from robot.output.profiler import _KeywordProfiler
+from robot.utils.asserts import assert_equals, assert_true
+
+
+class FakeTime(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+
+class Output(StringIO):
+    name = 'profile.txt'
+
+    def close(self):
+        self.value = self.getvalue()
+        StringIO.close(self)
+
+
+class Keyword(object):
+
+    def __init__(self, name, type='kw', assign=None):
+        self.name = name
+        self.type = type
+        self.assign = assign
+
+
+class TestKeywordProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self._time = profiler.time
+        profiler.time = FakeTime()
+        self.output = Output()
+        self.stdout = StringIO()
+        self.profiler = _KeywordProfiler(self.output, top=2,
+                                         stdout=self.stdout)
+        self.profiler.start_suite(None)
+
+    def tearDown(self):
+        profiler.time = self._time
+
+    def test_collapsed_stacks(self):
+        self._run('Outer', 1, [('Lib.Inner', 2, []), ('Lib.Inner', 3, [])])
+        self._run('Lib.Inner', 4, [])
+        self.profiler.end_suite(None)
+        assert_equals(self.output.value, 'Lib.Inner 4000000\n'
+                                         'Outer 1000000\n'
+                                         'Outer;Lib.Inner 5000000\n')
+
+    def test_summary(self):
+        self._run('Outer', 1, [('Lib.Inner', 2, []), ('Lib.Inner', 3, [])])
+        self._run('Other', 0.5, [])
+        self.profiler.end_suite(None)
+        lines = self.stdout.getvalue().splitlines()
+        assert_equals(lines[0], 'Top 2 keywords by self time:')
+        assert_equals(lines[2].split(), ['5.000', '5.000', '2', 'Lib.Inner'])
+        assert_equals(lines[3].split(), ['1.000', '6.000', '1', 'Outer'])
+        assert_equals(len(lines), 4)
+
+    def test_recursive_calls_are_counted_once_in_total(self):
+        self._run('Rec', 1, [('Rec', 1, [('Rec', 1, [])])])
+        self.profiler.end_suite(None)
+        assert_equals(self.stdout.getvalue().splitlines()[2].split(),
+                      ['3.000', '3.000', '3', 'Rec'])
+        assert_equals(self.output.value, 'Rec 1000000\nRec;Rec 1000000\n'
+                                         'Rec;Rec;Rec 1000000\n')
+
+    def test_loops_are_ignored_and_assignment_removed(self):
+        self.profiler.start_keyword(Keyword('${x} IN [ a ]', type='for'))
+        self.profiler.start_keyword(Keyword('${x} = a', type='foritem'))
+        self._run('${y} = Lib.Get', 1, [], assign=['${y} ='])
+        self.profiler.end_keyword(Keyword('${x} = a', type='foritem'))
+        self.profiler.end_keyword(Keyword('${x} IN [ a ]', type='for'))
+        self.profiler.end_suite(None)
+        assert_equals(self.output.value, 'Lib.Get 1000000\n')
+
+    def test_close_only_after_top_level_suite(self):
+        self.profiler.start_suite(None)
+        self.profiler.end_suite(None)
+        assert_true(not self.output.closed)
+        self.profiler.end_suite(None)
+        assert_true(self.output.closed)
+        self.profiler.close()
+
+    def _run(self, name, own_time, children, assign=None):
+        kw = Keyword(name, assign=assign)
+        self.profiler.start_keyword(kw)
+        profiler.time.now += own_time
+        for child in children:
+            self._run(*child)
+        self.profiler.end_keyword(kw)
+
+
+if __name__ == '__main__':
+    unittest.main()
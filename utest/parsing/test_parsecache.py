@@ -0,0 +1,90 @@
+from __future__ import with_statement
+import os
+import shutil
+import tempfile
+import unittest
+
+from robot.parsing import populators
+from robot.parsing.model import TestCaseFile
+from robot.parsing.parsecache import ParseCache
+from robot.utils.asserts import assert_equals, assert_true, assert_false
+
+DATA = '''\
+*** Test Cases ***
+Example
+    Log    ${CURDIR}
+'''
+
+
+class FailingReader(object):
+
+    def read(self, source, populator):
+        raise AssertionError('Reader should not have been used.')
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.mkdtemp()
+        self._cachedir = os.path.join(self._tempdir, 'cache')
+        self._orig_cache = populators.PARSE_CACHE
+        self._orig_reader = populators.READERS['txt']
+        populators.PARSE_CACHE = ParseCache(self._cachedir)
+
+    def tearDown(self):
+        populators.PARSE_CACHE = self._orig_cache
+        populators.READERS['txt'] = self._orig_reader
+        shutil.rmtree(self._tempdir)
+
+    def test_disabled_by_default(self):
+        assert_false(ParseCache())
+        assert_true(ParseCache(self._cachedir))
+
+    def test_cached_data_is_used(self):
+        path = self._create_file('tests.txt', DATA)
+        self._verify(self._parse(path), path)
+        assert_equals(len(os.listdir(self._cachedir)), 1)
+        populators.READERS['txt'] = FailingReader
+        self._verify(self._parse(path), path)
+
+    def test_curdir_is_replaced_when_populating(self):
+        path = self._create_file('tests.txt', DATA)
+        self._parse(path)
+        moved = os.path.join(self._tempdir, 'moved')
+        os.mkdir(moved)
+        other = self._create_file(os.path.join('moved', 'tests.txt'), DATA)
+        shutil.copystat(path, other)
+        populators.PARSE_CACHE.set(other, populators.PARSE_CACHE.get(path))
+        populators.READERS['txt'] = FailingReader
+        self._verify(self._parse(other), other)
+
+    def test_modified_file_is_read_again(self):
+        path = self._create_file('tests.txt', DATA)
+        self._parse(path)
+        self._create_file('tests.txt', DATA + 'Another\n    No Operation\n')
+        assert_equals(len(self._parse(path).testcase_table.tests), 2)
+
+    def test_invalid_cache_file_is_ignored(self):
+        path = self._create_file('tests.txt', DATA)
+        self._parse(path)
+        for name in os.listdir(self._cachedir):
+            self._create_file(os.path.join('cache', name), 'invalid')
+        self._verify(self._parse(path), path)
+
+    def _create_file(self, name, content):
+        path = os.path.join(self._tempdir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def _parse(self, path):
+        return TestCaseFile(source=path).populate()
+
+    def _verify(self, datafile, path):
+        test = datafile.testcase_table.tests[0]
+        assert_equals(test.name, 'Example')
+        assert_equals(test.steps[0].args, [os.path.dirname(path)])
+
+
+if __name__ == '__main__':
+    unittest.main()
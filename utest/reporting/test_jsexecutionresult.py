@@ -4,8 +4,12 @@ from robot.utils.asserts import assert_true, assert_equals
 from test_jsmodelbuilders import remap
 from robot.reporting.jsexecutionresult import (JsExecutionResult,
                                                _KeywordRemover, StringIndex)
-from robot.reporting.jsmodelbuilders import SuiteBuilder, JsBuildingContext
+from robot.reporting.jsmodelbuilders import (SuiteBuilder, JsBuildingContext,
+                                             JsModelBuilder)
+from robot.reporting.stringcache import StringCache
+from robot.result.executionresult import Result
 from robot.result.testsuite import TestSuite
+from robot.utils import compress_text
 
 
 class TestRemoveDataNotNeededInReport(unittest.TestCase):
@@ -68,6 +72,32 @@ class TestRemoveDataNotNeededInReport(unittest.TestCase):
         assert_equals(strings, tuple(' acd'))
         assert_equals(model, (0, 1, 2, 3, 3, 5, (0, 1, 2, 2, 4, 5)))
 
+    def test_strings_in_blocks_are_compressed_separately(self):
+        cache = StringCache(compress_blocks=True)
+        texts = ['%d: %s' % (i, 'long text ' * 10) for i in range(3)]
+        indices = [cache.add(text) for text in texts]
+        model = (indices[0], indices[2])
+        model, strings = _KeywordRemover().remove_unused_strings(model,
+                                                                 cache.dump())
+        encode = StringCache()._encode
+        assert_equals(strings, (encode(texts[0]), encode(texts[2])))
+
+    def test_strings_in_blocks_use_given_compression_level(self):
+        cache = StringCache(compression_level=1, compress_blocks=True)
+        texts = ['%d: %s' % (i, 'long text ' * 10) for i in range(3)]
+        model = tuple(cache.add(text) for text in texts)
+        strings = cache.dump()
+        _, result = _KeywordRemover(1).remove_unused_strings(model, strings)
+        assert_equals(result, tuple(compress_text(text, 1) for text in texts))
+        _, result = _KeywordRemover(0).remove_unused_strings(model, strings)
+        assert_equals(result, tuple('*' + text for text in texts))
+
+    def test_compression_level_is_passed_from_builder(self):
+        result = Result(root_suite=TestSuite(name='root'))
+        for level in 0, 5:
+            js_result = JsModelBuilder(compression_level=level).build_from(result)
+            assert_equals(js_result.compression_level, level)
+
     def test_through_jsexecutionresult(self):
         suite = (0, StringIndex(1), 2, 3, 4, StringIndex(5),
                  ((0, 1, 2, StringIndex(3), 4, 5, (), (), ('suite', 'kws'), 9),),
@@ -81,12 +111,13 @@ class TestRemoveDataNotNeededInReport(unittest.TestCase):
                  (), 9)
         result = JsExecutionResult(suite=suite, strings=tuple(' ABCDEF'),
                                    errors=(1, 2), statistics={}, basemillis=0,
-                                   min_level='DEBUG')
+                                   min_level='DEBUG', compression_level=0)
         assert_equals(result.data['errors'], (1, 2))
         result.remove_data_not_needed_in_report()
         assert_equals(result.strings, tuple('ACE'))
         assert_equals(result.suite, exp_s)
         assert_equals(result.min_level, 'DEBUG')
+        assert_equals(result.compression_level, 0)
         assert_true('errors' not in result.data)
 
 
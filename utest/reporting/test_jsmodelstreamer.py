@@ -0,0 +1,115 @@
+from os.path import dirname, join
+import unittest
+
+from robot.reporting.jsmodelbuilders import JsModelBuilder
+from robot.reporting.jsmodelstreamer import StreamingJsModelBuilder
+from robot.result import ExecutionResult
+from robot.utils.asserts import assert_equals, assert_raises
+from robot.errors import DataError
+
+from test_jsmodelbuilders import remap
+
+RESULTDIR = join(dirname(__file__), '..', 'result')
+GOLDEN = join(RESULTDIR, 'golden.xml')
+GOLDEN_TWICE = join(RESULTDIR, 'goldenTwice.xml')
+TEARDOWN_FAILED = join(RESULTDIR, 'suite_teardown_failed.xml')
+
+
+class Decoder(object):
+    """Resolves strings, split logs and timestamps of a JS model."""
+
+    def __init__(self, js_result):
+        self._base = js_result.data['baseMillis']
+        self._splits = js_result.split_results
+
+    def suite(self, model, strings):
+        return (remap(model[:5], strings), self.status(model[5], strings),
+                tuple(self.suite(s, strings) for s in model[6]),
+                tuple(self.test(t, strings) for t in model[7]),
+                tuple(self.keyword(k, strings) for k in model[8]),
+                model[9])
+
+    def test(self, model, strings):
+        return (remap(model[:5], strings), self.status(model[5], strings),
+                self.keywords(model[6], strings))
+
+    def keywords(self, model, strings):
+        if not isinstance(model, tuple):
+            model, strings = self._splits[model-1]
+        return tuple(self.keyword(k, strings) for k in model)
+
+    def keyword(self, model, strings):
+        return (remap(model[:5], strings), self.status(model[5], strings),
+                self.keywords(model[6], strings),
+                tuple(self.message(m, strings) for m in model[7]))
+
+    def message(self, model, strings):
+        return (self.time(model[0]),) + remap(model[1:], strings)
+
+    def status(self, model, strings):
+        return (model[0], self.time(model[1])) + remap(model[2:], strings)
+
+    def time(self, millis):
+        return millis + self._base if millis is not None else None
+
+
+class TestStreamingJsModelBuilder(unittest.TestCase):
+
+    def test_golden(self):
+        self._verify_same_as_built_from_model(GOLDEN)
+
+    def test_multiple_suites(self):
+        self._verify_same_as_built_from_model(GOLDEN_TWICE)
+
+    def test_suite_teardown_failed(self):
+        self._verify_same_as_built_from_model(TEARDOWN_FAILED)
+
+    def test_combined_outputs(self):
+        self._verify_same_as_built_from_model(GOLDEN, TEARDOWN_FAILED)
+
+    def test_split_log(self):
+        self._verify_same_as_built_from_model(GOLDEN_TWICE, split_log=True)
+        self._verify_same_as_built_from_model(GOLDEN, TEARDOWN_FAILED,
+                                              split_log=True)
+
+    def test_log_level(self):
+        self._verify_same_as_built_from_model(GOLDEN_TWICE, log_level='INFO')
+        self._verify_same_as_built_from_model(TEARDOWN_FAILED, log_level='WARN')
+
+    def test_only_suite_setups_and_teardowns_are_kept_in_result(self):
+        result = StreamingJsModelBuilder().parse(TEARDOWN_FAILED)
+        assert_equals(len(result.suite.keywords), 1)
+        assert_equals(result.suite.keywords.teardown.status, 'FAIL')
+        assert_equals(len(result.suite.keywords.teardown.keywords), 0)
+        assert_equals(len(result.suite.keywords.teardown.messages), 0)
+        for test in result.suite.tests:
+            assert_equals(len(test.keywords), 0)
+            assert_equals(test.status, 'FAIL')
+
+    def test_invalid_source(self):
+        assert_raises(DataError, StreamingJsModelBuilder().parse)
+        assert_raises(DataError, StreamingJsModelBuilder().parse, RESULTDIR)
+
+    def _verify_same_as_built_from_model(self, *sources, **config):
+        split_log = config.get('split_log', False)
+        log_level = config.get('log_level', 'TRACE')
+        result = ExecutionResult(*sources)
+        result.suite.filter_messages(log_level)
+        expected = JsModelBuilder(split_log=split_log).build_from(result)
+        builder = StreamingJsModelBuilder(split_log=split_log,
+                                          log_level=log_level)
+        actual = builder.build_from(builder.parse(*sources))
+        assert_equals(self._decode(actual), self._decode(expected))
+        assert_equals(actual.data['stats'], expected.data['stats'])
+        assert_equals(actual.min_level, expected.min_level)
+        assert_equals(len(actual.split_results), len(expected.split_results))
+
+    def _decode(self, js_result):
+        decoder = Decoder(js_result)
+        return (decoder.suite(js_result.suite, js_result.strings),
+                tuple(decoder.message(m, js_result.strings)
+                      for m in js_result.data['errors']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,13 @@
+from __future__ import with_statement
 from StringIO import StringIO
+import os
+import shutil
+import tempfile
 import unittest
 
 from robot.utils.asserts import assert_equals, assert_true
 from robot.reporting.jsexecutionresult import JsExecutionResult
-from robot.reporting.jswriter import JsResultWriter
+from robot.reporting.jswriter import JsResultWriter, SplitLogChunkWriter
 
 
 def get_lines(suite=(), strings=(), basemillis=100, start_block='',
@@ -100,5 +104,49 @@ class TestSuiteWriter(unittest.TestCase):
         assert_separators(lines, 'foo')
 
 
+class TestSplitLogChunkWriter(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.mkdtemp()
+        self._base = os.path.join(self._tempdir, 'log')
+
+    def tearDown(self):
+        shutil.rmtree(self._tempdir)
+
+    def test_parts_are_written_to_chunks(self):
+        writer = SplitLogChunkWriter(self._base, chunk_size=100)
+        for index in range(1, 6):
+            assert_equals(writer.write((index, (0, 1)), ('*', '*x')), index)
+        writer.close()
+        assert_equals(writer.chunks, [1, 3, 5])
+        assert_equals(writer.error, None)
+        assert_equals(sorted(os.listdir(self._tempdir)),
+                      ['log-1.js', 'log-2.js', 'log-3.js'])
+        assert_equals(self._read('log-2.js'),
+                      ['window.keywords3 = [3,[0,1]];',
+                       'window.strings3 = ["*","*x"];',
+                       'window.keywords4 = [4,[0,1]];',
+                       'window.strings4 = ["*","*x"];',
+                       'window.fileLoading.notify("log-2.js");'])
+
+    def test_no_parts(self):
+        writer = SplitLogChunkWriter(self._base)
+        writer.close()
+        assert_equals(writer.chunks, [])
+        assert_equals(os.listdir(self._tempdir), [])
+
+    def test_writing_fails(self):
+        os.mkdir(self._base + '-1.js')
+        writer = SplitLogChunkWriter(self._base)
+        assert_equals(writer.write((), ()), 1)
+        assert_equals(writer.write((), ()), 2)
+        writer.close()
+        assert_true(isinstance(writer.error, EnvironmentError))
+
+    def _read(self, name):
+        with open(os.path.join(self._tempdir, name)) as chunk:
+            return chunk.read().splitlines()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,7 @@ class LogWriterWithMockedWriting(LogWriter):
 
     def _write_file(self, output, config, template):
         self.write_called = True
+        self.config = config
 
 
 
@@ -23,6 +24,7 @@ class TestLogWriter(unittest.TestCase):
 
     def test_splitting_log(self):
         class model:
+            split_log = None
             split_results = [((0, 1, 2, -1), ('*', '*1', '*2')),
                              ((0, 1, 0, 42), ('*','*x')),
                              (((1, 2), (3, 4, ())), ('*',))]
@@ -34,6 +36,18 @@ class TestLogWriter(unittest.TestCase):
                        (3, ((1, 2), (3, 4, ())), ('*',), 'mylog-3.js')],
                       writer.split_write_calls)
 
+    def test_split_log_chunks_written_while_building(self):
+        class split_log:
+            chunks = [1, 3]
+            error = None
+        class model:
+            split_results = []
+        model.split_log = split_log
+        writer = LogWriterWithMockedWriting(model)
+        writer.write('mylog.html', {'title': 'x'})
+        assert_equals(writer.config, {'title': 'x', 'splitLogChunks': [1, 3]})
+        assert_equals(writer.split_write_calls, [])
+
 
 if __name__ == '__main__':
     unittest.main()
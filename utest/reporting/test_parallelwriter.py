@@ -0,0 +1,65 @@
+import os
+import time
+import unittest
+
+from robot.errors import DataError
+from robot.reporting.parallelwriter import ParallelWriter
+from robot.utils.asserts import (assert_equals, assert_false,
+                                 assert_raises_with_msg)
+
+
+def sleep_and_return(seconds, value):
+    time.sleep(seconds)
+    return value, os.getpid()
+
+
+def fail(message):
+    raise DataError(message)
+
+
+class TestParallelWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.outcomes = []
+
+    def test_sequential(self):
+        writer = ParallelWriter(self.outcomes.append)
+        writer.write(sleep_and_return, 0, 'first')
+        writer.write(sleep_and_return, 0, 'second')
+        assert_equals(self.outcomes, [('first', os.getpid()),
+                                      ('second', os.getpid())])
+
+    def test_outcomes_are_notified_in_order(self):
+        writer = ParallelWriter(self.outcomes.append, processes=3)
+        writer.write(sleep_and_return, 0.2, 'first')
+        writer.write(sleep_and_return, 0, 'second')
+        writer.write(sleep_and_return, 0.1, 'third')
+        writer.write(sleep_and_return, 0, 'fourth')
+        writer.close()
+        assert_equals([value for value, _ in self.outcomes],
+                      ['first', 'second', 'third', 'fourth'])
+        if writer._can_fork():
+            assert_false(os.getpid() in [pid for _, pid in self.outcomes])
+
+    def test_data_can_be_modified_after_write(self):
+        data = ['original']
+        writer = ParallelWriter(self.outcomes.append, processes=2)
+        writer.write(sleep_and_return, 0.1, data)
+        data[:] = ['modified']
+        writer.close()
+        expected = ['original'] if writer._can_fork() else ['modified']
+        assert_equals(self.outcomes[0][0], expected)
+
+    def test_error(self):
+        writer = ParallelWriter(self.outcomes.append, processes=2)
+        def write():
+            writer.write(sleep_and_return, 0, 'first')
+            writer.write(fail, 'Expected error')
+            writer.write(sleep_and_return, 0, 'third')
+            writer.close()
+        assert_raises_with_msg(DataError, 'Expected error', write)
+        assert_equals([value for value, _ in self.outcomes], ['first'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
+from __future__ import with_statement
 from StringIO import StringIO
 import os
+import shutil
+import tempfile
 import unittest
 
 from robot.reporting.resultwriter import ResultWriter, Results
@@ -70,6 +73,25 @@ class TestReporting(unittest.TestCase):
         for test in execution_result.suite.tests:
             assert_equals(len(test.keywords), 0)
 
+    def test_generate_all_in_parallel(self):
+        tempdir = tempfile.mkdtemp()
+        try:
+            paths = dict((name, os.path.join(tempdir, name))
+                         for name in ('output', 'xunit', 'log', 'report'))
+            self._write_results(processes=3, **paths)
+            content = dict((name, self._read(path))
+                           for name, path in paths.items())
+        finally:
+            shutil.rmtree(tempdir)
+        self._verify_output(content['output'])
+        self._verify_xunit(content['xunit'])
+        self._verify_log(content['log'])
+        self._verify_report(content['report'])
+
+    def _read(self, path):
+        with open(path) as content:
+            return content.read()
+
     def _write_results(self, **settings):
         execution_result = self._get_execution_result()
         settings = StubSettings(**settings)
@@ -123,10 +145,13 @@ class StubSettings(object):
     log = None
     log_config = {}
     split_log = False
+    compression_config = {}
     report = None
     report_config = None
     output = None
+    binary_output = None
     xunit = None
+    processes = 1
     status_rc = True
     suite_config = {}
     statistics_config = {}
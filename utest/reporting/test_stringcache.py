@@ -5,6 +5,7 @@ import unittest
 import sys
 
 from robot.reporting.stringcache import StringCache, StringIndex
+from robot.utils import compress_text, decompress_text
 from robot.utils.asserts import assert_equals, assert_true, assert_false
 
 
@@ -54,6 +55,65 @@ class TestStringCache(unittest.TestCase):
         for i1, i2 in zip(indices1, indices2):
             assert_true(i1 is i2, 'not same: %s and %s' % (i1, i2))
 
+    def test_duplicate_long_strings_are_compressed_once(self):
+        compressed = []
+        self.cache._encode = lambda text: compressed.append(text) or 'x'
+        for _ in range(3):
+            self.cache.add('long'*100)
+            self.cache.add(u'non-ascii \xe4'*100)
+        assert_equals(compressed, ['long'*100, u'non-ascii \xe4'*100])
+        assert_equals(self.cache.dump(), ('*', 'x', 'x'))
+
+    def test_compression_level(self):
+        text = 'long'*1000
+        cache = StringCache(compression_level=1)
+        cache.add(text)
+        assert_equals(cache.dump(), ('*', compress_text(text, 1)))
+
+    def test_compression_level_zero_disables_compression(self):
+        text = 'long'*1000
+        cache = StringCache(compression_level=0)
+        cache.add(text)
+        assert_equals(cache.dump(), ('*', '*' + text))
+
+
+class TestBlockCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = StringCache(compress_blocks=True, block_size=1000)
+        self.texts = ['%d %s' % (i, 'long text ' * 20) for i in range(8)]
+
+    def test_strings_are_replaced_with_references_to_blocks(self):
+        indices = [self.cache.add(t) for t in self.texts[:3]]
+        short = self.cache.add('short')
+        strings = self.cache.dump()
+        assert_equals(short, 4)
+        assert_equals(strings[1:5], ('#5:0', '#5:1', '#5:2', '*short'))
+        assert_equals(decompress_text(strings[5]).split('\x00'),
+                      self.texts[:3])
+        assert_equals([strings[i] for i in indices], ['#5:0', '#5:1', '#5:2'])
+
+    def test_block_is_compressed_when_it_is_full(self):
+        for text in self.texts:
+            self.cache.add(text)
+        strings = self.cache.dump()
+        assert_equals(strings[1:6], ('#6:0', '#6:1', '#6:2', '#6:3', '#6:4'))
+        assert_equals(strings[7:], ('#10:0', '#10:1', '#10:2', strings[10]))
+        assert_equals(decompress_text(strings[10]).split('\x00'),
+                      self.texts[5:])
+
+    def test_single_string_is_compressed_separately(self):
+        self.cache.add(self.texts[0])
+        assert_equals(self.cache.dump(), ('*', self.cache._encode(self.texts[0])))
+
+    def test_strings_containing_null_bytes_are_not_added_to_blocks(self):
+        text = 'null \x00 byte ' * 10
+        self.cache.add(text)
+        self.cache.add(self.texts[0])
+        self.cache.add(self.texts[1])
+        assert_equals(self.cache.dump(), ('*', self.cache._encode(text),
+                                          '#4:0', '#4:1', self.cache.dump()[4]))
+
 
 class TestStringIndex(unittest.TestCase):
 
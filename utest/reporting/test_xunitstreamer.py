@@ -0,0 +1,224 @@
+from os.path import dirname, join
+from StringIO import StringIO
+import unittest
+
+from robot.errors import DataError
+from robot.reporting.resultwriter import Results
+from robot.output.xunitlogger import StreamingXUnitWriter, XUnitLogger
+from robot.reporting.xunitstreamer import XUnitStreamer
+from robot.reporting.xunitwriter import XUnitWriter
+from robot.result import ExecutionResult
+from robot.utils import ET
+from robot.utils.asserts import (assert_equals, assert_false, assert_true,
+                                 assert_raises_with_msg)
+
+RESULTDIR = join(dirname(__file__), '..', 'result')
+GOLDEN = join(RESULTDIR, 'golden.xml')
+GOLDEN_TWICE = join(RESULTDIR, 'goldenTwice.xml')
+TEARDOWN_FAILED = join(RESULTDIR, 'suite_teardown_failed.xml')
+
+
+class ClosableOutput(StringIO):
+
+    def close(self):
+        self.value = self.getvalue()
+        StringIO.close(self)
+
+
+class TestXUnitStreamer(unittest.TestCase):
+
+    def test_golden(self):
+        self._verify_same_as_written_from_model(GOLDEN)
+
+    def test_golden_twice(self):
+        self._verify_same_as_written_from_model(GOLDEN_TWICE)
+
+    def test_suite_teardown_failed(self):
+        self._verify_same_as_written_from_model(TEARDOWN_FAILED)
+
+    def test_combined(self):
+        self._verify_same_as_written_from_model(GOLDEN, TEARDOWN_FAILED)
+
+    def test_return_code(self):
+        assert_equals(XUnitStreamer(StringIO()).stream(GOLDEN), 0)
+        assert_equals(XUnitStreamer(StringIO()).stream(TEARDOWN_FAILED), 2)
+        assert_equals(XUnitStreamer(StringIO()).stream(GOLDEN, TEARDOWN_FAILED), 2)
+
+    def test_criticality(self):
+        streamer = XUnitStreamer(StringIO(), noncritical=['t1'])
+        assert_equals(streamer.stream(GOLDEN_TWICE, TEARDOWN_FAILED), 2)
+        streamer = XUnitStreamer(StringIO(), critical=['nonexisting'])
+        assert_equals(streamer.stream(TEARDOWN_FAILED), 0)
+        streamer = XUnitStreamer(StringIO(), critical=['new'], set_tags=['new'])
+        assert_equals(streamer.stream(TEARDOWN_FAILED), 2)
+
+    def test_name(self):
+        self._verify_same_as_written_from_model(GOLDEN, name='New')
+        self._verify_same_as_written_from_model(GOLDEN, TEARDOWN_FAILED,
+                                                name='New')
+
+    def test_debug_messages_not_logged(self):
+        output = ClosableOutput()
+        XUnitStreamer(output, log_level='INFO').stream(TEARDOWN_FAILED)
+        failures = ET.fromstring(output.value).findall('testcase/failure')
+        assert_equals([f.text for f in failures], [None, None])
+
+    def test_no_tests(self):
+        empty = '<robot><suite name="Empty"></suite></robot>'
+        assert_raises_with_msg(DataError, "Suite 'Empty' contains no tests.",
+                               XUnitStreamer(StringIO()).stream, empty)
+        output = ClosableOutput()
+        XUnitStreamer(output, process_empty_suite=True).stream(empty)
+        assert_equals(ET.fromstring(output.value).get('tests'), '0')
+
+    def test_invalid_source(self):
+        assert_raises_with_msg(DataError, "Reading XML source '<in-memory "
+                               "file>' failed: no element found: line 1, "
+                               "column 14", XUnitStreamer(StringIO()).stream,
+                               '<robot><suite>')
+
+    def _verify_same_as_written_from_model(self, *sources, **config):
+        expected = ClosableOutput()
+        result = ExecutionResult(*sources)
+        result.configure(suite_config=config)
+        result.visit(XUnitWriter(expected))
+        output = ClosableOutput()
+        XUnitStreamer(output, **config).stream(*sources)
+        assert_equals(output.value, expected.value)
+
+
+class TestStreamingXUnitWriter(unittest.TestCase):
+
+    def test_classnames(self):
+        writer = StreamingXUnitWriter(ClosableOutput())
+        writer.start_suite('Root')
+        writer.test('Root test', 0, True)
+        writer.start_suite('Sub')
+        writer.start_suite('Deeper')
+        writer.test('Deep test', 0, True)
+        writer.end_suite()
+        writer.end_suite()
+        writer.end_suite()
+        tests = self._close(writer).findall('testcase')
+        assert_equals([t.get('classname') for t in tests],
+                      ['Root', 'Root.Sub.Deeper'])
+
+    def test_nested_suite_teardown_failures(self):
+        writer = StreamingXUnitWriter(ClosableOutput())
+        writer.start_suite('Root')
+        writer.start_suite('Sub')
+        writer.test('T1', 1500, True)
+        writer.test('T2', 0, False, 'Failed', 'Details', critical=False)
+        writer.end_suite(teardown_failed=True)
+        writer.start_suite('Other')
+        writer.test('T3', 0, True)
+        writer.end_suite()
+        writer.end_suite(teardown_failed=True)
+        assert_equals(writer.failed, 3)
+        assert_equals(writer.critical_failed, 2)
+        root = self._close(writer)
+        assert_equals(root.get('failures'), '3')
+        assert_equals(root.get('tests'), '3')
+        assert_equals([t.get('time') for t in root.findall('testcase')],
+                      ['2', '0', '0'])
+        failures = root.findall('testcase/failure')
+        assert_equals([f.get('message') for f in failures],
+                      ['Teardown of the parent suite failed.\n\n'
+                       'Also teardown of the parent suite failed.',
+                       'Failed\n\nAlso teardown of the parent suite failed.'
+                       '\n\nAlso teardown of the parent suite failed.',
+                       'Teardown of the parent suite failed.'])
+        assert_equals([f.text for f in failures], [None, 'Details', None])
+
+    def _close(self, writer):
+        output = writer._writer.output
+        writer.close()
+        return ET.fromstring(output.value)
+
+
+class TestXUnitLogger(unittest.TestCase):
+
+    def test_events(self):
+        output = ClosableOutput()
+        logger = XUnitLogger(output, 'DEBUG')
+        logger.start_suite(Item('Suite'))
+        logger.start_test(Item('Test'))
+        logger.start_keyword(Item('Keyword'))
+        logger.log_message(Message('Traceback', 'DEBUG'))
+        logger.log_message(Message('Ignored', 'INFO'))
+        logger.set_log_level('INFO')
+        logger.log_message(Message('Not logged', 'DEBUG'))
+        logger.end_keyword(Item('Keyword', 'FAIL'))
+        logger.end_test(Item('Test', 'FAIL', 'Error'))
+        logger.start_keyword(Item('Teardown', type='teardown'))
+        logger.end_keyword(Item('Teardown', 'FAIL', type='teardown'))
+        logger.end_suite(Item('Suite', 'FAIL'))
+        logger.close()
+        root = ET.fromstring(output.value)
+        assert_equals(root.get('name'), 'Suite')
+        failure = root.find('testcase/failure')
+        assert_equals(failure.get('message'),
+                      'Error\n\nAlso teardown of the parent suite failed.')
+        assert_true(failure.text.startswith('Traceback'))
+        assert_false('Not logged' in output.value)
+
+
+class Item(object):
+
+    def __init__(self, name, status='PASS', message='', type='kw'):
+        self.name = name
+        self.status = status
+        self.message = message
+        self.type = type
+        self.elapsedtime = 0
+
+
+class Message(object):
+
+    def __init__(self, message, level):
+        self.message = message
+        self.level = level
+
+
+class TestResultsStreaming(unittest.TestCase):
+
+    def test_streaming_when_only_xunit_is_written(self):
+        assert_true(self._results().xunit_can_be_streamed)
+
+    def test_no_streaming_when_other_outputs_are_written(self):
+        for name in 'output', 'binary_output', 'log', 'report':
+            assert_false(self._results(**{name: 'x'}).xunit_can_be_streamed)
+
+    def test_no_streaming_when_full_model_is_needed(self):
+        config = {'include_tags': ['t1']}
+        assert_false(self._results(suite_config=config).xunit_can_be_streamed)
+
+    def test_no_streaming_when_outputs_are_read_in_parallel(self):
+        results = self._results(sources=[GOLDEN, GOLDEN], processes=2)
+        assert_false(results.xunit_can_be_streamed)
+
+    def test_stream_xunit_sets_return_code(self):
+        results = self._results(sources=[TEARDOWN_FAILED])
+        results.stream_xunit(StringIO())
+        assert_equals(results.return_code, 2)
+        results = self._results(sources=[TEARDOWN_FAILED], status_rc=False)
+        results.stream_xunit(StringIO())
+        assert_equals(results.return_code, 0)
+
+    def _results(self, sources=(GOLDEN,), **settings):
+        return Results(list(sources), Settings(**settings))
+
+
+class Settings(object):
+    output = binary_output = log = report = None
+    xunit = 'xunit.xml'
+    processes = 1
+    status_rc = True
+    suite_config = {}
+
+    def __init__(self, **settings):
+        self.__dict__.update(settings)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+
+from robot.errors import DataError
+from robot.result import ExecutionResult
+from robot.result.binaryformat import (xml_to_binary, binary_to_xml,
+                                       is_binary_result)
+from robot.output.binarylogger import (BinaryLogger, encode_integers,
+                                       decode_integers)
+from robot.result.testsuite import TestSuite
+from robot.output.loggerhelper import Message
+from robot.utils.asserts import assert_equals, assert_true, assert_false, \
+    assert_raises_with_msg
+
+from test_resultbuilder import GOLDEN_XML, SUITE_TEARDOWN_FAILED
+from test_resultserializer import TestableOutputWriter
+
+
+class _BinaryTests(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.mkdtemp()
+        self._binary = os.path.join(self._tempdir, 'output.rfb')
+
+    def tearDown(self):
+        shutil.rmtree(self._tempdir)
+
+    def _serialize(self, result):
+        output = StringIO()
+        result.visit(TestableOutputWriter(output))
+        return output.getvalue()
+
+
+class TestConversions(_BinaryTests):
+
+    def test_xml_to_binary(self):
+        for xml in GOLDEN_XML, SUITE_TEARDOWN_FAILED:
+            xml_to_binary(StringIO(xml), self._binary)
+            assert_true(is_binary_result(self._binary))
+            assert_equals(self._serialize(ExecutionResult(self._binary)),
+                          self._serialize(ExecutionResult(StringIO(xml))))
+
+    def test_binary_to_xml(self):
+        xml = os.path.join(self._tempdir, 'output.xml')
+        xml_to_binary(StringIO(GOLDEN_XML), self._binary)
+        binary_to_xml(self._binary, xml)
+        assert_false(is_binary_result(xml))
+        assert_equals(self._serialize(ExecutionResult(xml)),
+                      self._serialize(ExecutionResult(StringIO(GOLDEN_XML))))
+
+    def test_combining_binary_and_xml_results(self):
+        xml_to_binary(StringIO(GOLDEN_XML), self._binary)
+        result = ExecutionResult(self._binary, StringIO(GOLDEN_XML))
+        assert_equals(len(result.suite.suites), 2)
+        assert_equals(result.suite.suites[0].name,
+                      result.suite.suites[1].name)
+
+
+class TestBinaryLogger(_BinaryTests):
+
+    def test_values_are_preserved(self):
+        suite = TestSuite(name=u'Hyv\xe4', source='/path')
+        suite.metadata['Name'] = 'Value'
+        test = suite.tests.create(name='Test', tags=['b', 'a'], timeout='1s',
+                                  status='PASS', starttime='20120101 10:00:00.000',
+                                  endtime='20120101 09:59:59.999')
+        kw = test.keywords.create(name='KW', args=['x', '${y}'], type='setup',
+                                  starttime='N/A', endtime='invalid')
+        kw.messages.create('Null\x00', 'WARN', True, '20120101 10:00:00.000')
+        logger = BinaryLogger(self._binary)
+        logger.start_suite(suite)
+        logger.start_test(test)
+        logger.start_keyword(kw)
+        logger.log_message(kw.messages[0])
+        logger.end_keyword(kw)
+        logger.end_test(test)
+        logger.end_suite(suite)
+        logger.message(Message('Error', 'ERROR'))
+        logger.close()
+        result = ExecutionResult(self._binary)
+        assert_equals(result.generator, 'ROBOT')
+        assert_equals(result.suite.name, u'Hyv\xe4')
+        assert_equals(result.suite.source, '/path')
+        assert_equals(result.suite.metadata, {'Name': 'Value'})
+        test = result.suite.tests[0]
+        assert_equals(list(test.tags), ['a', 'b'])
+        assert_equals(test.timeout, '1s')
+        assert_equals(test.starttime, '20120101 10:00:00.000')
+        assert_equals(test.endtime, '20120101 09:59:59.999')
+        kw = test.keywords[0]
+        assert_equals((kw.name, kw.args, kw.type), ('KW', ['x', '${y}'], 'setup'))
+        assert_equals((kw.starttime, kw.endtime), (None, 'invalid'))
+        msg = kw.messages[0]
+        assert_equals((msg.message, msg.level, msg.html, msg.timestamp),
+                      ('Null', 'WARN', True, '20120101 10:00:00.000'))
+        assert_equals(result.errors.messages[0].message, 'Error')
+
+
+class TestIntegers(unittest.TestCase):
+
+    def test_values_bigger_than_32_bits(self):
+        values = (0, 1, 2**32 - 2, 2**32 - 1, 2**32, 2**40 + 42, 7)
+        data = encode_integers(values)
+        assert_equals(len(data), 4 * (len(values) + 2 * 3))
+        assert_equals(decode_integers(data), list(values))
+
+
+class TestInvalidFiles(_BinaryTests):
+
+    def test_truncated_file(self):
+        xml_to_binary(StringIO(GOLDEN_XML), self._binary)
+        data = open(self._binary, 'rb').read()
+        open(self._binary, 'wb').write(data[:-20])
+        assert_raises_with_msg(DataError, "Reading binary source '%s' failed: "
+                               "File is incomplete or corrupted." % self._binary,
+                               ExecutionResult, self._binary)
+
+    def test_unsupported_version(self):
+        open(self._binary, 'wb').write('RFBO\x63')
+        assert_raises_with_msg(DataError, "Reading binary source '%s' failed: "
+                               "Unsupported binary output version 99." % self._binary,
+                               ExecutionResult, self._binary)
+
+
+if __name__ == '__main__':
+    unittest.main()
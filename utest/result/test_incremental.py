@@ -0,0 +1,113 @@
+from __future__ import with_statement
+import os
+from StringIO import StringIO
+import shutil
+import tempfile
+import time
+import unittest
+
+from robot import rebot
+from robot.errors import DataError
+from robot.result import ExecutionResult
+from robot.result.binaryformat import xml_to_binary
+from robot.result.incremental import IncrementalResult
+from robot.utils.asserts import (assert_equals, assert_raises_with_msg,
+                                 assert_true)
+
+from test_resultbuilder import GOLDEN_XML, SUITE_TEARDOWN_FAILED
+
+
+class TestIncrementalResult(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.mkdtemp()
+        self._combined = os.path.join(self._tempdir, 'combined.rfb')
+        self._golden = self._write('golden.xml', GOLDEN_XML)
+        self._teardown = self._write('teardown.xml', SUITE_TEARDOWN_FAILED)
+
+    def tearDown(self):
+        shutil.rmtree(self._tempdir)
+
+    def _write(self, name, content):
+        path = os.path.join(self._tempdir, name)
+        with open(path, 'w') as output:
+            output.write(content)
+        return path
+
+    def test_new_combined_result(self):
+        result = IncrementalResult(self._combined)
+        assert_equals(result.add_outputs(self._golden, self._teardown), 2)
+        result.save_combined()
+        self._verify(IncrementalResult(self._combined),
+                     ExecutionResult(self._golden, self._teardown))
+
+    def test_outputs_are_appended_to_existing_result(self):
+        result = IncrementalResult(self._combined)
+        result.add_outputs(self._golden)
+        result.save_combined()
+        result = IncrementalResult(self._combined)
+        assert_equals(result.add_outputs(self._golden, self._teardown), 1)
+        result.save_combined()
+        self._verify(IncrementalResult(self._combined),
+                     ExecutionResult(self._golden, self._teardown))
+
+    def test_already_combined_outputs_are_not_parsed(self):
+        result = IncrementalResult(self._combined)
+        result.add_outputs(self._golden)
+        result.save_combined()
+        os.remove(self._golden)
+        assert_raises_with_msg(DataError, "Reading output '%s' failed: "
+                               "No such file or directory" % self._golden,
+                               IncrementalResult(self._combined).add_outputs,
+                               self._golden)
+        result = IncrementalResult(self._combined)
+        assert_equals(result.add_outputs(self._teardown), 1)
+        assert_equals(result.suite.name, 'Normal & Suite Teardown Fail')
+
+    def test_changed_output(self):
+        result = IncrementalResult(self._combined)
+        result.add_outputs(self._golden)
+        result.save_combined()
+        os.utime(self._golden, (time.time() + 10, time.time() + 10))
+        assert_raises_with_msg(DataError, "Output '%s' has changed after it "
+                               "was combined into '%s'."
+                               % (self._golden, self._combined),
+                               IncrementalResult(self._combined).add_outputs,
+                               self._golden)
+
+    def test_combined_result_is_normal_binary_output(self):
+        result = IncrementalResult(self._combined)
+        result.add_outputs(self._golden, self._teardown)
+        result.save_combined()
+        self._verify(ExecutionResult(self._combined),
+                     ExecutionResult(self._golden, self._teardown))
+
+    def test_normal_binary_output_is_not_combined_result(self):
+        xml_to_binary(self._golden, self._combined)
+        assert_raises_with_msg(DataError, "File '%s' is not a combined "
+                               "result." % self._combined,
+                               IncrementalResult, self._combined)
+
+    def test_rebot_output_is_xml_when_combining(self):
+        output = os.path.join(self._tempdir, 'output.xml')
+        rebot(self._golden, self._teardown, combined=self._combined,
+              output=output, log='NONE', report='NONE', stdout=StringIO())
+        with open(output) as xml:
+            assert_true(xml.read(5) == '<?xml')
+        self._verify(ExecutionResult(output),
+                     ExecutionResult(self._golden, self._teardown))
+        self._verify(IncrementalResult(self._combined),
+                     ExecutionResult(self._golden, self._teardown))
+
+    def _verify(self, result, expected):
+        assert_equals(result.suite.name, expected.suite.name)
+        assert_equals([s.name for s in result.suite.suites],
+                      [s.name for s in expected.suite.suites])
+        assert_equals(result.suite.test_count, expected.suite.test_count)
+        assert_equals(result.suite.statistics.critical.failed,
+                      expected.suite.statistics.critical.failed)
+        assert_equals(len(result.errors), len(expected.errors))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,266 @@
+import unittest
+from robot.utils.asserts import assert_equal, assert_true, assert_false
+
+from robot.output.loggerhelper import Message
+from robot.result.keywordremover import RuntimeKeywordRemover, RemovalMessage
+from robot.result.keyword import Keyword as ResultKeyword
+
+WUKS = 'BuiltIn.Wait Until Keyword Succeeds'
+
+
+class Keyword(object):
+    starttime = '20121212 12:12:12.000'
+    endtime = '20121212 12:12:12.100'
+
+    def __init__(self, name='kw', type='kw', status='PASS'):
+        self.name = name
+        self.type = type
+        self.status = status
+        self.doc = ''
+        self.args = ['arg']
+        self.timeout = ''
+
+
+class Test(object):
+
+    def __init__(self, status='PASS'):
+        self.status = status
+
+
+class Logger(object):
+
+    def __init__(self):
+        self.keywords = []
+
+    def write_keyword(self, kw):
+        self.keywords.append(kw)
+
+
+class _RuntimeRemoverTest(unittest.TestCase):
+    modes = []
+
+    def setUp(self):
+        self.logger = Logger()
+        self.remover = RuntimeKeywordRemover(self.modes, self.logger)
+
+    def _run(self, kw, *children):
+        started = self.remover.start_keyword(kw)
+        for child in children:
+            if isinstance(child, Message):
+                self.remover.log_message(child)
+            else:
+                self._run(*child)
+        ended = self.remover.end_keyword(kw)
+        assert_equal(started, ended)
+        return started
+
+    def _run_test(self, status, *keywords):
+        self.remover.start_test(Test(status))
+        for kw in keywords:
+            assert_true(self._run(*kw))
+        self.remover.end_test(Test(status))
+
+    def _for_loop(self, *statuses):
+        return (Keyword('for', 'for', 'FAIL' if 'FAIL' in statuses else 'PASS'),) \
+            + tuple((Keyword('item', 'foritem', status),
+                     (Keyword('Log', status=status), Message('msg')))
+                    for status in statuses)
+
+    def _wuks(self, *statuses):
+        return (Keyword(WUKS, status=statuses[-1]),) \
+            + tuple((Keyword('attempt', status=status),) for status in statuses)
+
+
+class TestRemoveFor(_RuntimeRemoverTest):
+    modes = ['for']
+
+    def test_normal_keywords_are_not_handled(self):
+        assert_false(self._run(Keyword()))
+        assert_false(self.remover.log_message(Message('msg')))
+        assert_equal(self.logger.keywords, [])
+
+    def test_passed_items_are_removed(self):
+        assert_true(self._run(*self._for_loop('PASS', 'PASS', 'PASS')))
+        loop, = self.logger.keywords
+        assert_equal(list(loop.keywords), [])
+        assert_equal(loop.doc, '_3 passing steps removed using '
+                               '--RemoveKeywords option._')
+
+    def test_failed_items_are_kept(self):
+        self._run(*self._for_loop('PASS', 'FAIL'))
+        loop, = self.logger.keywords
+        assert_equal([item.status for item in loop.keywords], ['FAIL'])
+        assert_equal(loop.keywords[0].keywords[0].messages[0].message, 'msg')
+        assert_equal(loop.doc, '_1 passing step removed using '
+                               '--RemoveKeywords option._')
+
+    def test_items_with_warnings_are_kept(self):
+        self._run(Keyword('for', 'for'),
+                  (Keyword('item', 'foritem'),
+                   (Keyword('Log'), Message('msg'), Message('warning', 'WARN'))),
+                  (Keyword('item', 'foritem'), (Keyword('Log'), Message('msg'))))
+        loop, = self.logger.keywords
+        assert_equal(len(loop.keywords), 1)
+        assert_equal(loop.keywords[0].keywords[0].messages[1].level, 'WARN')
+
+    def test_keywords_around_loops_are_not_buffered(self):
+        kw = Keyword('Parent')
+        assert_false(self.remover.start_keyword(kw))
+        self._run(*self._for_loop('PASS'))
+        assert_equal(len(self.logger.keywords), 1)
+        assert_false(self.remover.end_keyword(kw))
+
+
+class TestRemoveWuks(_RuntimeRemoverTest):
+    modes = ['WUKS']
+
+    def test_all_but_last_failed_attempt_are_removed(self):
+        self._run(*self._wuks('FAIL', 'FAIL', 'FAIL', 'FAIL'))
+        wuks, = self.logger.keywords
+        assert_equal(len(wuks.keywords), 1)
+        assert_equal(wuks.doc, '_3 failing steps removed using '
+                               '--RemoveKeywords option._')
+
+    def test_last_failed_and_passed_attempt_are_kept(self):
+        self._run(*self._wuks('FAIL', 'FAIL', 'FAIL', 'PASS'))
+        wuks, = self.logger.keywords
+        assert_equal([kw.status for kw in wuks.keywords], ['FAIL', 'PASS'])
+        assert_equal(wuks.doc, '_2 failing steps removed using '
+                               '--RemoveKeywords option._')
+
+    def test_attempts_with_warnings_are_kept(self):
+        wuks = self._wuks('FAIL', 'FAIL', 'FAIL')
+        wuks = wuks[:1] + ((wuks[1][0], Message('warning', 'WARN')),) + wuks[2:]
+        self._run(*wuks)
+        wuks, = self.logger.keywords
+        assert_equal(len(wuks.keywords), 2)
+        assert_equal(wuks.keywords[0].messages[0].level, 'WARN')
+
+    def test_nothing_removed_when_passing_first_time(self):
+        self._run(*self._wuks('PASS'))
+        wuks, = self.logger.keywords
+        assert_equal(len(wuks.keywords), 1)
+        assert_equal(wuks.doc, '')
+
+
+class TestRemoveWuksByDefault(_RuntimeRemoverTest):
+
+    def test_failed_attempts_are_removed(self):
+        self._run(*self._wuks('FAIL', 'FAIL', 'FAIL', 'PASS'))
+        wuks, = self.logger.keywords
+        assert_equal([kw.status for kw in wuks.keywords], ['FAIL', 'PASS'])
+        assert_equal(wuks.doc, '_2 failing steps removed._')
+
+    def test_other_keywords_are_not_removed(self):
+        assert_false(self._run(*self._for_loop('PASS', 'PASS')))
+        assert_equal(self.logger.keywords, [])
+
+
+class TestRemovePassed(_RuntimeRemoverTest):
+    modes = ['passed', 'for']
+
+    def test_keywords_removed_from_passed_test(self):
+        self._run_test('PASS', (Keyword(), Message('msg')),
+                       self._for_loop('PASS'))
+        kw, loop = self.logger.keywords
+        assert_equal(list(kw.messages), [])
+        assert_equal(list(loop.keywords), [])
+        assert_true(kw.doc.endswith('_Keyword data removed using '
+                                    '--RemoveKeywords option._'))
+
+    def test_keywords_not_removed_from_failed_test(self):
+        self._run_test('FAIL', (Keyword(), Message('msg')),
+                       self._for_loop('PASS', 'FAIL'))
+        kw, loop = self.logger.keywords
+        assert_equal(kw.messages[0].message, 'msg')
+        assert_equal(len(loop.keywords), 1)
+
+    def test_keywords_not_removed_from_test_with_warnings(self):
+        self._run_test('PASS', (Keyword(), Message('msg')),
+                       (Keyword(), Message('warning', 'WARN')))
+        first, second = self.logger.keywords
+        assert_equal(first.messages[0].message, 'msg')
+        assert_equal(second.messages[0].message, 'warning')
+
+    def test_keywords_are_written_when_test_ends(self):
+        self.remover.start_test(Test())
+        self._run(Keyword())
+        assert_equal(self.logger.keywords, [])
+        self.remover.end_test(Test())
+        assert_equal(len(self.logger.keywords), 1)
+
+    def test_suite_keywords_are_not_removed(self):
+        assert_false(self._run(Keyword('Setup', 'setup')))
+
+
+class TestRemovePassedBeforeFor(_RuntimeRemoverTest):
+    modes = ['passed', 'for']
+
+    def test_only_passed_message_when_test_is_cleared(self):
+        self._run_test('PASS', self._for_loop('PASS', 'PASS', 'PASS'))
+        loop, = self.logger.keywords
+        assert_equal(list(loop.keywords), [])
+        assert_equal(loop.doc, '_Keyword data removed using '
+                               '--RemoveKeywords option._')
+
+    def test_for_message_when_test_is_not_cleared(self):
+        self._run_test('FAIL', self._for_loop('PASS', 'PASS', 'FAIL'))
+        loop, = self.logger.keywords
+        assert_equal(len(loop.keywords), 1)
+        assert_equal(loop.doc, '_2 passing steps removed using '
+                               '--RemoveKeywords option._')
+
+    def test_default_wuks_message_only_when_test_is_not_cleared(self):
+        self._run_test('PASS', self._wuks('FAIL', 'FAIL', 'FAIL', 'PASS'))
+        self._run_test('FAIL', self._wuks('FAIL', 'FAIL', 'FAIL'))
+        cleared, kept = self.logger.keywords
+        assert_equal(cleared.doc, '_Keyword data removed using '
+                                  '--RemoveKeywords option._')
+        assert_equal(kept.doc, '_2 failing steps removed._')
+
+
+class TestRemoveForAndWuksBeforePassed(_RuntimeRemoverTest):
+    modes = ['for', 'wuks', 'passed']
+
+    def test_both_messages_when_test_is_cleared(self):
+        self._run_test('PASS', self._for_loop('PASS', 'PASS', 'PASS'),
+                       self._wuks('FAIL', 'FAIL', 'PASS'))
+        loop, wuks = self.logger.keywords
+        assert_equal(loop.doc, '_3 passing steps removed using '
+                               '--RemoveKeywords option._\n\n'
+                               '_Keyword data removed using '
+                               '--RemoveKeywords option._')
+        assert_equal(wuks.doc, '_1 failing step removed using '
+                               '--RemoveKeywords option._\n\n'
+                               '_Keyword data removed using '
+                               '--RemoveKeywords option._')
+
+
+class TestRemoveAll(_RuntimeRemoverTest):
+    modes = ['ALL', 'PASSED']
+
+    def test_all_content_removed(self):
+        self.remover.start_test(Test('FAIL'))
+        self._run(Keyword(), (Keyword(), Message('warning', 'WARN')),
+                  Message('msg'))
+        self._run(*self._for_loop('PASS'))
+        kw, loop = self.logger.keywords
+        self.remover.end_test(Test('FAIL'))
+        for kw in kw, loop:
+            assert_equal(list(kw.keywords), [])
+            assert_equal(list(kw.messages), [])
+            assert_equal(kw.doc, '_Keyword data removed using '
+                                 '--RemoveKeywords option._')
+
+
+class TestRemovalMessage(unittest.TestCase):
+
+    def test_message_is_not_added_twice(self):
+        kw = ResultKeyword(doc='Doc.')
+        RemovalMessage('Removed.').set(kw)
+        RemovalMessage('Removed.').set(kw)
+        assert_equal(kw.doc, 'Doc.\n\n_Removed._')
+
+
+if __name__ == '__main__':
+    unittest.main()
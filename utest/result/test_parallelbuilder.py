@@ -0,0 +1,78 @@
+from __future__ import with_statement
+import os
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+
+from robot.errors import DataError
+from robot.result import ExecutionResult
+from robot.result.binaryformat import xml_to_binary
+from robot.result.parallelbuilder import (ParallelResultBuilder,
+                                          serialize_result, deserialize_result)
+from robot.utils.asserts import assert_equals, assert_raises_with_msg
+
+from test_resultbuilder import GOLDEN_XML, SUITE_TEARDOWN_FAILED
+
+
+class TestParallelResultBuilder(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.mkdtemp()
+        self._golden = self._write('golden.xml', GOLDEN_XML)
+        self._teardown = self._write('teardown.xml', SUITE_TEARDOWN_FAILED)
+        self._binary = os.path.join(self._tempdir, 'golden.rfb')
+        xml_to_binary(self._golden, self._binary)
+
+    def tearDown(self):
+        shutil.rmtree(self._tempdir)
+
+    def _write(self, name, content):
+        path = os.path.join(self._tempdir, name)
+        with open(path, 'w') as output:
+            output.write(content)
+        return path
+
+    def test_serialized_result_is_same_as_original(self):
+        for source in self._golden, self._teardown, self._binary:
+            self._verify(deserialize_result(serialize_result(source)),
+                         ExecutionResult(source))
+
+    def test_generator_and_source_are_preserved(self):
+        result = deserialize_result(serialize_result(self._teardown))
+        assert_equals(result.generator, 'ROBOT')
+        assert_equals(result.source, self._teardown)
+
+    def test_build_in_parallel(self):
+        sources = [self._golden, self._teardown, self._binary, self._golden]
+        self._verify(ParallelResultBuilder(2).build(*sources),
+                     ExecutionResult(*sources))
+
+    def test_build_sequentially(self):
+        self._verify(ParallelResultBuilder(1).build(self._golden, self._teardown),
+                     ExecutionResult(self._golden, self._teardown))
+        self._verify(ParallelResultBuilder(2).build(self._teardown),
+                     ExecutionResult(self._teardown))
+
+    def test_invalid_source(self):
+        nonex = os.path.join(self._tempdir, 'nonex.xml')
+        assert_raises_with_msg(DataError, "Reading XML source '%s' failed: "
+                               "Source file '%s' does not exist."
+                               % (nonex, nonex),
+                               ParallelResultBuilder(2).build,
+                               self._golden, nonex)
+
+    def _verify(self, result, expected):
+        assert_equals(self._save(result), self._save(expected))
+        assert_equals(result.suite.name, expected.suite.name)
+
+    def _save(self, result):
+        output = StringIO()
+        output.close = lambda: None
+        result.save(output)
+        # Skip preamble and the root element containing generation time.
+        return output.getvalue().split('\n', 2)[2]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ from robot.utils.asserts import assert_equal, assert_raises, assert_true, assert
 from robot.result.testsuite import TestSuite
 from robot.result.testcase import TestCase
 from robot.result.keyword import Keyword
-from robot.result.message import Message
+from robot.result.message import Message, Messages
 
 
 class TestSuiteStats(unittest.TestCase):
@@ -110,9 +110,141 @@ class TestSlots(unittest.TestCase):
     def test_message(self):
         self._verify(Message())
 
+    def test_messages(self):
+        self._verify(Keyword().messages)
+
     def _verify(self, item):
         assert_raises(AttributeError, setattr, item, 'attr', 'value')
 
 
+class TestMessages(unittest.TestCase):
+
+    def setUp(self):
+        self.kw = Keyword()
+
+    def test_values_are_preserved(self):
+        created = self.kw.messages.create(u'Hyv\xe4', 'WARN', True,
+                                          '20120101 10:00:00.042')
+        self.kw.messages.create('Second')
+        self._verify(self.kw.messages[0], u'Hyv\xe4', 'WARN', True,
+                     '20120101 10:00:00.042')
+        self._verify(created, u'Hyv\xe4', 'WARN', True, '20120101 10:00:00.042')
+        self._verify(self.kw.messages[-1], 'Second', 'INFO', False, None)
+        assert_equal(len(self.kw.messages), 2)
+
+    def test_parent(self):
+        self.kw.messages.create('Created')
+        self.kw.messages.append(Message('Appended'))
+        self.kw.messages = [Message('Set')]
+        for msg in self.kw.messages:
+            assert_true(msg.parent is self.kw)
+
+    def test_messages_that_cannot_be_packed(self):
+        msgs = [Message('1', 'INFO', False, 'N/A'),
+                Message('2', 'HTML', False, '20120101 10:00:00.000'),
+                Message('3', 'INFO', 'yes', '20120101 10:00:00.000'),
+                Message('4', 'INFO', False, '20120101 10:00:00.1234')]
+        self.kw.messages = msgs
+        for msg, orig in zip(self.kw.messages, msgs):
+            assert_true(msg is orig)
+        assert_equal(self.kw.messages.index(msgs[2]), 2)
+
+    def test_index_and_clear(self):
+        for text in 'abc':
+            self.kw.messages.create(text, timestamp='20120101 10:00:00.000')
+        assert_equal(self.kw.messages.index(self.kw.messages[1]), 1)
+        assert_raises(ValueError, self.kw.messages.index, Message('x'))
+        assert_raises(IndexError, self.kw.messages.__getitem__, 3)
+        self.kw.messages.clear()
+        assert_equal(list(self.kw.messages), [])
+
+    def test_modifying_created_message(self):
+        created = self.kw.messages.create('orig',
+                                          timestamp='20120101 10:00:00.000')
+        created.message = 'changed'
+        created.timestamp = 'N/A'
+        self._verify(self.kw.messages[0], 'changed', 'INFO', False, 'N/A')
+        assert_true(self.kw.messages[0] is self.kw.messages[0])
+
+    def test_modifying_message_accessed_by_index(self):
+        self.kw.messages.create('orig', timestamp='20120101 10:00:00.000')
+        self.kw.messages[0].level = 'WARN'
+        self._verify(self.kw.messages[0], 'orig', 'WARN', False,
+                     '20120101 10:00:00.000')
+
+    def test_modifying_iterated_messages(self):
+        for text in 'abc':
+            self.kw.messages.create(text)
+        for msg in self.kw.messages:
+            msg.html = True
+        assert_equal([msg.html for msg in self.kw.messages], [True] * 3)
+        msgs = list(self.kw.messages)
+        assert_equal([self.kw.messages.index(m) for m in msgs], [0, 1, 2])
+
+    def test_messages_moved_to_another_list(self):
+        for level in 'INFO', 'WARN', 'DEBUG':
+            self.kw.messages.create(level, level)
+        other = Keyword()
+        other.messages = [m for m in self.kw.messages if m.level != 'DEBUG']
+        for msg in other.messages:
+            msg.message = msg.message.lower()
+            assert_true(msg.parent is other)
+        assert_equal([m.message for m in other.messages], ['info', 'warn'])
+        assert_equal([m.message for m in self.kw.messages],
+                     ['INFO', 'WARN', 'DEBUG'])
+
+    def test_messages_are_preserved_after_clear(self):
+        self.kw.messages.create('first')
+        msgs = list(self.kw.messages)
+        self.kw.messages.clear()
+        self.kw.messages.create('second')
+        msgs[0].level = 'WARN'
+        self._verify(msgs[0], 'first', 'WARN', False, None)
+        self._verify(self.kw.messages[0], 'second', 'INFO', False, None)
+
+    def test_append_with_millis(self):
+        self.kw.messages.append_with_millis(u'Hyv\xe4', 'WARN', True,
+                                            1325412000042)
+        self.kw.messages.append_with_millis('None', 'INFO', False, None)
+        self.kw.messages.append_with_millis('Custom', 'CUSTOM', False, 0)
+        self._verify(self.kw.messages[0], u'Hyv\xe4', 'WARN', True,
+                     '20120101 10:00:00.042')
+        self._verify(self.kw.messages[1], 'None', 'INFO', False, None)
+        self._verify(self.kw.messages[2], 'Custom', 'CUSTOM', False,
+                     '19700101 00:00:00.000')
+        for msg in self.kw.messages:
+            assert_true(msg.parent is self.kw)
+
+    def test_serialize_and_restore_packed_messages(self):
+        assert_equal(self.kw.messages.serialize(), None)
+        self.kw.messages.create(u'Hyv\xe4', 'WARN', True,
+                                '20120101 10:00:00.042')
+        self.kw.messages.create('Second')
+        data = self.kw.messages.serialize()
+        assert_true(isinstance(data[0], list))
+        other = Keyword()
+        other.messages.restore(data)
+        other.messages.restore(data)
+        assert_equal(len(other.messages), 4)
+        self._verify(other.messages[2], u'Hyv\xe4', 'WARN', True,
+                     '20120101 10:00:00.042')
+        self._verify(other.messages[3], 'Second', 'INFO', False, None)
+        assert_true(other.messages[0].parent is other)
+
+    def test_serialize_and_restore_unpacked_messages(self):
+        self.kw.messages.create('Packed', timestamp='20120101 10:00:00.000')
+        self.kw.messages.append(Message('Object', 'HTML', False, 'N/A'))
+        data = self.kw.messages.serialize()
+        assert_equal(data, (('Packed', 'INFO', False, '20120101 10:00:00.000'),
+                            ('Object', 'HTML', False, 'N/A')))
+        other = Keyword()
+        other.messages.restore(data)
+        self._verify(other.messages[1], 'Object', 'HTML', False, 'N/A')
+
+    def _verify(self, msg, text, level, html, timestamp):
+        assert_equal((msg.message, msg.level, msg.html, msg.timestamp),
+                     (text, level, html, timestamp))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -24,8 +24,40 @@ class TestVariableScopes(unittest.TestCase):
         assert_equals(len(_VariableScopes(DummySuite(), None)), 2 + len(GLOBAL_VARIABLES))
         assert_equals(len(_VariableScopes(None, _VariableScopes(DummySuite(), None))), 0)
 
+    def test_test_and_keyword_scopes(self):
+        scopes = _VariableScopes(DummySuite(), None)
+        scopes.start_test(None)
+        scopes['${test}'] = 'test'
+        scopes.start_uk(None)
+        scopes['${foo}'] = 'local'
+        scopes.set_suite('${suite}', 'suite')
+        assert_equals(scopes['${foo}'], 'local')
+        assert_equals(scopes['${test}'], 'test')
+        scopes.end_uk()
+        assert_equals(scopes['${foo}'], 'bar')
+        assert_equals(scopes['${suite}'], 'suite')
+        scopes.end_test()
+        assert_equals(scopes.contains('${test}'), False)
+        assert_equals(scopes['${suite}'], 'suite')
+
+    def test_suite_scope_uses_global_variables_without_copying(self):
+        GLOBAL_VARIABLES['${foo}'] = 'global'
+        GLOBAL_VARIABLES['${PREV_TEST_NAME}'] = 'Previous'
+        try:
+            scopes = _VariableScopes(DummySuite(), None)
+            assert_equals(scopes['${foo}'], 'global')
+            assert_equals(len(scopes._suite._keys), 2)
+            GLOBAL_VARIABLES['${later}'] = 'value'
+            GLOBAL_VARIABLES['${PREV_TEST_NAME}'] = 'Test in child suite'
+            assert_equals(scopes['${later}'], 'value')
+            assert_equals(scopes['${PREV_TEST_NAME}'], 'Previous')
+        finally:
+            for name in '${foo}', '${later}', '${PREV_TEST_NAME}':
+                GLOBAL_VARIABLES.pop(name)
+
 
 class DummySuite(object):
 
     def __init__(self):
-        self.variables = {'foo': 'bar', 'quuz': 'blaah'}
+        self.variables = GLOBAL_VARIABLES.new_scope()
+        self.variables.update({'${foo}': 'bar', '${quuz}': 'blaah'})
@@ -0,0 +1,248 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from robot.output import LOGGER
+from robot.result.executionresult import Result
+from robot.result.testsuite import TestSuite
+from robot.running.parallel import (UnitSplitter, ExecutionUnit, SuiteMerger,
+                                    ParallelRunner, select_execution_unit)
+from robot.utils.asserts import assert_equals, assert_true, assert_false
+
+LOGGER.disable_automatic_console_logger()
+
+
+def create_suite():
+    root = TestSuite(name='Root')
+    sub = root.suites.create(name='Sub.Suite')
+    sub.tests.create(name='T1')
+    sub.tests.create(name='T2')
+    sub.suites.create(name='Empty')
+    root.suites.create(name='Other').tests.create(name='T3')
+    return root
+
+
+class TestUnitSplitter(unittest.TestCase):
+
+    def test_suite_level(self):
+        units = UnitSplitter().split(create_suite())
+        assert_equals([u.selectors for u in units],
+                      [('Root.Sub?Suite', None), ('Root.Other', None)])
+
+    def test_test_level(self):
+        units = UnitSplitter(test_level=True).split(create_suite())
+        assert_equals([u.selectors for u in units],
+                      [('Root.Sub?Suite', 'T1'), ('Root.Sub?Suite', 'T2'),
+                       ('Root.Other', 'T3')])
+
+    def test_root_with_tests(self):
+        root = TestSuite(name='Root')
+        root.tests.create(name='T')
+        assert_equals([u.selectors for u in UnitSplitter().split(root)],
+                      [('Root', None)])
+
+
+class Fixture(object):
+
+    def __init__(self, name=''):
+        self.name = name
+
+
+class Suite(object):
+
+    def __init__(self, name, tests=0, suites=(), setup=''):
+        self.name = self.longname = name
+        self.tests = ['T%d' % i for i in range(tests)]
+        self.suites = list(suites)
+        self.setup = Fixture(setup)
+        self.teardown = Fixture()
+
+
+class TestSharedFixtures(unittest.TestCase):
+
+    def test_suites_with_fixtures_and_many_units(self):
+        root = Suite('Root', setup='KW', suites=[
+            Suite('One unit', tests=2, setup='KW'),
+            Suite('Two units', setup='KW',
+                  suites=[Suite('A', tests=1), Suite('B', tests=1)]),
+            Suite('No fixture', suites=[Suite('C', 1), Suite('D', 1)])])
+        assert_equals(UnitSplitter().shared_fixtures(root),
+                      ['Root', 'Two units'])
+        assert_equals(UnitSplitter(test_level=True).shared_fixtures(root),
+                      ['Root', 'One unit', 'Two units'])
+
+    def test_no_shared_fixtures(self):
+        root = Suite('Root', tests=3, setup='KW')
+        assert_equals(UnitSplitter().shared_fixtures(root), [])
+
+
+class TestSelectingUnit(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.mkdtemp()
+        self._unitfile = os.path.join(self._tempdir, 'unit.pickle')
+
+    def tearDown(self):
+        shutil.rmtree(self._tempdir)
+        os.environ.pop('ROBOT_PARALLEL_UNIT_FILE', None)
+
+    def test_test_names_are_matched_exactly(self):
+        for unit in UnitSplitter(test_level=True).split(self._suite()):
+            suite = self._select(unit, self._suite)
+            assert_equals([s.name for s in suite.suites], [unit.names[-1]])
+            assert_equals([t.name for t in suite.suites[0].tests],
+                          [unit.selectors[1]])
+
+    def test_suite_names_are_matched_exactly(self):
+        for unit in UnitSplitter().split(self._suite()):
+            suite = self._select(unit, self._suite)
+            assert_equals([s.name for s in suite.suites], [unit.names[-1]])
+            assert_equals(len(suite.suites[0].tests), 5)
+
+    def test_child_suites_are_not_selected(self):
+        def create():
+            root = create_suite()
+            root.tests.create(name='Root test')
+            return root
+        suite = self._select(UnitSplitter().split(create())[0], create)
+        assert_equals([t.name for t in suite.tests], ['Root test'])
+        assert_equals(list(suite.suites), [])
+
+    def test_nothing_selected_without_unit_file(self):
+        suite = create_suite()
+        select_execution_unit(suite)
+        assert_equals(len(suite.suites), 2)
+
+    def test_unit_file_is_used_only_once(self):
+        self._select(UnitSplitter().split(create_suite())[0], create_suite)
+        assert_false('ROBOT_PARALLEL_UNIT_FILE' in os.environ)
+
+    def _suite(self):
+        root = TestSuite(name='Root')
+        for name in 'S*', 'S?', 'Sx', 's_x':
+            suite = root.suites.create(name=name)
+            for test in 'Test *', 'Test ?', 'Test [a]', 'test_a', 'Test A':
+                suite.tests.create(name=test)
+        return root
+
+    def _select(self, unit, create_root):
+        suite = create_root()
+        unit._write_unit_file(self._unitfile)
+        os.environ['ROBOT_PARALLEL_UNIT_FILE'] = self._unitfile
+        select_execution_unit(suite)
+        return suite
+
+
+class TestFailedUnits(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.mkdtemp()
+        self._runner = ParallelRunner({'Processes': 2, 'TestLevelSplit': False,
+                                       'StdOut': None})
+        self._units = UnitSplitter().split(create_suite())
+
+    def tearDown(self):
+        shutil.rmtree(self._tempdir)
+
+    def test_valid_outputs(self):
+        for unit in self._units:
+            self._create_output(unit, rc=0)
+        result = self._merge()
+        self._verify_tests(result, 'PASS', 'PASS', 'PASS')
+        assert_equals(list(result.errors), [])
+        assert_equals(self._runner.return_code(result), 0)
+
+    def test_crashed_process_with_truncated_output(self):
+        self._create_output(self._units[0], rc=3)
+        open(self._units[0].output, 'w').write('<robot><suite name="Root">')
+        self._create_output(self._units[1], rc=0)
+        result = self._merge()
+        self._verify_tests(result, 'FAIL', 'FAIL', 'PASS')
+        message = ("Executing suite 'Root.Sub?Suite' in a separate process "
+                   "failed with return code 3.")
+        assert_equals(result.suite.suites[0].tests[0].message, message)
+        assert_true(result.errors.messages[0].message.startswith(message))
+        assert_equals(self._runner.return_code(result), 2)
+
+    def test_missing_output(self):
+        self._create_output(self._units[0], rc=0)
+        self._create_output(self._units[1], rc=255)
+        os.remove(self._units[1].output)
+        result = self._merge()
+        self._verify_tests(result, 'PASS', 'PASS', 'FAIL')
+        assert_equals(len(result.errors), 1)
+
+    def test_valid_output_with_error_return_code(self):
+        for unit in self._units:
+            self._create_output(unit, rc=255)
+        result = self._merge()
+        self._verify_tests(result, 'PASS', 'PASS', 'PASS')
+        assert_equals(len(result.errors), 2)
+        assert_equals(self._runner.return_code(result), 1)
+
+    def test_units_not_started_are_ignored(self):
+        self._create_output(self._units[1], rc=0)
+        self._verify_tests(self._merge(), 'PASS')
+
+    def _create_output(self, unit, rc):
+        root = suite = TestSuite(name=unit.names[0])
+        for name in unit.names[1:]:
+            suite = suite.suites.create(name=name)
+        for test in unit.tests:
+            suite.tests.create(name=test.name, status='PASS')
+        unit.output = os.path.join(self._tempdir, '%s.xml' % id(unit))
+        unit.rc = rc
+        Result(root_suite=root).save(unit.output)
+
+    def _merge(self):
+        return self._runner._merge(self._runner._get_results(self._units))
+
+    def _verify_tests(self, result, *statuses):
+        tests = [test for suite in result.suite.suites for test in suite.tests]
+        assert_equals([t.status for t in tests], list(statuses))
+
+
+class TestArgumentLines(unittest.TestCase):
+
+    def test_options_and_data_sources(self):
+        options = {'include': ['a', 'b c'], 'dryrun': True, 'name': 'X',
+                   'exclude': [], 'doc': None, 'nostatusrc': False}
+        lines = ExecutionUnit(['S'])._get_argument_lines(options, ['t1', 't2'])
+        assert_equals(list(lines), ['--dryrun', '--include a', '--include b c',
+                                    '--name X', 't1', 't2'])
+
+
+class TestSuiteMerger(unittest.TestCase):
+
+    def test_tests_and_suites_are_merged(self):
+        target, source = create_suite(), create_suite()
+        source.suites.create(name='New')
+        SuiteMerger().merge(target, source)
+        assert_equals([s.name for s in target.suites],
+                      ['Sub.Suite', 'Other', 'New'])
+        assert_equals([t.name for t in target.suites[0].tests],
+                      ['T1', 'T2', 'T1', 'T2'])
+        assert_true(target.suites[2].parent is target)
+
+    def test_times(self):
+        target = TestSuite(starttime='20120101 10:00:00.000',
+                           endtime='20120101 10:00:01.000')
+        source = TestSuite(starttime='20120101 09:59:59.000',
+                           endtime='20120101 10:00:05.000')
+        SuiteMerger().merge(target, source)
+        assert_equals(target.starttime, '20120101 09:59:59.000')
+        assert_equals(target.endtime, '20120101 10:00:05.000')
+
+    def test_failed_fixtures_are_preferred(self):
+        target, source = TestSuite(), TestSuite()
+        target.keywords.create(type='setup', status='PASS')
+        source.keywords.create(type='setup', status='FAIL')
+        source.keywords.create(type='teardown', status='PASS')
+        SuiteMerger().merge(target, source)
+        assert_equals(target.keywords.setup.status, 'FAIL')
+        assert_equals(target.keywords.teardown.status, 'PASS')
+
+
+if __name__ == '__main__':
+    unittest.main()
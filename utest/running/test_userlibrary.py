@@ -111,5 +111,35 @@ class TestUserLibrary(unittest.TestCase):
         assert_equals(lib.embedded_arg_handlers[0].name, 'Embedded ${arg}')
 
 
+class TemplateStub(object):
+
+    def __init__(self, name):
+        self.name = name
+
+
+class TestEmbeddedArgsIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.templates = [TemplateStub(name) for name in
+                          ['User ${x} logs in', '${x} is valid', 'Add ${x}',
+                           'user ${x} logs out', '\\${x} and ${y}']]
+        self.index = userkeyword.EmbeddedArgsIndex(self.templates)
+
+    def test_candidates_start_with_same_letter_case_insensitively(self):
+        self._verify_candidates('user john logs in', 0, 1, 3)
+        self._verify_candidates('Add item', 1, 2)
+
+    def test_templates_starting_with_argument_are_always_candidates(self):
+        self._verify_candidates('Xyz is valid', 1)
+        self._verify_candidates('', 1)
+
+    def test_escaped_variable_is_part_of_prefix(self):
+        self._verify_candidates('\\${x} and 2', 1, 4)
+
+    def _verify_candidates(self, name, *indices):
+        assert_equals(self.index.get_candidates(name),
+                      [self.templates[i] for i in indices])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,8 @@
+import base64
 import unittest
 import zlib
 
-from robot.utils.compress import _compress
+from robot.utils.compress import _compress, compress_text, decompress_text
 from robot.utils.asserts import assert_equals
 
 
@@ -21,3 +22,21 @@ class TestCompress(unittest.TestCase):
     def test_non_ascii(self):
         self._test(u'hyv\xe4')
         self._test(u'\u4e2d\u6587')
+
+
+class TestCompressText(unittest.TestCase):
+    text = u'Hyv\xe4\xe4 p\xe4iv\xe4\xe4! ' * 10
+
+    def test_round_trip(self):
+        for level in range(10):
+            assert_equals(decompress_text(compress_text(self.text, level)),
+                          self.text)
+
+    def test_header_is_same_regardless_level(self):
+        for level in range(10):
+            compressed = base64.b64decode(compress_text(self.text, level))
+            assert_equals(compressed[:2], '\x78\xda')
+
+    def test_default_level_is_highest(self):
+        assert_equals(compress_text(self.text),
+                      base64.b64encode(zlib.compress(self.text.encode('UTF-8'), 9)))
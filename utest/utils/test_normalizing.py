@@ -1,3 +1,4 @@
+import copy
 import unittest
 
 from robot.utils import normalize, normalize_tags, NormalizedDict
@@ -165,6 +166,41 @@ class TestNormalizedDict(unittest.TestCase):
         assert_equals(cd._keys, {'a': 'a', 'b': 'B'})
         assert_equals(cd.data, {'a': 1, 'b': 2})
 
+    def test_copy_module(self):
+        nd = NormalizedDict({'a': 1})
+        cd = copy.copy(nd)
+        cd['B'] = 2
+        assert_equals(cd.keys(), ['a', 'B'])
+        assert_equals(nd.keys(), ['a'])
+
+    def test_values_are_stored_using_original_keys(self):
+        nd = NormalizedDict({'Foo Bar': 1})
+        nd['foobar'] = 2
+        assert_true(isinstance(nd, dict))
+        assert_equals(dict(nd), {'Foo Bar': 2})
+
+    def test_normalizing_is_cached_per_spec(self):
+        assert_true(NormalizedDict(ignore=['_'])._normalize.im_self is
+                    NormalizedDict(ignore=('_',))._normalize.im_self)
+        assert_true(NormalizedDict()._normalize.im_self is not
+                    NormalizedDict(caseless=False)._normalize.im_self)
+
+    def test_setdefault(self):
+        nd = NormalizedDict({'a': 1})
+        assert_equals(nd.setdefault('A', 2), 1)
+        assert_equals(nd.setdefault('B', 2), 2)
+        assert_equals(nd.items(), [('a', 1), ('B', 2)])
+
+    def test_popitem(self):
+        nd = NormalizedDict({'A': 1})
+        assert_equals(nd.popitem(), ('A', 1))
+        assert_equals(nd._keys, {})
+
+    def test_equality(self):
+        assert_equals(NormalizedDict({'a': 1}), NormalizedDict({'A': 1}))
+        assert_equals(NormalizedDict({'a': 1}), {'A': 1})
+        assert_true(NormalizedDict({'a': 1}) != {'a': 2})
+
     def test_str(self):
         nd = NormalizedDict({'a': 1, 'B': 1})
         assert_true(str(nd) in ("{'a': 1, 'B': 1}", "{'B': 1, 'a': 1}"))
@@ -309,5 +309,57 @@ class TestVariables(unittest.TestCase):
             assert_equals(self.varz.replace_list(['${obj.name}']), ['my name'])
 
 
+class TestVariableScopes(unittest.TestCase):
+
+    def setUp(self):
+        self.parent = variables.Variables()
+        self.parent['${foo}'] = 'parent'
+        self.parent['@{list}'] = ['a', 'b']
+        self.scope = self.parent.new_scope()
+
+    def test_lookups_fall_back_to_parent(self):
+        assert_equals(self.scope['${FOO}'], 'parent')
+        assert_equals(self.scope['${list}'], ['a', 'b'])
+        assert_equals(self.scope.replace_string('${foo}-@{list}[1]'),
+                      'parent-b')
+        assert_true(self.scope.contains('@{list}'))
+
+    def test_setting_only_affects_scope(self):
+        self.scope['${f_o_o}'] = 'scope'
+        self.scope['${new}'] = 'new'
+        assert_equals(self.scope['${foo}'], 'scope')
+        assert_equals(self.parent['${foo}'], 'parent')
+        assert_false(self.parent.contains('${new}'))
+
+    def test_changes_to_parent_are_visible(self):
+        self.parent['${bar}'] = 'new'
+        assert_equals(self.scope['${bar}'], 'new')
+
+    def test_keys_and_len(self):
+        self.scope['${FOO}'] = 'scope'
+        self.scope['${new}'] = 'new'
+        assert_equals(self.scope.keys(), ['${foo}', '${new}', '@{list}'])
+        assert_equals(self.scope.items()[0], ('${foo}', 'scope'))
+        assert_equals(len(self.scope), 3)
+
+    def test_copy_is_flat_and_independent(self):
+        self.scope['${new}'] = 'new'
+        copy = self.scope.copy()
+        self.parent['${foo}'] = 'changed'
+        assert_equals(copy['${foo}'], 'parent')
+        assert_equals(copy['${new}'], 'new')
+        assert_equals(len(copy), 3)
+
+    def test_rebase(self):
+        self.scope['${foo}'] = 'scope'
+        self.scope['${own}'] = 'own'
+        base = variables.Variables()
+        base['${FOO}'] = 'base'
+        self.scope.rebase(base)
+        assert_equals(self.scope['${foo}'], 'base')
+        assert_equals(self.scope['${own}'], 'own')
+        assert_false(self.scope.contains('@{list}'))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from robot.variables.variabletemplate import VariableTemplate, get_template
+from robot.utils.asserts import assert_equals, assert_none, assert_true
+
+
+class TestVariableTemplate(unittest.TestCase):
+    _identifiers = ('$', '@', '%', '&', '*')
+
+    def test_no_variables(self):
+        template = VariableTemplate('No vars \\${here}', self._identifiers)
+        assert_equals(template.parts, [])
+        assert_equals(template.tail, 'No vars ${here}')
+        assert_none(template.variable)
+
+    def test_single_variable(self):
+        template = VariableTemplate('@{list}[1]', self._identifiers)
+        assert_equals(template.variable.identifier, '@')
+        assert_equals(template.variable.index, '1')
+        assert_equals(self._parts(template), [('', '@{list}[1]')])
+        assert_equals(template.tail, '')
+
+    def test_multiple_variables(self):
+        template = VariableTemplate('a\\\\${x} b ${y${z}} \\n', self._identifiers)
+        assert_none(template.variable)
+        assert_equals(self._parts(template),
+                      [('a\\', '${x}'), (' b ', '${y${z}}')])
+        assert_equals(template.tail, ' \n')
+
+    def test_templates_are_cached(self):
+        template = get_template('${x} and ${y}', self._identifiers)
+        assert_true(get_template('${x} and ${y}', list(self._identifiers))
+                    is template)
+        assert_true(get_template('${x} and ${y}', ('$',)) is not template)
+
+    def _parts(self, template):
+        return [(literal, raw) for literal, var, raw in template.parts]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -35,6 +35,15 @@ describe("Text decoder", function () {
         var actual = strings.get(1);
         expect(actual).toEqual("plain text");
     });
+
+    it("should uncompress strings from blocks", function () {
+        var stringArray = ["*", "#3:1", "#3:0",
+                           "eNorzk3MySmmLcGQk1iUnkpjAgDnwVLR"];
+        var strings = window.testdata.getStringStore(stringArray);
+        expect(strings.get(1)).toEqual(multiplyString("large", 20));
+        expect(strings.get(2)).toEqual(multiplyString("small", 20));
+        expect(stringArray[1]).toEqual("*"+multiplyString("large", 20));
+    });
 });
 
 function subSuite(index, suite) {